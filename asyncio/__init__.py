@@ -20,11 +20,13 @@ if sys.platform == 'win32':
 # This relies on each of the submodules having an __all__ variable.
 from .futures import *
 from .events import *
+from .instrumentation import *
 from .locks import *
 from .transports import *
 from .protocols import *
 from .streams import *
 from .tasks import *
+from .timers import *
 
 if sys.platform == 'win32':  # pragma: no cover
     from .windows_events import *
@@ -34,8 +36,10 @@ else:
 
 __all__ = (futures.__all__ +
            events.__all__ +
+           instrumentation.__all__ +
            locks.__all__ +
            transports.__all__ +
            protocols.__all__ +
            streams.__all__ +
-           tasks.__all__)
+           tasks.__all__ +
+           timers.__all__)
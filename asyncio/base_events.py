@@ -16,8 +16,6 @@ to modify the meaning of the API call itself.
 
 import collections
 import concurrent.futures
-import heapq
-import logging
 import socket
 import subprocess
 import time
@@ -27,6 +25,7 @@ import sys
 from . import events
 from . import futures
 from . import tasks
+from . import timers
 from .log import logger
 
 
@@ -45,6 +44,14 @@ def _raise_stop_error(*args):
     raise _StopError
 
 
+def _run_callback(callback, args):
+    """Runs callback queued without a Handle by _call_soon_nohandle()."""
+    try:
+        callback(*args)
+    except Exception:
+        logger.exception('Exception in callback %s %r', callback, args)
+
+
 class Server(events.AbstractServer):
 
     def __init__(self, loop, sockets):
@@ -92,10 +99,14 @@ class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
         self._ready = collections.deque()
-        self._scheduled = []
+        self._scheduled = timers.HeapScheduler()
         self._default_executor = None
         self._internal_fds = 0
         self._running = False
+        self._instrumentation = None
+        self._task_profiler = None
+        # Tasks resumed by done callbacks in this iteration, see Task
+        self._inline_wakeups = 0
 
     def _make_socket_transport(self, sock, protocol, waiter=None, *,
                                extra=None, server=None):
@@ -202,6 +213,83 @@ class BaseEventLoop(events.AbstractEventLoop):
         """Returns running status of event loop."""
         return self._running
 
+    def get_timer_scheduler(self):
+        """Return the scheduler of timed callbacks."""
+        return self._scheduled
+
+    def set_timer_scheduler(self, scheduler):
+        """Replace the scheduler of timed callbacks.
+
+        The scheduler is an instance of timers.HeapScheduler (the default)
+        or timers.TimingWheelScheduler.  Timers scheduled so far are moved
+        to the new scheduler.
+        """
+        scheduler.start(self.time())
+        pending = self._scheduled.timers()
+        self._scheduled.clear()
+        for timer in pending:
+            if not timer._cancelled:
+                scheduler.push(timer)
+        self._scheduled = scheduler
+
+    def get_timer_stats(self):
+        """Return numbers of live and cancelled timers.
+
+        Cancelled timers are kept by the scheduler until they expire or
+        until they make up too large fraction of all timers, in which
+        case they are purged.
+        """
+        return self._scheduled.stats()
+
+    def set_instrumentation(self, instrumentation):
+        """Attach instrumentation.LoopInstrumentation to the loop, or
+        detach it when None is passed.
+
+        Loop iterations are not measured at all while no instrumentation
+        is attached.
+        """
+        self._instrumentation = instrumentation
+
+    def get_instrumentation(self):
+        """Return the instrumentation attached to the loop, or None."""
+        return self._instrumentation
+
+    def set_task_profiler(self, profiler):
+        """Attach instrumentation.TaskProfiler to the loop, or detach it
+        when None is passed.
+
+        Only tasks created while the profiler is attached are profiled.
+        """
+        self._task_profiler = profiler
+
+    def get_task_profiler(self):
+        """Return the task profiler attached to the loop, or None."""
+        return self._task_profiler
+
+    def task_report(self, top=10):
+        """Return statistics of tasks of the ``top`` coroutines which
+        took the most time to run, see TaskProfiler.report()."""
+        if self._task_profiler is None:
+            raise RuntimeError('No task profiler is attached to the loop')
+        return self._task_profiler.report(top)
+
+    def get_stats(self):
+        """Return dict of loop statistics.
+
+        Always includes the size of the ready queue and the timer
+        statistics, and everything collected by the instrumentation
+        when it is attached.
+        """
+        stats = {'ready': len(self._ready)}
+        stats.update(self.get_timer_stats())
+        if self._instrumentation is not None:
+            stats.update(self._instrumentation.stats())
+        return stats
+
+    def _timer_handle_cancelled(self, handle):
+        """Notification that a scheduled TimerHandle was cancelled."""
+        self._scheduled.timer_cancelled(handle)
+
     def time(self):
         """Return the time according to the event loop's clock."""
         return time.monotonic()
@@ -226,8 +314,8 @@ class BaseEventLoop(events.AbstractEventLoop):
 
     def call_at(self, when, callback, *args):
         """Like call_later(), but uses an absolute time."""
-        timer = events.TimerHandle(when, callback, args)
-        heapq.heappush(self._scheduled, timer)
+        timer = events.TimerHandle(when, callback, args, self)
+        self._scheduled.push(timer)
         return timer
 
     def call_soon(self, callback, *args):
@@ -240,10 +328,19 @@ class BaseEventLoop(events.AbstractEventLoop):
         Any positional arguments after the callback will be passed to
         the callback when it is called.
         """
-        handle = events.make_handle(callback, args)
+        handle = events.Handle(callback, args)
         self._ready.append(handle)
         return handle
 
+    def _call_soon_nohandle(self, callback, *args):
+        """Like call_soon(), but returns no Handle to cancel the call.
+
+        Used by the loop internals for callbacks that are never cancelled,
+        such as callbacks of futures.  The ready queue then holds plain
+        (callback, args) tuple instead of a Handle.
+        """
+        self._ready.append((callback, args))
+
     def call_soon_threadsafe(self, callback, *args):
         """XXX"""
         handle = self.call_soon(callback, *args)
@@ -577,7 +674,8 @@ class BaseEventLoop(events.AbstractEventLoop):
         if handle._cancelled:
             return
         if isinstance(handle, events.TimerHandle):
-            heapq.heappush(self._scheduled, handle)
+            handle._loop = self
+            self._scheduled.push(handle)
         else:
             self._ready.append(handle)
 
@@ -593,42 +691,27 @@ class BaseEventLoop(events.AbstractEventLoop):
         schedules the resulting callbacks, and finally schedules
         'call_later' callbacks.
         """
-        # Remove delayed calls that were cancelled from head of queue.
-        while self._scheduled and self._scheduled[0]._cancelled:
-            heapq.heappop(self._scheduled)
-
+        self._inline_wakeups = 0
         timeout = None
         if self._ready:
             timeout = 0
-        elif self._scheduled:
+        else:
             # Compute the desired timeout.
-            when = self._scheduled[0]._when
-            deadline = max(0, when - self.time())
-            if timeout is None:
-                timeout = deadline
-            else:
-                timeout = min(timeout, deadline)
-
-        # TODO: Instrumentation only in debug mode?
-        t0 = self.time()
-        event_list = self._selector.select(timeout)
-        t1 = self.time()
-        argstr = '' if timeout is None else '{:.3f}'.format(timeout)
-        if t1-t0 >= 1:
-            level = logging.INFO
+            when = self._scheduled.next_deadline()
+            if when is not None:
+                timeout = max(0, when - self.time())
+
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            event_list = self._selector.select(timeout)
         else:
-            level = logging.DEBUG
-        logger.log(level, 'poll%s took %.3f seconds', argstr, t1-t0)
+            t0 = self.time()
+            event_list = self._selector.select(timeout)
+            instrumentation.poll_finished(timeout, self.time() - t0)
         self._process_events(event_list)
 
         # Handle 'later' callbacks that are ready.
-        now = self.time()
-        while self._scheduled:
-            handle = self._scheduled[0]
-            if handle._when > now:
-                break
-            handle = heapq.heappop(self._scheduled)
-            self._ready.append(handle)
+        self._scheduled.pop_expired(self.time(), self._ready)
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -637,8 +720,37 @@ class BaseEventLoop(events.AbstractEventLoop):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is threadsafe without using locks.
         ntodo = len(self._ready)
+        if instrumentation is not None:
+            self._run_ready_instrumented(ntodo, instrumentation)
+            return
         for i in range(ntodo):
             handle = self._ready.popleft()
-            if not handle._cancelled:
+            if handle.__class__ is tuple:
+                _run_callback(*handle)
+            elif not handle._cancelled:
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
+
+    def _run_ready_instrumented(self, ntodo, instrumentation):
+        """Like the end of _run_once(), but also measures callbacks."""
+        instrumentation.iteration_started(ntodo, len(self._scheduled))
+        threshold = instrumentation.slow_callback_duration
+        ncalled = 0
+        try:
+            for i in range(ntodo):
+                handle = self._ready.popleft()
+                t0 = self.time()
+                if handle.__class__ is tuple:
+                    _run_callback(*handle)
+                elif not handle._cancelled:
+                    handle._run()
+                else:
+                    continue
+                ncalled += 1
+                duration = self.time() - t0
+                if duration >= threshold:
+                    instrumentation.slow_callback(handle, duration)
+        finally:
+            # Loop is stopped by an exception raised from a callback
+            handle = None  # Needed to break cycles when an exception occurs.
+            instrumentation.iteration_finished(ncalled)
@@ -19,6 +19,8 @@ from .log import logger
 class Handle:
     """Object returned by callback registration methods."""
 
+    __slots__ = ('_callback', '_args', '_cancelled', '__weakref__')
+
     def __init__(self, callback, args):
         self._callback = callback
         self._args = args
@@ -51,11 +53,15 @@ def make_handle(callback, args):
 class TimerHandle(Handle):
     """Object returned by timed callback registration methods."""
 
-    def __init__(self, when, callback, args):
+    __slots__ = ('_when', '_loop', '_scheduled')
+
+    def __init__(self, when, callback, args, loop=None):
         assert when is not None
         super().__init__(callback, args)
 
         self._when = when
+        self._loop = loop
+        self._scheduled = False
 
     def __repr__(self):
         res = 'TimerHandle({}, {}, {})'.format(self._when,
@@ -66,6 +72,12 @@ class TimerHandle(Handle):
 
         return res
 
+    def cancel(self):
+        if not self._cancelled:
+            super().cancel()
+            if self._scheduled and self._loop is not None:
+                self._loop._timer_handle_cancelled(self)
+
     def __hash__(self):
         return hash(self._when)
 
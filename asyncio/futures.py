@@ -8,6 +8,9 @@ __all__ = ['CancelledError', 'TimeoutError',
 import concurrent.futures.cooperative
 import concurrent.futures.multithreaded
 import concurrent.futures.exceptions
+from concurrent.futures.cooperative.future_base import (_PENDING,
+                                                         _CANCELLED,
+                                                         _FINISHED)
 import logging
 
 from . import events
@@ -22,7 +25,9 @@ STACK_DEBUG = logging.DEBUG - 1  # heavy-duty debugging
 
 
 def loop_as_executor(loop):
-    return loop.call_soon
+    # Future callbacks are never cancelled, so loops that support it
+    # get them queued without allocating a Handle.
+    return getattr(loop, '_call_soon_nohandle', loop.call_soon)
 
 
 def loop_as_executor_threadsafe(loop):
@@ -30,10 +35,14 @@ def loop_as_executor_threadsafe(loop):
 
 
 class Future(concurrent.futures.cooperative.Future):
-    _blocking = False  # proper use of future (yield vs yield from)
+    __slots__ = ('_loop', '_blocking')
+
+    # Futures are bound to event loop
+    _share_completed = False
 
     def __init__(self, *, loop=None):
         self._loop = loop or events.get_event_loop()
+        self._blocking = False  # proper use of future (yield vs yield from)
         super().__init__(clb_executor=loop_as_executor(self._loop))
 
     def __iter__(self):
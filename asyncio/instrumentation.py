@@ -0,0 +1,224 @@
+"""Instrumentation of event loop iterations and tasks.
+
+An instrumentation object is attached to the loop with
+BaseEventLoop.set_instrumentation(), and a task profiler with
+BaseEventLoop.set_task_profiler().  While none is attached, the loop
+and its tasks do no measurements at all.
+"""
+
+__all__ = ['LoopInstrumentation', 'TaskProfiler', 'TaskProfile']
+
+import bisect
+import collections
+import time
+import weakref
+
+from .log import logger
+
+
+# Upper bounds (in seconds) of poll duration histogram buckets, the last
+# bucket counts polls that took longer than the last bound.
+POLL_HISTOGRAM_BOUNDS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+
+# Number of most recent slow callbacks kept for get_stats()
+SLOW_CALLBACKS_KEPT = 100
+
+
+class LoopInstrumentation:
+    """Collects statistics of event loop iterations.
+
+    Keeps a histogram of poll durations, number of callbacks run per
+    iteration, depth of the ready queue and number of scheduled timers.
+    Callbacks running longer than ``slow_callback_duration`` seconds are
+    logged with a warning and remembered.
+
+    Subclasses may override the hooks called by the loop to collect
+    something else or to export measurements elsewhere.
+    """
+
+    def __init__(self, slow_callback_duration=0.1):
+        self.slow_callback_duration = slow_callback_duration
+        self._poll_histogram = [0] * (len(POLL_HISTOGRAM_BOUNDS) + 1)
+        self._iterations = 0
+        self._callbacks = 0
+        self._max_callbacks = 0
+        self._ready_depth = 0
+        self._max_ready_depth = 0
+        self._timers = 0
+        self._max_timers = 0
+        self._slow_callbacks = collections.deque(maxlen=SLOW_CALLBACKS_KEPT)
+
+    def poll_finished(self, timeout, duration):
+        """Called after polling for I/O events."""
+        self._poll_histogram[bisect.bisect_left(POLL_HISTOGRAM_BOUNDS,
+                                                duration)] += 1
+
+    def iteration_started(self, ready_depth, timers):
+        """Called before running ready callbacks with the size of the
+        ready queue and number of scheduled timers."""
+        self._iterations += 1
+        self._ready_depth = ready_depth
+        self._max_ready_depth = max(self._max_ready_depth, ready_depth)
+        self._timers = timers
+        self._max_timers = max(self._max_timers, timers)
+
+    def iteration_finished(self, callbacks):
+        """Called with number of callbacks run during the iteration."""
+        self._callbacks += callbacks
+        self._max_callbacks = max(self._max_callbacks, callbacks)
+
+    def slow_callback(self, callback, duration):
+        """Called when running a callback took longer than
+        ``slow_callback_duration``.
+
+        ``callback`` is a Handle or a (callback, args) tuple.
+        """
+        description = repr(callback)
+        self._slow_callbacks.append((description, duration))
+        logger.warning('Executing %s took %.3f seconds',
+                       description, duration)
+
+    def stats(self):
+        """Returns collected statistics as a dict."""
+        bounds = POLL_HISTOGRAM_BOUNDS + (float('inf'),)
+        iterations = self._iterations
+        return {
+            'iterations': iterations,
+            'poll_histogram': collections.OrderedDict(
+                zip(bounds, self._poll_histogram)),
+            'callbacks': self._callbacks,
+            'callbacks_per_iteration': (self._callbacks / iterations
+                                        if iterations else 0.0),
+            'max_callbacks_per_iteration': self._max_callbacks,
+            'ready_depth': self._ready_depth,
+            'max_ready_depth': self._max_ready_depth,
+            'timers': self._timers,
+            'max_timers': self._max_timers,
+            'slow_callbacks': list(self._slow_callbacks),
+        }
+
+
+class TaskProfile:
+    """Accounting of a single profiled task.
+
+    ``steps`` is the number of times the coroutine was resumed by the
+    loop, ``run_time`` is the time spent running the coroutine,
+    ``ready_time`` is the time the task spent scheduled in the ready
+    queue and ``wait_time`` is the time it spent waiting for futures.
+    Times are in seconds.
+    """
+
+    __slots__ = ('name', 'steps', 'run_time', 'ready_time', 'wait_time',
+                 '_profiler', '_scheduled_at', '_waiting_since',
+                 '__weakref__')
+
+    def __init__(self, name, profiler):
+        self.name = name
+        self.steps = 0
+        self.run_time = 0.0
+        self.ready_time = 0.0
+        self.wait_time = 0.0
+        self._profiler = profiler
+        self._scheduled_at = None
+        self._waiting_since = None
+
+    def scheduled(self):
+        """Called when the next step of the task is scheduled."""
+        self._scheduled_at = self._profiler.clock()
+
+    def step_started(self):
+        """Called before the task runs, returns the current time."""
+        now = self._profiler.clock()
+        if self._scheduled_at is not None:
+            self.ready_time += now - self._scheduled_at
+            self._scheduled_at = None
+        return now
+
+    def step_finished(self, started, done):
+        """Called after the task ran since the time ``started``."""
+        self.steps += 1
+        now = self._profiler.clock()
+        self.run_time += now - started
+        if done:
+            self._profiler._task_finished(self)
+        else:
+            self._waiting_since = now
+
+    def waiter_done(self, future):
+        """Called right when the future the task waits for is done."""
+        now = self._profiler.clock()
+        if self._waiting_since is not None:
+            self.wait_time += now - self._waiting_since
+            self._waiting_since = None
+        # The wakeup of the task is now in the ready queue
+        self._scheduled_at = now
+
+
+class TaskProfiler:
+    """Collects per-task accounting and aggregates it by coroutine.
+
+    Only ``sample_rate`` fraction of created tasks is profiled, which
+    bounds the overhead of profiling to that fraction of the overhead of
+    profiling every task.  Tasks are picked evenly, not at random, so
+    the report is reproducible.  Tasks destroyed before they are done
+    are not included in the report.
+    """
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, sample_rate=1.0):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('sample_rate should be between 0 and 1')
+        self.sample_rate = sample_rate
+        self._credit = 0.0
+        self._live = weakref.WeakSet()
+        self._finished = {}
+
+    def profile(self, task, name):
+        """Called when a task of coroutine ``name`` is created, returns
+        its TaskProfile or None if the task is not sampled."""
+        self._credit += self.sample_rate
+        if self._credit < 1:
+            return None
+        self._credit -= 1
+        profile = TaskProfile(name, self)
+        self._live.add(profile)
+        return profile
+
+    def report(self, top=10):
+        """Returns list of dicts with the totals per coroutine, ordered
+        by the time spent running it, of the ``top`` coroutines."""
+        totals = dict((name, list(entry))
+                      for name, entry in self._finished.items())
+        for profile in list(self._live):
+            self._add(totals, profile)
+        rows = sorted(totals.items(), key=lambda item: item[1][2],
+                      reverse=True)
+        return [{'coroutine': name,
+                 'tasks': tasks,
+                 'steps': steps,
+                 'run_time': run_time,
+                 'ready_time': ready_time,
+                 'wait_time': wait_time}
+                for name, (tasks, steps, run_time, ready_time, wait_time)
+                in rows[:top]]
+
+    def clear(self):
+        """Forgets everything profiled so far."""
+        self._live = weakref.WeakSet()
+        self._finished.clear()
+
+    def _task_finished(self, profile):
+        self._live.discard(profile)
+        self._add(self._finished, profile)
+
+    @staticmethod
+    def _add(totals, profile):
+        entry = totals.get(profile.name)
+        if entry is None:
+            entry = totals[profile.name] = [0, 0, 0.0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += profile.steps
+        entry[2] += profile.run_time
+        entry[3] += profile.ready_time
+        entry[4] += profile.wait_time
@@ -313,11 +313,13 @@ class BaseProactorEventLoop(base_events.BaseEventLoop):
         self._ssock.setblocking(False)
         self._csock.setblocking(False)
         self._internal_fds += 1
+        self._wakeup_pending = False
         self.call_soon(self._loop_self_reading)
 
     def _loop_self_reading(self, f=None):
         try:
             if f is not None:
+                self._wakeup_pending = False
                 f.result()  # may raise
             f = self._proactor.recv(self._ssock, 4096)
         except:
@@ -327,6 +329,11 @@ class BaseProactorEventLoop(base_events.BaseEventLoop):
             f.add_done_callback(self._loop_self_reading)
 
     def _write_to_self(self):
+        # Wakeups are coalesced: nothing more is written until the loop
+        # reads the pending one in _loop_self_reading().
+        if self._wakeup_pending:
+            return
+        self._wakeup_pending = True
         self._csock.send(b'x')
 
     def _start_serving(self, protocol_factory, sock, ssl=None, server=None):
@@ -1,6 +1,6 @@
 """Abstract Protocol class."""
 
-__all__ = ['Protocol', 'DatagramProtocol']
+__all__ = ['Protocol', 'BufferedProtocol', 'DatagramProtocol']
 
 
 class BaseProtocol:
@@ -94,6 +94,43 @@ class Protocol(BaseProtocol):
         """
 
 
+class BufferedProtocol(BaseProtocol):
+    """ABC representing a protocol that receives data into its own buffer.
+
+    Socket transports of selector event loops read received data
+    straight into a buffer provided by get_buffer(), and then call
+    buffer_updated(), instead of allocating bytes objects passed to
+    data_received().  Other transports still call data_received(), so a
+    protocol used with them should implement it as well.
+
+    State machine of calls:
+
+      start -> CM [-> GB [-> BU?]]* [-> ER?] -> CL -> end
+    """
+
+    def get_buffer(self, sizehint):
+        """Called to get a buffer to receive data into.
+
+        sizehint is the size of data the transport would like to receive
+        at once.  Must return a non-empty writable object supporting the
+        buffer protocol, the transport drops its reference to the buffer
+        before calling buffer_updated().
+        """
+        raise NotImplementedError
+
+    def buffer_updated(self, nbytes):
+        """Called when nbytes were received into the buffer returned by
+        the last get_buffer() call.
+        """
+        raise NotImplementedError
+
+    def eof_received(self):
+        """Called when the other end calls write_eof() or equivalent.
+
+        See Protocol.eof_received().
+        """
+
+
 class DatagramProtocol(BaseProtocol):
     """ABC representing a datagram protocol."""
 
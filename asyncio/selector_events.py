@@ -6,6 +6,8 @@ also includes support for signal handling, see the unix_events sub-module.
 
 import collections
 import errno
+import itertools
+import os
 import socket
 try:
     import ssl
@@ -16,11 +18,23 @@ from . import base_events
 from . import constants
 from . import events
 from . import futures
+from . import protocols
 from . import selectors
 from . import transports
 from .log import logger
 
 
+# Socket transports flush their write buffer with sendmsg() in chunks of
+# at most that many buffers.
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+
 class BaseSelectorEventLoop(base_events.BaseEventLoop):
     """Selector event loop.
 
@@ -77,16 +91,30 @@ class BaseSelectorEventLoop(base_events.BaseEventLoop):
         self._csock.setblocking(False)
         self._internal_fds += 1
         self.add_reader(self._ssock.fileno(), self._read_from_self)
+        self._wakeup_pending = False
 
     def _read_from_self(self):
-        try:
-            self._ssock.recv(1)
-        except (BlockingIOError, InterruptedError):
-            pass
+        while True:
+            try:
+                if not self._ssock.recv(4096):
+                    break
+            except (BlockingIOError, InterruptedError):
+                break
+        # Flag is cleared only after draining: clearing it before would let
+        # a wakeup written meanwhile be drained while the flag stays set,
+        # and no further wakeup would ever be written.  Callbacks added
+        # while the flag was still set are already in the ready queue, so
+        # the loop does not block polling before running them.
+        self._wakeup_pending = False
 
     def _write_to_self(self):
+        # Wakeups are coalesced: nothing more is written until the loop
+        # reads the pending one in _read_from_self().
+        if self._wakeup_pending:
+            return
+        self._wakeup_pending = True
         try:
-            self._csock.send(b'x')
+            self._csock.send(b'\0')
         except (BlockingIOError, InterruptedError):
             pass
 
@@ -355,6 +383,7 @@ class _SelectorTransport(transports.Transport):
         self._protocol = protocol
         self._server = server
         self._buffer = collections.deque()
+        self._buffer_size = 0  # Total size of data in the buffer.
         self._conn_lost = 0  # Set when call to connection_lost scheduled.
         self._closing = False  # Set when close() called.
         self._protocol_paused = False
@@ -386,6 +415,7 @@ class _SelectorTransport(transports.Transport):
         if self._buffer:
             self._buffer.clear()
             self._loop.remove_writer(self._sock_fd)
+        self._buffer_size = 0
         if not self._closing:
             self._closing = True
             self._loop.remove_reader(self._sock_fd)
@@ -438,7 +468,7 @@ class _SelectorTransport(transports.Transport):
         self._low_water = low
 
     def get_write_buffer_size(self):
-        return sum(len(data) for data in self._buffer)
+        return self._buffer_size
 
 
 class _SelectorSocketTransport(_SelectorTransport):
@@ -448,6 +478,8 @@ class _SelectorSocketTransport(_SelectorTransport):
         super().__init__(loop, sock, protocol, extra, server)
         self._eof = False
         self._paused = False
+        if isinstance(protocol, protocols.BufferedProtocol):
+            self._read_ready = self._read_ready_into
 
         self._loop.add_reader(self._sock_fd, self._read_ready)
         self._loop.call_soon(self._protocol.connection_made, self)
@@ -478,14 +510,34 @@ class _SelectorSocketTransport(_SelectorTransport):
             if data:
                 self._protocol.data_received(data)
             else:
-                keep_open = self._protocol.eof_received()
-                if keep_open:
-                    # We're keeping the connection open so the
-                    # protocol can write more, but we still can't
-                    # receive more, so remove the reader callback.
-                    self._loop.remove_reader(self._sock_fd)
-                else:
-                    self.close()
+                self._eof_received()
+
+    def _read_ready_into(self):
+        # Used instead of _read_ready() for BufferedProtocol.
+        try:
+            buf = self._protocol.get_buffer(self.max_size)
+            nbytes = self._sock.recv_into(buf)
+        except (BlockingIOError, InterruptedError):
+            pass
+        except Exception as exc:
+            self._fatal_error(exc)
+        else:
+            # Protocol may need to resize the buffer.
+            buf = None
+            if nbytes:
+                self._protocol.buffer_updated(nbytes)
+            else:
+                self._eof_received()
+
+    def _eof_received(self):
+        keep_open = self._protocol.eof_received()
+        if keep_open:
+            # We're keeping the connection open so the
+            # protocol can write more, but we still can't
+            # receive more, so remove the reader callback.
+            self._loop.remove_reader(self._sock_fd)
+        else:
+            self.close()
 
     def write(self, data):
         assert isinstance(data, bytes), repr(type(data))
@@ -504,37 +556,84 @@ class _SelectorSocketTransport(_SelectorTransport):
             try:
                 n = self._sock.send(data)
             except (BlockingIOError, InterruptedError):
-                pass
+                n = 0
             except Exception as exc:
                 self._fatal_error(exc)
                 return
-            else:
-                data = data[n:]
-                if not data:
-                    return
+            if n == len(data):
+                return
             # Not all was written; register write handler.
             self._loop.add_writer(self._sock_fd, self._write_ready)
-
-        # Add it to the buffer.
-        self._buffer.append(data)
+            self._buffer.append(memoryview(data)[n:])
+            self._buffer_size += len(data) - n
+        else:
+            self._buffer.append(memoryview(data))
+            self._buffer_size += len(data)
         self._maybe_pause_protocol()
 
+    def writelines(self, list_of_data):
+        assert not self._eof, 'Cannot call write() after write_eof()'
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        was_empty = not self._buffer
+        for data in list_of_data:
+            assert isinstance(data, bytes), repr(type(data))
+            if data:
+                self._buffer.append(memoryview(data))
+                self._buffer_size += len(data)
+        if not was_empty or not self._buffer:
+            self._maybe_pause_protocol()
+            return
+
+        # Optimization: try to send now.
+        try:
+            self._send_buffer()
+        except (BlockingIOError, InterruptedError):
+            pass
+        except Exception as exc:
+            self._fatal_error(exc)
+            return
+        if self._buffer:
+            self._loop.add_writer(self._sock_fd, self._write_ready)
+            self._maybe_pause_protocol()
+
+    def _send_buffer(self):
+        """Sends as much of the buffer as the socket accepts at once, and
+        drops the data sent from the buffer."""
+        buffer = self._buffer
+        if _HAS_SENDMSG:
+            n = self._sock.sendmsg(itertools.islice(buffer, _IOV_MAX))
+        else:
+            if len(buffer) > 1:
+                data = memoryview(b''.join(buffer))
+                buffer.clear()
+                buffer.append(data)
+            n = self._sock.send(buffer[0])
+        self._buffer_size -= n
+        # Partially sent buffer is replaced with view of the rest of it.
+        while n:
+            data = buffer[0]
+            if n < len(data):
+                buffer[0] = data[n:]
+                break
+            n -= len(data)
+            buffer.popleft()
+
     def _write_ready(self):
-        data = b''.join(self._buffer)
-        assert data, 'Data should not be empty'
+        assert self._buffer, 'Data should not be empty'
 
-        self._buffer.clear()  # Optimistically; may have to put it back later.
         try:
-            n = self._sock.send(data)
+            self._send_buffer()
         except (BlockingIOError, InterruptedError):
-            self._buffer.append(data)  # Still need to write this.
+            pass
         except Exception as exc:
             self._loop.remove_writer(self._sock_fd)
             self._fatal_error(exc)
         else:
-            data = data[n:]
-            if data:
-                self._buffer.append(data)  # Still need to write this.
             self._maybe_resume_protocol()  # May append to buffer.
             if not self._buffer:
                 self._loop.remove_writer(self._sock_fd)
@@ -728,6 +827,7 @@ class _SelectorSslTransport(_SelectorTransport):
                 self._fatal_error(exc)
                 return
 
+            self._buffer_size -= n
             if n < len(data):
                 self._buffer.append(data[n:])
 
@@ -754,6 +854,7 @@ class _SelectorSslTransport(_SelectorTransport):
 
         # Add it to the buffer.
         self._buffer.append(data)
+        self._buffer_size += len(data)
         self._maybe_pause_protocol()
 
     def can_write_eof(self):
@@ -768,9 +869,6 @@ class _SelectorDatagramTransport(_SelectorTransport):
         self._loop.add_reader(self._sock_fd, self._read_ready)
         self._loop.call_soon(self._protocol.connection_made, self)
 
-    def get_write_buffer_size(self):
-        return sum(len(data) for data, _ in self._buffer)
-
     def _read_ready(self):
         try:
             data, addr = self._sock.recvfrom(self.max_size)
@@ -815,11 +913,13 @@ class _SelectorDatagramTransport(_SelectorTransport):
                 return
 
         self._buffer.append((data, addr))
+        self._buffer_size += len(data)
         self._maybe_pause_protocol()
 
     def _sendto_ready(self):
         while self._buffer:
             data, addr = self._buffer.popleft()
+            self._buffer_size -= len(data)
             try:
                 if self._address:
                     self._sock.send(data)
@@ -827,6 +927,7 @@ class _SelectorDatagramTransport(_SelectorTransport):
                     self._sock.sendto(data, addr)
             except (BlockingIOError, InterruptedError):
                 self._buffer.appendleft((data, addr))  # Try again later.
+                self._buffer_size += len(data)
                 break
             except OSError as exc:
                 self._protocol.error_received(exc)
@@ -4,8 +4,6 @@ __all__ = ['StreamReader', 'StreamReaderProtocol',
            'open_connection', 'start_server',
            ]
 
-import collections
-
 from . import events
 from . import futures
 from . import protocols
@@ -14,6 +12,18 @@ from . import tasks
 
 _DEFAULT_LIMIT = 2**16
 
+# Data read from StreamReader shorter than that is sliced from the buffer,
+# longer data is copied through a memoryview.
+_SLICE_COPY_LIMIT = 2**12
+
+# Smallest room StreamReader makes for receiving data from a transport,
+# the room grows to twice the size of data received last time.
+_MIN_RECEIVE_SIZE = 2**12
+
+# StreamReader gives back memory of a buffer larger than that once less
+# than a quarter of it holds unread data, e.g. after a burst was read.
+_MAX_IDLE_BUFFER = 2**18
+
 
 @tasks.coroutine
 def open_connection(host=None, port=None, *,
@@ -81,13 +91,16 @@ def start_server(client_connected_cb, host=None, port=None, *,
     return (yield from loop.create_server(factory, host, port, **kwds))
 
 
-class StreamReaderProtocol(protocols.Protocol):
+class StreamReaderProtocol(protocols.BufferedProtocol, protocols.Protocol):
     """Trivial helper class to adapt between Protocol and StreamReader.
 
     (This is a helper class instead of making StreamReader itself a
     Protocol subclass, because the StreamReader has other potential
     uses, and to prevent the user of the StreamReader to accidentally
     call inappropriate methods of the protocol.)
+
+    Transports supporting BufferedProtocol receive data straight into
+    the buffer of the StreamReader, others pass it to data_received().
     """
 
     def __init__(self, stream_reader, client_connected_cb=None, loop=None):
@@ -128,6 +141,12 @@ class StreamReaderProtocol(protocols.Protocol):
     def data_received(self, data):
         self._stream_reader.feed_data(data)
 
+    def get_buffer(self, sizehint):
+        return self._stream_reader._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        self._stream_reader._buffer_updated(nbytes)
+
     def eof_received(self):
         self._stream_reader.feed_eof()
 
@@ -212,6 +231,16 @@ class StreamWriter:
 
 
 class StreamReader:
+    """Buffers data received from a transport for reading by coroutines.
+
+    Data is kept in a single bytearray between a read offset and an end
+    offset, so every read copies the returned data once.  Space after the
+    end is reused for new data, and unread data is moved to the front when
+    that makes enough room.  A bytearray grown large by a burst of data is
+    shrunk again once most of it was read.  Transports supporting
+    BufferedProtocol receive data straight into that space, see
+    StreamReaderProtocol.get_buffer().
+    """
 
     def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         # The line length limit is  a security feature;
@@ -220,8 +249,10 @@ class StreamReader:
         if loop is None:
             loop = events.get_event_loop()
         self._loop = loop
-        self._buffer = collections.deque()  # Deque of bytes objects.
-        self._byte_count = 0  # Bytes in buffer.
+        self._buffer = bytearray()
+        self._offset = 0  # Start of unread data in buffer.
+        self._end = 0  # End of unread data in buffer.
+        self._last_received = 0
         self._eof = False  # Whether we're done.
         self._waiter = None  # A future.
         self._exception = None
@@ -244,8 +275,11 @@ class StreamReader:
         assert self._transport is None, 'Transport already set'
         self._transport = transport
 
+    def _buffered(self):
+        return self._end - self._offset
+
     def _maybe_resume_transport(self):
-        if self._paused and self._byte_count <= self._limit:
+        if self._paused and self._buffered() <= self._limit:
             self._paused = False
             self._transport.resume_reading()
 
@@ -261,9 +295,50 @@ class StreamReader:
         if not data:
             return
 
-        self._buffer.append(data)
-        self._byte_count += len(data)
-
+        n = len(data)
+        self._make_room(n)
+        end = self._end
+        self._buffer[end:end + n] = data
+        self._end = end + n
+        self._data_fed()
+
+    def _make_room(self, size):
+        """Ensures there are at least size bytes of space after the end
+        of unread data."""
+        buffer = self._buffer
+        if len(buffer) - self._end >= size:
+            return
+        self._move_to_front()
+        missing = size - (len(buffer) - self._end)
+        if missing > 0:
+            buffer.extend(bytes(max(missing, len(buffer) // 2)))
+
+    def _move_to_front(self):
+        offset = self._offset
+        if offset:
+            unread = self._end - offset
+            if unread:
+                with memoryview(self._buffer) as view:
+                    view[:unread] = view[offset:self._end]
+            self._offset = 0
+            self._end = unread
+
+    def _get_buffer(self, sizehint):
+        """Returns memoryview of space after the end of unread data, see
+        BufferedProtocol.get_buffer()."""
+        self._make_room(min(sizehint,
+                            max(_MIN_RECEIVE_SIZE, 2 * self._last_received)))
+        return memoryview(self._buffer)[self._end:]
+
+    def _buffer_updated(self, nbytes):
+        """Accounts for nbytes received after the end of unread data."""
+        assert self._end + nbytes <= len(self._buffer), \
+            'Received more than the room'
+        self._end += nbytes
+        self._last_received = nbytes
+        self._data_fed()
+
+    def _data_fed(self):
         waiter = self._waiter
         if waiter is not None:
             self._waiter = None
@@ -272,7 +347,7 @@ class StreamReader:
 
         if (self._transport is not None and
             not self._paused and
-            self._byte_count > 2*self._limit):
+            self._buffered() > 2*self._limit):
             try:
                 self._transport.pause_reading()
             except NotImplementedError:
@@ -283,52 +358,92 @@ class StreamReader:
             else:
                 self._paused = True
 
+    def _copy(self, start, end):
+        buffer = self._buffer
+        if end - start < _SLICE_COPY_LIMIT:
+            # Copying a short slice twice is cheaper than making a view.
+            return bytes(buffer[start:end])
+        else:
+            with memoryview(buffer) as view:
+                return view[start:end].tobytes()
+
+    def _discard(self, n):
+        """Removes n unread bytes from the buffer."""
+        self._offset += n
+        if self._offset == self._end:
+            self._offset = self._end = 0
+        buffer = self._buffer
+        unread = self._end - self._offset
+        if len(buffer) > _MAX_IDLE_BUFFER and 4 * unread < len(buffer):
+            # Halving at least, so data is moved O(1) times per byte read.
+            self._move_to_front()
+            del buffer[max(_MAX_IDLE_BUFFER, 2 * unread):]
+        self._maybe_resume_transport()
+
+    def _consume(self, n):
+        """Removes n unread bytes from the buffer and returns them."""
+        data = self._copy(self._offset, self._offset + n)
+        self._discard(n)
+        return data
+
+    @tasks.coroutine
+    def _wait_for_data(self):
+        """Waits until data or EOF is fed, or an exception is set."""
+        assert self._waiter is None
+        self._waiter = futures.Future(loop=self._loop)
+        try:
+            yield from self._waiter
+        finally:
+            self._waiter = None
+
     @tasks.coroutine
     def readline(self):
+        """Read data up to and including b'\\n', see readuntil()."""
+        return (yield from self.readuntil(b'\n'))
+
+    @tasks.coroutine
+    def readuntil(self, separator=b'\n'):
+        """Read data up to and including the separator.
+
+        Returns all remaining data when EOF is received before the
+        separator.  Raises ValueError when the separator is not found
+        within the limit of the stream, the data read so far is
+        dropped.  Waiting for more data does not search the data
+        received before again.
+        """
+        if not separator:
+            raise ValueError('Separator should not be empty')
         if self._exception is not None:
             raise self._exception
 
-        parts = []
-        parts_size = 0
-        not_enough = True
-
-        while not_enough:
-            while self._buffer and not_enough:
-                data = self._buffer.popleft()
-                ichar = data.find(b'\n')
-                if ichar < 0:
-                    parts.append(data)
-                    parts_size += len(data)
-                else:
-                    ichar += 1
-                    head, tail = data[:ichar], data[ichar:]
-                    if tail:
-                        self._buffer.appendleft(tail)
-                    not_enough = False
-                    parts.append(head)
-                    parts_size += len(head)
-
-                if parts_size > self._limit:
-                    self._byte_count -= parts_size
-                    self._maybe_resume_transport()
-                    raise ValueError('Line is too long')
-
+        buffer = self._buffer
+        seplen = len(separator)
+        scanned = 0  # Unread bytes known not to contain the separator.
+        while True:
+            start = self._offset
+            # Only search data received since the last search, and the
+            # tail a separator received partially might start in.
+            end = self._end
+            ichar = buffer.find(separator,
+                                start + max(0, scanned - seplen + 1),
+                                end)
+            if ichar >= 0:
+                size = ichar + seplen - start
+                if size > self._limit:
+                    self._discard(size)
+                    raise ValueError('Separator is found, but chunk is '
+                                     'longer than the limit')
+                return self._consume(size)
+
+            size = end - start
+            if size > self._limit:
+                self._discard(size)
+                raise ValueError('Separator is not found, and chunk '
+                                 'exceeds the limit')
             if self._eof:
-                break
-
-            if not_enough:
-                assert self._waiter is None
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
-
-        line = b''.join(parts)
-        self._byte_count -= parts_size
-        self._maybe_resume_transport()
-
-        return line
+                return self._consume(size)
+            scanned = size
+            yield from self._wait_for_data()
 
     @tasks.coroutine
     def read(self, n=-1):
@@ -340,44 +455,12 @@ class StreamReader:
 
         if n < 0:
             while not self._eof:
-                assert not self._waiter
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
-        else:
-            if not self._byte_count and not self._eof:
-                assert not self._waiter
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
-
-        if n < 0 or self._byte_count <= n:
-            data = b''.join(self._buffer)
-            self._buffer.clear()
-            self._byte_count = 0
-            self._maybe_resume_transport()
-            return data
-
-        parts = []
-        parts_bytes = 0
-        while self._buffer and parts_bytes < n:
-            data = self._buffer.popleft()
-            data_bytes = len(data)
-            if n < parts_bytes + data_bytes:
-                data_bytes = n - parts_bytes
-                data, rest = data[:data_bytes], data[data_bytes:]
-                self._buffer.appendleft(rest)
-
-            parts.append(data)
-            parts_bytes += data_bytes
-            self._byte_count -= data_bytes
-            self._maybe_resume_transport()
-
-        return b''.join(parts)
+                yield from self._wait_for_data()
+            return self._consume(self._buffered())
+
+        if not self._buffered() and not self._eof:
+            yield from self._wait_for_data()
+        return self._consume(min(n, self._buffered()))
 
     @tasks.coroutine
     def readexactly(self, n):
@@ -387,12 +470,54 @@ class StreamReader:
         if n <= 0:
             return b''
 
-        while self._byte_count < n and not self._eof:
-            assert not self._waiter
-            self._waiter = futures.Future(loop=self._loop)
-            try:
-                yield from self._waiter
-            finally:
-                self._waiter = None
+        while self._buffered() < n and not self._eof:
+            yield from self._wait_for_data()
+
+        return self._consume(min(n, self._buffered()))
+
+    @tasks.coroutine
+    def readinto(self, buffer):
+        """Read up to len(buffer) bytes into the writable buffer.
+
+        Waits until there is any data like read(), and returns the number
+        of bytes copied into the buffer, which is 0 after EOF.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as view:
+            if not view.nbytes:
+                return 0
+            if not self._buffered() and not self._eof:
+                yield from self._wait_for_data()
+            n = min(view.nbytes, self._buffered())
+            start = self._offset
+            with memoryview(self._buffer) as data:
+                view.cast('B')[:n] = data[start:start + n]
+        self._discard(n)
+        return n
+
+    @tasks.coroutine
+    def readexactly_many(self, sizes):
+        """Read several fields of the given sizes after a single wait.
+
+        Returns list of bytes, one for every size.  When EOF is received
+        before all of the data, the fields are shorter like the result of
+        readexactly().
+        """
+        if self._exception is not None:
+            raise self._exception
 
-        return (yield from self.read(n))
+        total = sum(sizes)
+        while self._buffered() < total and not self._eof:
+            yield from self._wait_for_data()
+
+        end = self._offset + min(total, self._buffered())
+        fields = []
+        start = self._offset
+        for size in sizes:
+            stop = min(start + max(size, 0), end)
+            fields.append(self._copy(start, stop))
+            start = stop
+        self._discard(start - self._offset)
+        return fields
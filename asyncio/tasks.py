@@ -3,7 +3,7 @@
 __all__ = ['coroutine', 'Task',
            'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
            'wait', 'wait_for', 'as_completed', 'sleep', 'async',
-           'gather',
+           'gather', 'set_coroutine_debug', 'get_coroutine_debug',
            ]
 
 import collections
@@ -11,9 +11,12 @@ import concurrent.futures
 import functools
 import inspect
 import linecache
+import sys
 import traceback
 import weakref
 
+from concurrent.futures.cooperative.synchronous_executor import Synchronous
+
 from . import events
 from . import futures
 from .log import logger
@@ -27,18 +30,82 @@ from .log import logger
 # before you define your coroutines.  A downside of using this feature
 # is that tracebacks show entries for the CoroWrapper.__next__ method
 # when _DEBUG is true.
+#
+# Otherwise only a fraction of generator objects is wrapped, which can
+# be changed at any time with set_coroutine_debug().  While it is 0 the
+# decorator costs a function call and a check of a global per coroutine
+# object.
 _DEBUG = False
 
+# Every _debug_interval-th coroutine object is wrapped, see
+# set_coroutine_debug().  Countdown is 0 while sampling is disabled.
+_debug_sample_rate = 0
+_debug_interval = 0
+_debug_countdown = 0
+
+# Number of frames of the creation stack kept by CoroWrapper
+_DEBUG_STACK_LIMIT = 20
+
+
+def set_coroutine_debug(sample_rate):
+    """Wrap the sample_rate fraction of coroutine objects created from now
+    on into CoroWrapper, or stop wrapping them when 0 is passed.
+
+    Wrapped coroutines remember the stack where they were created and log
+    it with an error when they are never yielded from.  Coroutines are
+    picked evenly rather than at random, so that with sample_rate 0.01
+    every hundredth coroutine is wrapped.  Applies to coroutines defined
+    before the call too.  Has no effect on coroutines defined while _DEBUG
+    was true, they are all wrapped.
+    """
+    global _debug_sample_rate, _debug_interval, _debug_countdown
+    if not 0 <= sample_rate <= 1:
+        raise ValueError('sample_rate should be between 0 and 1')
+    _debug_sample_rate = sample_rate
+    _debug_interval = round(1 / sample_rate) if sample_rate else 0
+    _debug_countdown = _debug_interval
+
+
+def get_coroutine_debug():
+    """Return fraction of coroutine objects wrapped into CoroWrapper."""
+    return _debug_sample_rate
+
+
+def _extract_stack(frame, limit):
+    # Unlike traceback.extract_stack() does not read source lines, they
+    # are only needed when the stack is logged.
+    stack = []
+    while frame is not None and len(stack) < limit:
+        code = frame.f_code
+        stack.append((code.co_filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _format_stack(stack):
+    return ''.join(traceback.format_list(
+        [(filename, lineno, name, linecache.getline(filename, lineno).strip())
+         for filename, lineno, name in stack]))
+
 
 class CoroWrapper:
     """Wrapper for coroutine in _DEBUG mode."""
 
-    __slot__ = ['gen', 'func']
+    __slots__ = ('gen', 'func', '_source_traceback')
 
-    def __init__(self, gen, func):
+    def __init__(self, gen, func, frame=None):
         assert inspect.isgenerator(gen), gen
         self.gen = gen
         self.func = func
+        if frame is None:
+            # Skip the frame of the @coroutine wrapper
+            frame = sys._getframe(2)
+        self._source_traceback = _extract_stack(frame, _DEBUG_STACK_LIMIT)
+
+    @property
+    def __name__(self):
+        return self.func.__name__
 
     def __iter__(self):
         return self
@@ -63,8 +130,10 @@ class CoroWrapper:
             filename = code.co_filename
             lineno = code.co_firstlineno
             logger.error(
-                'Coroutine %r defined at %s:%s was never yielded from',
-                func.__name__, filename, lineno)
+                'Coroutine %r defined at %s:%s was never yielded from\n'
+                'Coroutine object created at (most recent call last):\n%s',
+                func.__name__, filename, lineno,
+                _format_stack(self._source_traceback).rstrip())
 
 
 def coroutine(func):
@@ -83,20 +152,49 @@ def coroutine(func):
                 res = yield from res
             return res
 
-    if not _DEBUG:
-        wrapper = coro
+    if _DEBUG:
+        @functools.wraps(func)
+        def wrapper(*args, **kwds):
+            return CoroWrapper(coro(*args, **kwds), func)
+    elif coro is func:
+        @functools.wraps(func)
+        def wrapper(*args, **kwds):
+            if _debug_countdown:
+                return _sample(func(*args, **kwds), func)
+            return func(*args, **kwds)
     else:
         @functools.wraps(func)
         def wrapper(*args, **kwds):
-            w = CoroWrapper(coro(*args, **kwds), func)
-            w.__name__ = coro.__name__
-            w.__doc__ = coro.__doc__
-            return w
+            gen = coro(*args, **kwds)
+            # Generators created from another Python frame are named
+            # after the code object of coro rather than after func.
+            gen.__name__ = func.__name__
+            gen.__qualname__ = func.__qualname__
+            if _debug_countdown:
+                return _sample(gen, func)
+            return gen
 
     wrapper._is_coroutine = True  # For iscoroutinefunction().
     return wrapper
 
 
+def _sample(gen, func):
+    """Wraps every _debug_interval-th coroutine object into CoroWrapper."""
+    global _debug_countdown
+    _debug_countdown -= 1
+    if _debug_countdown:
+        return gen
+    _debug_countdown = _debug_interval
+    # Skip the frames of _sample() and of the @coroutine wrapper
+    return CoroWrapper(gen, func, sys._getframe(2))
+
+
+def _coroutine_name(coro):
+    if isinstance(coro, CoroWrapper):
+        coro = coro.func
+    return getattr(coro, '__qualname__', None) or coro.__name__
+
+
 def iscoroutinefunction(func):
     """Return True if func is a decorated coroutine function."""
     return getattr(func, '_is_coroutine', False)
@@ -117,11 +215,20 @@ class Task(futures.Future):
     #
     # The only transition from the latter to the former is through
     # _wakeup().  When _fut_waiter is not None, one of its callbacks
-    # must be _wakeup().
+    # must be _wakeup_inline(), which calls _wakeup() right away or
+    # schedules it.
 
     # Weak set containing all tasks alive.
     _all_tasks = weakref.WeakSet()
 
+    # How many tasks can be resumed by done callbacks of the futures they
+    # wait for in every iteration of the loop, before the rest of wakeups
+    # go through the ready queue.
+    max_inline_wakeups = 16
+
+    # TaskProfile of the task when it is profiled
+    _profile = None
+
     @classmethod
     def all_tasks(cls, loop=None):
         """Return a set of all tasks for an event loop.
@@ -132,14 +239,33 @@ class Task(futures.Future):
             loop = events.get_event_loop()
         return {t for t in cls._all_tasks if t._loop is loop}
 
-    def __init__(self, coro, *, loop=None):
+    def __init__(self, coro, *, loop=None, eager=False):
+        """Wraps the coroutine into a task.
+
+        By default the coroutine is first stepped in the next iteration
+        of the event loop.  An eager task instead runs the coroutine
+        right away until it first suspends on a future, and if the
+        coroutine returns without suspending the task is already done
+        once constructed.
+        """
         assert iscoroutine(coro), repr(coro)  # Not a coroutine function!
         super().__init__(loop=loop)
         self._coro = iter(coro)  # Use the iterator just in case.
         self._fut_waiter = None
         self._must_cancel = False
-        self._loop.call_soon(self._step)
         self.__class__._all_tasks.add(self)
+        profiler = getattr(self._loop, '_task_profiler', None)
+        if profiler is not None:
+            self._profile = profiler.profile(self, _coroutine_name(coro))
+        if eager:
+            self._step()
+        else:
+            self._schedule_step()
+
+    def _schedule_step(self, *args):
+        if self._profile is not None:
+            self._profile.scheduled()
+        self._executor(self._step, *args)
 
     def __repr__(self):
         res = super().__repr__()
@@ -251,6 +377,9 @@ class Task(futures.Future):
                 exc = futures.CancelledError()
             self._must_cancel = False
         coro = self._coro
+        profile = self._profile
+        if profile is not None:
+            started = profile.step_started()
         self._fut_waiter = None
         # Call either coro.throw(exc) or coro.send(value).
         try:
@@ -274,36 +403,59 @@ class Task(futures.Future):
                 # Yielded Future must come from Future.__iter__().
                 if result._blocking:
                     result._blocking = False
-                    result.add_done_callback(self._wakeup)
+                    if profile is not None:
+                        result.add_done_callback(profile.waiter_done,
+                                                 executor=Synchronous)
+                    result.add_done_callback(self._wakeup_inline,
+                                             executor=Synchronous)
                     self._fut_waiter = result
                     if self._must_cancel:
                         if self._fut_waiter.cancel():
                             self._must_cancel = False
                 else:
-                    self._loop.call_soon(
-                        self._step, None,
+                    self._schedule_step(
+                        None,
                         RuntimeError(
                             'yield was used instead of yield from '
                             'in task {!r} with {!r}'.format(self, result)))
             elif result is None:
                 # Bare yield relinquishes control for one event loop iteration.
-                self._loop.call_soon(self._step)
+                self._schedule_step()
             elif inspect.isgenerator(result):
                 # Yielding a generator is just wrong.
-                self._loop.call_soon(
-                    self._step, None,
+                self._schedule_step(
+                    None,
                     RuntimeError(
                         'yield was used instead of yield from for '
                         'generator in task {!r} with {}'.format(
                             self, result)))
             else:
                 # Yielding something else is an error.
-                self._loop.call_soon(
-                    self._step, None,
+                self._schedule_step(
+                    None,
                     RuntimeError(
                         'Task got bad yield: {!r}'.format(result)))
+        if profile is not None:
+            profile.step_finished(started, self._state != futures._PENDING)
         self = None
 
+    def _wakeup_inline(self, future):
+        # Resumes the task as soon as the future it waits for completes,
+        # saving a round trip through the ready queue.  The budget of the
+        # loop iteration bounds both nesting of steps and how long other
+        # callbacks wait for tasks waking each other up.  Cancellation and
+        # futures completed while the loop is not running are delivered
+        # through the loop.
+        loop = self._loop
+        wakeups = getattr(loop, '_inline_wakeups', None)
+        if (wakeups is None or wakeups >= self.max_inline_wakeups or
+                future.cancelled() or not loop.is_running()):
+            self._executor(self._wakeup, future)
+            return
+        loop._inline_wakeups = wakeups + 1
+        self._wakeup(future)
+        self = None  # Needed to break cycles when an exception occurs.
+
     def _wakeup(self, future):
         try:
             value = future.result()
@@ -449,29 +601,56 @@ def as_completed(fs, *, loop=None, timeout=None):
     Note: The futures 'f' are not necessarily members of fs.
     """
     loop = loop if loop is not None else events.get_event_loop()
-    deadline = None if timeout is None else loop.time() + timeout
-    todo = set(async(f, loop=loop) for f in fs)
+    # Callbacks are added in order of fs, so that futures which are
+    # already done are reported in that order.
+    ordered = list(collections.OrderedDict.fromkeys(
+        async(f, loop=loop) for f in fs))
+    todo = set(ordered)
+    # Done futures in order of completion, None for every future
+    # left pending when the timeout occurs.
     completed = collections.deque()
+    waiters = collections.deque()
+    timeout_handle = None
+
+    def _wake_up_one():
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _on_completion(f):
+        if f not in todo:
+            return  # _on_timeout() was here first.
+        todo.remove(f)
+        completed.append(f)
+        if not todo and timeout_handle is not None:
+            timeout_handle.cancel()
+        _wake_up_one()
+
+    def _on_timeout():
+        for f in todo:
+            f.remove_done_callback(_on_completion)
+            completed.append(None)
+        todo.clear()
+        while waiters:
+            _wake_up_one()
 
     @coroutine
     def _wait_for_one():
         while not completed:
-            timeout = None
-            if deadline is not None:
-                timeout = deadline - loop.time()
-                if timeout < 0:
-                    raise futures.TimeoutError()
-            done, pending = yield from _wait(
-                todo, timeout, FIRST_COMPLETED, loop)
-            # Multiple callers might be waiting for the same events
-            # and getting the same outcome.  Dedupe by updating todo.
-            for f in done:
-                if f in todo:
-                    todo.remove(f)
-                    completed.append(f)
+            waiter = futures.Future(loop=loop)
+            waiters.append(waiter)
+            yield from waiter
         f = completed.popleft()
+        if f is None:
+            raise futures.TimeoutError()
         return f.result()  # May raise.
 
+    for f in ordered:
+        f.add_done_callback(_on_completion)
+    if todo and timeout is not None:
+        timeout_handle = loop.call_later(timeout, _on_timeout)
     for _ in range(len(todo)):
         yield _wait_for_one()
 
@@ -487,17 +666,18 @@ def sleep(delay, result=None, *, loop=None):
         h.cancel()
 
 
-def async(coro_or_future, *, loop=None):
+def async(coro_or_future, *, loop=None, eager=False):
     """Wrap a coroutine in a future.
 
     If the argument is a Future, it is returned directly.
+    If eager is true, the coroutine is wrapped in an eager Task.
     """
     if isinstance(coro_or_future, futures.Future):
         if loop is not None and loop is not coro_or_future._loop:
             raise ValueError('loop argument must agree with Future')
         return coro_or_future
     elif iscoroutine(coro_or_future):
-        return Task(coro_or_future, loop=loop)
+        return Task(coro_or_future, loop=loop, eager=eager)
     else:
         raise TypeError('A Future or coroutine is required')
 
@@ -522,7 +702,8 @@ class _GatheringFuture(futures.Future):
         return True
 
 
-def gather(*coros_or_futures, loop=None, return_exceptions=False):
+def gather(*coros_or_futures, loop=None, return_exceptions=False,
+           eager=False):
     """Return a future aggregating results from the given coroutines
     or futures.
 
@@ -541,8 +722,12 @@ def gather(*coros_or_futures, loop=None, return_exceptions=False):
     the outer Future is *not* cancelled in this case.  (This is to
     prevent the cancellation of one child to cause other children to
     be cancelled.)
+
+    If *eager* is True, coroutines are wrapped in eager Tasks, and when
+    all children are done right away the returned future is done too.
     """
-    children = [async(fut, loop=loop) for fut in coros_or_futures]
+    children = [async(fut, loop=loop, eager=eager)
+                for fut in coros_or_futures]
     n = len(children)
     if n == 0:
         outer = futures.Future(loop=loop)
@@ -581,6 +766,11 @@ def gather(*coros_or_futures, loop=None, return_exceptions=False):
         if nfinished == n:
             outer.set_result(results)
 
+    if eager and all(fut._state != futures._PENDING for fut in children):
+        for i, fut in enumerate(children):
+            _done_callback(i, fut)
+        return outer
+
     for i, fut in enumerate(children):
         fut.add_done_callback(functools.partial(_done_callback, i))
     return outer
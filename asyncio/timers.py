@@ -0,0 +1,327 @@
+"""Schedulers of timed callbacks for the event loop.
+
+The event loop keeps TimerHandles returned by call_at() and call_later()
+in a scheduler which tells it when the next timer is due and hands it
+the timers that expired.  A scheduler can be selected per loop with
+BaseEventLoop.set_timer_scheduler().
+"""
+
+__all__ = ['HeapScheduler', 'TimingWheelScheduler']
+
+import heapq
+import math
+
+
+# Cancelled timers are purged from the scheduler once there are at least
+# that many of them and they make up more than that fraction of all
+# scheduled timers.
+_MIN_CANCELLED_TIMERS = 100
+_MAX_CANCELLED_TIMERS_FRACTION = 0.5
+
+
+class _BaseScheduler:
+    """Accounts for cancelled timers still held by the scheduler.
+
+    The loop reports timers cancelled while they are scheduled, and the
+    scheduler reports timers it drops, so that cancelled timers can be
+    purged before they pile up.  Subclasses set ``timer._scheduled``
+    while they hold the timer and implement ``_purge()``.
+    """
+
+    def __init__(self):
+        self._cancelled = 0
+
+    def timer_cancelled(self, timer):
+        """Called by the loop when scheduled timer is cancelled."""
+        self._cancelled += 1
+        if (self._cancelled >= _MIN_CANCELLED_TIMERS and
+                self._cancelled > _MAX_CANCELLED_TIMERS_FRACTION * len(self)):
+            self._purge()
+
+    def stats(self):
+        """Returns numbers of live and cancelled timers held."""
+        return {'live_timers': len(self) - self._cancelled,
+                'cancelled_timers': self._cancelled}
+
+    def _unschedule(self, timer):
+        timer._scheduled = False
+        if timer._cancelled:
+            self._cancelled -= 1
+            return False
+        return True
+
+    def _live(self, timers):
+        live = []
+        for timer in timers:
+            if timer._cancelled:
+                self._unschedule(timer)
+            else:
+                live.append(timer)
+        return live
+
+    def _purge(self):
+        raise NotImplementedError
+
+
+class HeapScheduler(_BaseScheduler):
+    """Keeps timers in a binary heap ordered by their deadline.
+
+    Timers fire exactly at their deadline, but insertion costs O(log n)
+    comparisons of TimerHandles.  Cancelled timers deep in the heap are
+    removed by rebuilding the heap once there are too many of them.
+    This is the default scheduler.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def start(self, now):
+        """Called by the loop with its current time when attached."""
+
+    def push(self, timer):
+        """Schedules the timer."""
+        timer._scheduled = True
+        heapq.heappush(self._heap, timer)
+
+    def next_deadline(self):
+        """Returns the time of the earliest timer, or None if there are none."""
+        heap = self._heap
+        # Remove delayed calls that were cancelled from head of queue.
+        while heap and heap[0]._cancelled:
+            self._unschedule(heapq.heappop(heap))
+        if heap:
+            return heap[0]._when
+        return None
+
+    def pop_expired(self, now, ready):
+        """Appends timers due at the time ``now`` to the ``ready`` queue."""
+        heap = self._heap
+        while heap:
+            if heap[0]._when > now:
+                break
+            timer = heapq.heappop(heap)
+            if self._unschedule(timer):
+                ready.append(timer)
+
+    def timers(self):
+        """Returns a list of all scheduled timers."""
+        return list(self._heap)
+
+    def clear(self):
+        """Drops all scheduled timers."""
+        for timer in self._heap:
+            timer._scheduled = False
+        self._heap.clear()
+        self._cancelled = 0
+
+    def _purge(self):
+        heap = self._live(self._heap)
+        heapq.heapify(heap)
+        self._heap = heap
+
+
+class TimingWheelScheduler(_BaseScheduler):
+    """Keeps timers in a hierarchical timing wheel.
+
+    Time is divided into ticks of ``resolution`` seconds.  Every level of
+    the wheel is a ring of ``wheel_size`` slots, a slot of the first level
+    spans a single tick and a slot of every next level spans the whole
+    previous level.  A timer goes into the lowest level able to tell its
+    tick apart, and is moved to the levels below when the wheel turns to
+    its slot.  Timers beyond the range of the top level are kept in a heap.
+
+    Inserting a timer takes constant time regardless of number of timers,
+    and cancelled timers are dropped when their slot expires or when the
+    wheel is purged because there are too many of them.  The
+    price is precision: timers fire at the end of their tick, that is up
+    to ``resolution`` seconds late, but never early.
+    """
+
+    def __init__(self, resolution=0.001, wheel_size=256, levels=4):
+        if resolution <= 0:
+            raise ValueError('resolution should be positive')
+        if wheel_size < 2 or levels < 1:
+            raise ValueError('wheel should have at least one level '
+                             'of two slots')
+        super().__init__()
+        self._resolution = resolution
+        self._size = wheel_size
+        self._spans = [wheel_size ** level for level in range(levels)]
+        self._wheels = [[None] * wheel_size for _ in range(levels)]
+        self._counts = [0] * levels
+        self._overflow = []
+        self._expired = []
+        self._tick = None
+
+    def __len__(self):
+        return sum(self._counts) + len(self._overflow) + len(self._expired)
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def start(self, now):
+        """Called by the loop with its current time when attached."""
+        if self._tick is None:
+            self._tick = math.floor(now / self._resolution)
+
+    def push(self, timer):
+        """Schedules the timer."""
+        assert self._tick is not None, 'Scheduler is not attached to a loop'
+        timer._scheduled = True
+        self._place(timer)
+
+    def next_deadline(self):
+        """Returns the end of the tick of the earliest timer, or None if
+        there are none.
+
+        Timers above the first level are reported by the time their slot
+        is moved down to the lower levels.
+        """
+        if self._expired:
+            return self._tick * self._resolution
+        tick = self._next_tick()
+        if tick is None:
+            return None
+        return tick * self._resolution
+
+    def pop_expired(self, now, ready):
+        """Appends timers due at the time ``now`` to the ``ready`` queue."""
+        target = math.floor(now / self._resolution)
+        size = self._size
+        first = self._wheels[0]
+        counts = self._counts
+        expired = self._expired
+
+        while self._tick < target:
+            # Jump over the ticks where no slot expires or cascades
+            tick = self._next_tick()
+            if tick is None or tick > target:
+                self._tick = target
+                break
+            self._tick = tick
+            if tick % size == 0:
+                self._cascade(tick)
+            slot = first[tick % size]
+            if slot:
+                first[tick % size] = None
+                counts[0] -= len(slot)
+                expired.extend(slot)
+
+        if expired:
+            self._expired = []
+            for timer in expired:
+                if self._unschedule(timer):
+                    ready.append(timer)
+
+    def timers(self):
+        """Returns a list of all scheduled timers."""
+        timers = list(self._expired)
+        for wheel in self._wheels:
+            for slot in wheel:
+                if slot:
+                    timers.extend(slot)
+        timers.extend(timer for _, _, timer in self._overflow)
+        return timers
+
+    def clear(self):
+        """Drops all scheduled timers."""
+        for timer in self.timers():
+            timer._scheduled = False
+        for wheel in self._wheels:
+            wheel[:] = [None] * self._size
+        self._counts = [0] * len(self._wheels)
+        self._overflow.clear()
+        self._expired.clear()
+        self._cancelled = 0
+
+    def _purge(self):
+        for level, wheel in enumerate(self._wheels):
+            for index, slot in enumerate(wheel):
+                if slot:
+                    live = self._live(slot)
+                    self._counts[level] -= len(slot) - len(live)
+                    wheel[index] = live or None
+        self._expired = self._live(self._expired)
+        self._overflow = [entry for entry in self._overflow
+                          if not entry[2]._cancelled or
+                          self._unschedule(entry[2])]
+        heapq.heapify(self._overflow)
+
+    def _next_tick(self):
+        """Returns the earliest tick at which a slot expires or is moved
+        down to the lower levels, or None if the wheel is empty."""
+        size = self._size
+        tick = self._tick
+        earliest = None
+        for span, wheel, count in zip(self._spans, self._wheels, self._counts):
+            if not count:
+                continue
+            base = tick // span
+            for offset in range(1, size):
+                if wheel[(base + offset) % size]:
+                    slot_tick = (base + offset) * span
+                    if earliest is None or slot_tick < earliest:
+                        earliest = slot_tick
+                    break
+        if self._overflow:
+            top = self._spans[-1] * size
+            slot_tick = self._overflow[0][0] // top * top
+            if earliest is None or slot_tick < earliest:
+                earliest = slot_tick
+        return earliest
+
+    def _place(self, timer):
+        tick = math.ceil(timer._when / self._resolution)
+        current = self._tick
+        if tick <= current:
+            self._expired.append(timer)
+            return
+        size = self._size
+        level = 0
+        for span in self._spans:
+            block = tick // span
+            if block - current // span < size:
+                wheel = self._wheels[level]
+                index = block % size
+                slot = wheel[index]
+                if slot is None:
+                    wheel[index] = [timer]
+                else:
+                    slot.append(timer)
+                self._counts[level] += 1
+                return
+            level += 1
+        # Ties in the heap are resolved by identity rather than by
+        # comparing TimerHandles.
+        heapq.heappush(self._overflow, (tick, id(timer), timer))
+
+    def _cascade(self, tick):
+        size = self._size
+        for level in range(1, len(self._wheels)):
+            span = self._spans[level]
+            if tick % span:
+                return
+            wheel = self._wheels[level]
+            index = (tick // span) % size
+            slot = wheel[index]
+            if slot:
+                wheel[index] = None
+                self._counts[level] -= len(slot)
+                for timer in slot:
+                    if self._unschedule(timer):
+                        timer._scheduled = True
+                        self._place(timer)
+
+        top = self._spans[-1] * size
+        if tick % top == 0:
+            overflow = self._overflow
+            while overflow and overflow[0][0] // top == tick // top:
+                _, _, timer = heapq.heappop(overflow)
+                if self._unschedule(timer):
+                    timer._scheduled = True
+                    self._place(timer)
@@ -259,6 +259,7 @@ class _UnixWritePipeTransport(transports.WriteTransport):
         _set_nonblocking(self._fileno)
         self._protocol = protocol
         self._buffer = []
+        self._buffer_size = 0  # Total size of data in the buffer.
         self._conn_lost = 0
         self._closing = False  # Set when close() or write_eof() called.
 
@@ -272,6 +273,9 @@ class _UnixWritePipeTransport(transports.WriteTransport):
         if waiter is not None:
             self._loop.call_soon(waiter.set_result, None)
 
+    def get_write_buffer_size(self):
+        return self._buffer_size
+
     def _read_ready(self):
         # Pipe was closed by peer.
         self._close()
@@ -305,6 +309,7 @@ class _UnixWritePipeTransport(transports.WriteTransport):
             self._loop.add_writer(self._fileno, self._write_ready)
 
         self._buffer.append(data)
+        self._buffer_size += len(data)
 
     def _write_ready(self):
         data = b''.join(self._buffer)
@@ -322,6 +327,7 @@ class _UnixWritePipeTransport(transports.WriteTransport):
             self._loop.remove_writer(self._fileno)
             self._fatal_error(exc)
         else:
+            self._buffer_size -= n
             if n == len(data):
                 self._loop.remove_writer(self._fileno)
                 if self._closing:
@@ -366,6 +372,7 @@ class _UnixWritePipeTransport(transports.WriteTransport):
         if self._buffer:
             self._loop.remove_writer(self._fileno)
         self._buffer.clear()
+        self._buffer_size = 0
         self._loop.remove_reader(self._fileno)
         self._loop.call_soon(self._call_connection_lost, exc)
 
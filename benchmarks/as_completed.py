@@ -0,0 +1,52 @@
+"""Time to consume n futures with asyncio.as_completed().
+
+Futures are completed in shuffled order, a few per loop iteration, while
+a single coroutine consumes them as they complete.
+
+Run from repository root:
+
+    python -m benchmarks.as_completed
+"""
+
+import asyncio
+import gc
+import random
+import time
+
+
+def consume(loop, n, per_iteration=10):
+    fs = [asyncio.Future(loop=loop) for _ in range(n)]
+    order = list(fs)
+    random.Random(0).shuffle(order)
+
+    def complete(start):
+        for f in order[start:start + per_iteration]:
+            f.set_result(None)
+        if start + per_iteration < n:
+            loop.call_soon(complete, start + per_iteration)
+
+    @asyncio.coroutine
+    def main():
+        for f in asyncio.as_completed(fs, loop=loop):
+            yield from f
+
+    loop.call_soon(complete, 0)
+    t0 = time.perf_counter()
+    loop.run_until_complete(main())
+    return time.perf_counter() - t0
+
+
+def main(sizes=(10000, 100000), repeat=3):
+    loop = asyncio.new_event_loop()
+    try:
+        print('{:>8} {:>12} {:>14}'.format('n', 'seconds', 'futures/s'))
+        for n in sizes:
+            gc.collect()
+            elapsed = min(consume(loop, n) for _ in range(repeat))
+            print('{:>8} {:>12.3f} {:>14.0f}'.format(n, elapsed, n / elapsed))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
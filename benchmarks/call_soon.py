@@ -0,0 +1,56 @@
+"""Throughput of callbacks going through the event loop ready queue.
+
+Measures scheduling and running of callbacks in ``_run_once`` for plain
+``call_soon()`` and for done-callbacks of asyncio futures, which the
+loop schedules internally.
+
+Run from repository root:
+
+    python -m benchmarks.call_soon
+"""
+
+import asyncio
+import gc
+import time
+
+
+def _noop(*args):
+    pass
+
+
+def call_soon(loop, n):
+    t0 = time.perf_counter()
+    for i in range(n):
+        loop.call_soon(_noop, i)
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+    return n / (time.perf_counter() - t0)
+
+
+def future_callbacks(loop, n):
+    futures = [asyncio.Future(loop=loop) for _ in range(n)]
+    for f in futures:
+        f.add_done_callback(_noop)
+    t0 = time.perf_counter()
+    for f in futures:
+        f.set_result(None)
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+    return n / (time.perf_counter() - t0)
+
+
+def main(n=200000, repeat=5):
+    loop = asyncio.new_event_loop()
+    try:
+        print('{:<20} {:>14}'.format('scenario', 'callbacks/s'))
+        for name, fn in (('call_soon', call_soon),
+                         ('future callbacks', future_callbacks)):
+            gc.collect()
+            rate = max(fn(loop, n) for _ in range(repeat))
+            print('{:<20} {:>14.0f}'.format(name, rate))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Resolution time of long map() chains with different callback executors.
+
+Run from repository root:
+
+    python -m benchmarks.callback_chain
+"""
+
+from concurrent.futures.cooperative import Future
+from concurrent.futures.cooperative.synchronous_executor import Synchronous, Trampolining
+import sys
+import time
+
+# Upper bound of stack frames per chain link with synchronous executor
+_FRAMES_PER_LINK = 12
+
+# Deeper synchronous chains are skipped, raising recursion limit further
+# risks overflowing the C stack
+_MAX_SYNCHRONOUS_LENGTH = 1000
+
+
+def _inc(x):
+    return x + 1
+
+
+def resolve_chain(executor, length):
+    f = Future(clb_executor=executor)
+    last = f
+    for _ in range(length):
+        last = last.map(_inc)
+
+    t0 = time.perf_counter()
+    f.set_result(0)
+    elapsed = time.perf_counter() - t0
+
+    assert last.result() == length
+    return elapsed
+
+
+def main():
+    print('{:<14} {:>8} {:>14} {:>14}'.format(
+        'executor', 'length', 'total, ms', 'per link, us'))
+    for length in (10, 100, 1000, 10000, 100000):
+        for name, executor in (('synchronous', Synchronous),
+                               ('trampolining', Trampolining)):
+            if executor is Synchronous and length > _MAX_SYNCHRONOUS_LENGTH:
+                print('{:<14} {:>8} {:>14}'.format(name, length, 'n/a'))
+            else:
+                limit = sys.getrecursionlimit()
+                sys.setrecursionlimit(limit + length * _FRAMES_PER_LINK)
+                try:
+                    elapsed = resolve_chain(executor, length)
+                finally:
+                    sys.setrecursionlimit(limit)
+                print('{:<14} {:>8} {:>14.2f} {:>14.2f}'.format(
+                    name, length, elapsed * 1e3, elapsed * 1e6 / length))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Cost of creating coroutine objects with sampled debug wrapping.
+
+Creates and runs to completion coroutines of a @coroutine function while
+asyncio.set_coroutine_debug() is set to different rates, and of an
+undecorated generator function for reference.
+
+Run from repository root:
+
+    python -m benchmarks.coroutine_debug
+"""
+
+import asyncio
+import gc
+import time
+
+
+def plain():
+    return 1
+    yield
+
+
+@asyncio.coroutine
+def decorated():
+    return 1
+    yield
+
+
+def create(fn, n):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        for _ in fn():
+            pass
+    return n / (time.perf_counter() - t0)
+
+
+def main(n=200000, repeat=5):
+    print('{:<24} {:>16}'.format('scenario', 'coroutines/s'))
+    gc.collect()
+    rate = max(create(plain, n) for _ in range(repeat))
+    print('{:<24} {:>16.0f}'.format('undecorated', rate))
+    try:
+        for sample_rate in (0, 0.001, 0.01, 0.1, 1):
+            asyncio.set_coroutine_debug(sample_rate)
+            gc.collect()
+            rate = max(create(decorated, n) for _ in range(repeat))
+            print('{:<24} {:>16.0f}'.format(
+                'sample_rate={}'.format(sample_rate), rate))
+    finally:
+        asyncio.set_coroutine_debug(0)
+
+
+if __name__ == '__main__':
+    main()
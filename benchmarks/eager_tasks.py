@@ -0,0 +1,69 @@
+"""Throughput of tasks that mostly complete without suspending.
+
+Models a cache in front of a slow lookup: 90% of lookups hit the cache
+and return right away, the rest suspend for one loop iteration.  Tasks
+are created either lazily (first step scheduled on the loop) or eagerly
+(coroutine stepped right away), awaited one by one and with gather().
+
+Run from repository root:
+
+    python -m benchmarks.eager_tasks
+"""
+
+import asyncio
+import gc
+import time
+
+
+HIT_RATE = 0.9
+
+
+@asyncio.coroutine
+def lookup(i, loop):
+    if i % 10 < HIT_RATE * 10:
+        return i
+    yield from asyncio.sleep(0, loop=loop)
+    return i
+
+
+def sequential(loop, n, eager):
+    @asyncio.coroutine
+    def main():
+        for i in range(n):
+            yield from asyncio.async(lookup(i, loop), loop=loop, eager=eager)
+
+    t0 = time.perf_counter()
+    loop.run_until_complete(main())
+    return n / (time.perf_counter() - t0)
+
+
+def gathered(loop, n, eager, batch=100):
+    @asyncio.coroutine
+    def main():
+        for i in range(0, n, batch):
+            yield from asyncio.gather(
+                *[lookup(j, loop) for j in range(i, i + batch)],
+                loop=loop, eager=eager)
+
+    t0 = time.perf_counter()
+    loop.run_until_complete(main())
+    return n / (time.perf_counter() - t0)
+
+
+def main(n=50000, repeat=5):
+    loop = asyncio.new_event_loop()
+    try:
+        print('{:<12} {:>14} {:>14}'.format('scenario', 'lazy tasks/s',
+                                            'eager tasks/s'))
+        for name, fn in (('sequential', sequential), ('gather', gathered)):
+            rates = []
+            for eager in (False, True):
+                gc.collect()
+                rates.append(max(fn(loop, n, eager) for _ in range(repeat)))
+            print('{:<12} {:>14.0f} {:>14.0f}'.format(name, *rates))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
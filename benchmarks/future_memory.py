@@ -0,0 +1,170 @@
+"""Memory footprint and callback throughput of pending futures.
+
+Compares cooperative ``Future`` of this tree with ``LegacyFuture``, a
+copy of the cooperative future before futures got ``__slots__``, which
+kept its state in the instance ``__dict__`` and its callbacks in a list
+of tuples.  When a git revision is given, the ``Future`` of that
+revision is measured too, after exporting it with ``git archive``.
+Every future is measured in its own interpreter.
+
+Run from repository root:
+
+    python -m benchmarks.future_memory [REVISION]
+"""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from concurrent.futures.config import Default
+from concurrent.futures.cooperative.future_base import _PENDING, _FINISHED
+
+CALLBACKS = (0, 1, 2, 3)
+
+
+class LegacyFuture:
+    """Cooperative Future as it was before ``__slots__``, reduced to the
+    methods measured here."""
+
+    _state = _PENDING
+    _result = None
+    _exception = None
+    _ex_handler = None
+
+    def __init__(self, *, clb_executor=None):
+        self._callbacks = []
+        self._executor = clb_executor or Default.get_callback_executor()
+
+    def add_done_callback(self, fun_res, *, executor=None):
+        if fun_res is not None:
+            if self._state != _PENDING:
+                self._run_callback(fun_res, executor)
+            else:
+                self._callbacks.append((fun_res, executor))
+
+    def set_result(self, result):
+        if not self.try_set_result(result):
+            raise RuntimeError('result was already set')
+
+    def try_set_result(self, result):
+        return self._try_set_state(_FINISHED, result, None)
+
+    def _try_set_state(self, state, result, exception):
+        if self._state != _PENDING:
+            return False
+        self._state = state
+        self._result = result
+        self._exception = exception
+        self._on_result_set()
+        return True
+
+    def _on_result_set(self):
+        callbacks = self._callbacks[:]
+        if not callbacks:
+            return
+
+        self._callbacks[:] = []
+        for clb, executor in callbacks:
+            self._run_callback(clb, executor)
+
+    def _run_callback(self, clb, executor):
+        executor = executor or self._executor
+        executor(clb, self)
+
+
+def _noop(_):
+    pass
+
+
+def bytes_per_pending(cls, n, callbacks):
+    gc.collect()
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    futures = []
+    for _ in range(n):
+        f = cls()
+        for _ in range(callbacks):
+            f.add_done_callback(_noop)
+        futures.append(f)
+    size = sum(s.size_diff for s in
+               tracemalloc.take_snapshot().compare_to(snapshot, 'filename'))
+    tracemalloc.stop()
+    # Exclude the list holding the futures
+    return (size - futures.__sizeof__()) / n
+
+
+def callbacks_per_second(cls, n, callbacks, repeat=3):
+    best = 0
+    for _ in range(repeat):
+        futures = [cls() for _ in range(n)]
+        gc.collect()
+        t0 = time.perf_counter()
+        for f in futures:
+            for _ in range(callbacks):
+                f.add_done_callback(_noop)
+            f.set_result(None)
+        best = max(best, n * callbacks / (time.perf_counter() - t0))
+    return best
+
+
+def measure(n, legacy=False):
+    """Measures LegacyFuture or Future of the tree this interpreter imports."""
+    if legacy:
+        cls = LegacyFuture
+    else:
+        from concurrent.futures.cooperative import Future as cls
+
+    return [(callbacks, bytes_per_pending(cls, n, callbacks),
+             callbacks_per_second(cls, n, callbacks)
+             if callbacks else float('nan'))
+            for callbacks in CALLBACKS]
+
+
+def measure_tree(root, n, legacy=False):
+    """Measures Future of the tree at root in a separate interpreter."""
+    env = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.check_output(
+        [sys.executable, '-W', 'ignore', os.path.abspath(__file__),
+         '--measure', str(n)] + (['--legacy'] if legacy else []), env=env)
+    return json.loads(output.decode())
+
+
+def export_revision(revision, directory):
+    archive = subprocess.Popen(['git', 'archive', revision],
+                               stdout=subprocess.PIPE)
+    subprocess.check_call(['tar', '-x', '-C', directory],
+                          stdin=archive.stdout)
+    archive.stdout.close()
+    if archive.wait():
+        raise RuntimeError('git archive {} failed'.format(revision))
+
+
+def main(n=100000):
+    if sys.argv[1:2] == ['--measure']:
+        print(json.dumps(measure(int(sys.argv[2]), '--legacy' in sys.argv)))
+        return
+
+    trees = [('legacy', os.getcwd(), True), ('current', os.getcwd(), False)]
+    with tempfile.TemporaryDirectory() as directory:
+        if len(sys.argv) > 1:
+            export_revision(sys.argv[1], directory)
+            trees.insert(1, (sys.argv[1], directory, False))
+        results = [(name, measure_tree(root, n, legacy))
+                   for name, root, legacy in trees]
+
+    print('{:<12} {:>10} {:>16} {:>16}'.format(
+        'tree', 'callbacks', 'bytes/pending', 'callbacks/s'))
+    for i, callbacks in enumerate(CALLBACKS):
+        for name, rows in results:
+            _, mem, rate = rows[i]
+            print('{:<12} {:>10} {:>16.1f} {:>16.0f}'.format(
+                name, callbacks, mem, rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Submit-and-complete throughput of multithreaded futures.
+
+Compares current ``multithreaded.Future`` (lock-free reads, wait lock
+allocated only for blocking waiters) with the previous design that
+allocated a ``threading.Condition`` per future and took it on every call.
+
+Run from repository root:
+
+    python -m benchmarks.mt_future
+"""
+
+from concurrent.executors import ThreadPoolExecutor
+from concurrent.futures.cooperative.future_base import _PENDING
+from concurrent.futures.cooperative.synchronous_executor import Synchronous
+from concurrent.futures.multithreaded import Future
+from concurrent.futures.cooperative.future_extensions import FutureBaseExt
+from threading import Condition, Thread, Barrier
+import time
+
+
+class LegacyFuture(Future):
+    """Approximates multithreaded.Future guarded by per-future Condition."""
+
+    # No __slots__ - instances get __dict__ for the condition
+
+    def __init__(self, *, clb_executor=None):
+        super().__init__(clb_executor=clb_executor)
+        self._cond = Condition()
+
+    def add_done_callback(self, fun_res, *, executor=None):
+        with self._cond:
+            FutureBaseExt.add_done_callback(self, fun_res, executor=executor)
+
+    def done(self):
+        with self._cond:
+            return self._state != _PENDING
+
+    def cancelled(self):
+        with self._cond:
+            return FutureBaseExt.cancelled(self)
+
+    def result(self, *, timeout=None):
+        with self._cond:
+            if self._state == _PENDING and timeout is not None:
+                self._cond.wait(timeout)
+            return FutureBaseExt.result(self)
+
+    def _try_set_state(self, state, result, exception):
+        with self._cond:
+            return FutureBaseExt._try_set_state(self, state, result, exception)
+
+    def _on_result_set(self):
+        FutureBaseExt._on_result_set(self)
+        self._cond.notify_all()
+
+
+def _noop(_):
+    pass
+
+
+def complete_in_threads(cls, n, threads):
+    """Every thread creates, completes and reads its own futures."""
+    per_thread = n // threads
+    barrier = Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        for i in range(per_thread):
+            f = cls(clb_executor=Synchronous)
+            f.add_done_callback(_noop)
+            f.set_result(i)
+            f.done()
+            f.result()
+
+    workers = [Thread(target=work) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    t0 = time.perf_counter()
+    for t in workers:
+        t.join()
+    return per_thread * threads / (time.perf_counter() - t0)
+
+
+def submit_to_pool(n, threads):
+    """Futures are completed by pool workers and waited on by submitter."""
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        t0 = time.perf_counter()
+        futures = [pool.submit(int) for _ in range(n)]
+        for f in futures:
+            f.result(timeout=60)
+        return n / (time.perf_counter() - t0)
+
+
+def main(n=200000):
+    print('{:<22} {:>8} {:>14}'.format('scenario', 'threads', 'futures/s'))
+    for threads in (1, 4, 16):
+        for name, rate in (
+                ('complete, legacy', lambda: complete_in_threads(LegacyFuture, n, threads)),
+                ('complete, lock-free', lambda: complete_in_threads(Future, n, threads)),
+                ('pool submit', lambda: submit_to_pool(n // 4, threads))):
+            print('{:<22} {:>8} {:>14.0f}'.format(name, threads, rate()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Cost of flushing a large write buffer of a socket transport.
+
+Writes n chunks into a socket transport at once, with write() and with
+writelines(), so that most of the data ends up in the write buffer, and
+measures time until another process reading the socket received all of
+it.  Reports the throughput and CPU time of the writing process per GB.
+
+Run from repository root:
+
+    python -m benchmarks.socket_writes
+"""
+
+import asyncio
+import gc
+import multiprocessing
+import socket
+import time
+
+
+def drain(sock, size):
+    received = 0
+    while received < size:
+        data = sock.recv(2**20)
+        if not data:
+            break
+        received += len(data)
+
+
+def flush(loop, n, chunk_size, writelines):
+    rsock, wsock = socket.socketpair()
+    reader = multiprocessing.Process(target=drain,
+                                     args=(rsock, n * chunk_size))
+    reader.start()
+    rsock.close()
+    transport, _ = loop.run_until_complete(
+        loop.create_connection(asyncio.Protocol, sock=wsock))
+    transport.set_write_buffer_limits(high=2**40)
+    chunks = [b'x' * chunk_size for _ in range(n)]
+
+    @asyncio.coroutine
+    def write():
+        if writelines:
+            transport.writelines(chunks)
+        else:
+            for chunk in chunks:
+                transport.write(chunk)
+        while transport.get_write_buffer_size():
+            yield from asyncio.sleep(0.0001, loop=loop)
+
+    t0 = time.perf_counter()
+    c0 = time.process_time()
+    loop.run_until_complete(write())
+    cpu = time.process_time() - c0
+    elapsed = time.perf_counter() - t0
+    transport.close()
+    reader.join()
+    size = n * chunk_size
+    return size / elapsed / 2**20, cpu * 2**30 / size
+
+
+def main(repeat=3):
+    loop = asyncio.new_event_loop()
+    try:
+        print('{:<26} {:>10} {:>10}'.format('scenario', 'MB/s', 'CPU s/GB'))
+        for n, chunk_size in ((10000, 1024), (256, 2**20)):
+            for writelines in (False, True):
+                gc.collect()
+                results = [flush(loop, n, chunk_size, writelines)
+                           for _ in range(repeat)]
+                name = '{} x {}B {}'.format(
+                    n, chunk_size, 'writelines' if writelines else 'write')
+                print('{:<26} {:>10.0f} {:>10.3f}'.format(
+                    name, max(r[0] for r in results),
+                    min(r[1] for r in results)))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Throughput of StreamReader over a socketpair.
+
+One end of the socketpair is written with n short lines as fast as the
+transport accepts them, while a coroutine reads them from the other end
+line by line.  Then another process writes 1 GB into the socketpair,
+which a coroutine reads with read() and readinto().  For the transfer
+both the throughput and the CPU time the reading process spent per GB
+are reported.
+
+Run from repository root:
+
+    python -m benchmarks.streams
+"""
+
+import asyncio
+import gc
+import multiprocessing
+import socket
+import time
+
+
+LINE = b'x' * 15 + b'\n'
+
+
+def readlines(loop, n, batch=1000):
+    rsock, wsock = socket.socketpair()
+    reader, _ = loop.run_until_complete(
+        asyncio.open_connection(sock=rsock, loop=loop))
+    _, writer = loop.run_until_complete(
+        asyncio.open_connection(sock=wsock, loop=loop))
+
+    @asyncio.coroutine
+    def write():
+        chunk = LINE * batch
+        for _ in range(n // batch):
+            writer.write(chunk)
+            yield from writer.drain()
+        writer.close()
+
+    @asyncio.coroutine
+    def read():
+        count = 0
+        while (yield from reader.readline()):
+            count += 1
+        return count
+
+    t0 = time.perf_counter()
+    _, count = loop.run_until_complete(
+        asyncio.gather(write(), read(), loop=loop))
+    elapsed = time.perf_counter() - t0
+    assert count == n, count
+    return n / elapsed
+
+
+def transfer(loop, size, readinto, chunk_size=2**20):
+    rsock, wsock = socket.socketpair()
+    reader, _ = loop.run_until_complete(
+        asyncio.open_connection(sock=rsock, loop=loop))
+
+    def write():
+        rsock.close()
+        chunk = b'x' * chunk_size
+        for _ in range(size // chunk_size):
+            wsock.sendall(chunk)
+        wsock.close()
+
+    @asyncio.coroutine
+    def read():
+        received = 0
+        if readinto:
+            buffer = bytearray(chunk_size)
+            while True:
+                n = yield from reader.readinto(buffer)
+                if not n:
+                    return received
+                received += n
+        else:
+            while True:
+                data = yield from reader.read(chunk_size)
+                if not data:
+                    return received
+                received += len(data)
+
+    writer = multiprocessing.Process(target=write)
+    t0 = time.perf_counter()
+    c0 = time.process_time()
+    writer.start()
+    wsock.close()
+    received = loop.run_until_complete(read())
+    cpu = time.process_time() - c0
+    elapsed = time.perf_counter() - t0
+    writer.join()
+    assert received == size, received
+    return size / elapsed / 2**20, cpu * 2**30 / size
+
+
+def main(n=1000000, size=2**30, repeat=3):
+    loop = asyncio.new_event_loop()
+    try:
+        print('{:<22} {:>14}'.format('lines', 'lines/s'))
+        gc.collect()
+        rate = max(readlines(loop, n) for _ in range(repeat))
+        print('{:<22} {:>14.0f}'.format(n, rate))
+
+        print('{:<22} {:>14} {:>14}'.format('transfer', 'MB/s',
+                                            'CPU s/GB'))
+        for name, readinto in (('read()', False), ('readinto()', True)):
+            gc.collect()
+            results = [transfer(loop, size, readinto) for _ in range(repeat)]
+            print('{:<22} {:>14.0f} {:>14.3f}'.format(
+                name, max(r[0] for r in results), min(r[1] for r in results)))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Throughput of coroutine loops over StreamReader, Queue and Lock.
+
+Every scenario is run with data already available, so that the consumer
+does not need to suspend, and with a producer task feeding the consumer
+one item per loop iteration, so that the consumer is woken up by a
+done-callback of the future it waits for.  The round trip scenario has
+two tasks passing items back and forth through a pair of queues, and
+also reports loop iterations per round trip, which shows how many
+wakeups are delivered without going through the ready queue.
+
+Run from repository root:
+
+    python -m benchmarks.task_wakeup
+"""
+
+import asyncio
+from asyncio import queues
+import gc
+import time
+
+
+def readline(loop, n, contended):
+    reader = asyncio.StreamReader(loop=loop)
+    line = b'x' * 30 + b'\n'
+
+    @asyncio.coroutine
+    def consume():
+        for _ in range(n):
+            yield from reader.readline()
+
+    @asyncio.coroutine
+    def produce():
+        for _ in range(n):
+            reader.feed_data(line)
+            yield
+
+    if not contended:
+        for _ in range(n):
+            reader.feed_data(line)
+    t0 = time.perf_counter()
+    coros = [consume()] + ([produce()] if contended else [])
+    loop.run_until_complete(asyncio.gather(*coros, loop=loop))
+    return n / (time.perf_counter() - t0)
+
+
+def queue_get(loop, n, contended):
+    queue = queues.Queue(loop=loop)
+
+    @asyncio.coroutine
+    def consume():
+        for _ in range(n):
+            yield from queue.get()
+
+    @asyncio.coroutine
+    def produce():
+        for i in range(n):
+            queue.put_nowait(i)
+            yield
+
+    if not contended:
+        for i in range(n):
+            queue.put_nowait(i)
+    t0 = time.perf_counter()
+    coros = [consume()] + ([produce()] if contended else [])
+    loop.run_until_complete(asyncio.gather(*coros, loop=loop))
+    return n / (time.perf_counter() - t0)
+
+
+def lock_acquire(loop, n, contended):
+    lock = asyncio.Lock(loop=loop)
+
+    @asyncio.coroutine
+    def worker(count):
+        for _ in range(count):
+            yield from lock.acquire()
+            lock.release()
+            if contended:
+                yield
+
+    t0 = time.perf_counter()
+    workers = 2 if contended else 1
+    loop.run_until_complete(asyncio.gather(
+        *[worker(n // workers) for _ in range(workers)], loop=loop))
+    return n / (time.perf_counter() - t0)
+
+
+def queue_round_trip(loop, n):
+    pings = queues.Queue(loop=loop)
+    pongs = queues.Queue(loop=loop)
+    iterations = 0
+
+    @asyncio.coroutine
+    def ping():
+        for i in range(n):
+            pings.put_nowait(i)
+            yield from pongs.get()
+
+    @asyncio.coroutine
+    def pong():
+        for _ in range(n):
+            pongs.put_nowait((yield from pings.get()))
+
+    def count_iteration():
+        nonlocal iterations
+        iterations += 1
+        handle[0] = loop.call_soon(count_iteration)
+
+    handle = [loop.call_soon(count_iteration)]
+    t0 = time.perf_counter()
+    loop.run_until_complete(asyncio.gather(pong(), ping(), loop=loop))
+    elapsed = time.perf_counter() - t0
+    handle[0].cancel()
+    return n / elapsed, iterations / n
+
+
+def main(n=100000, repeat=5):
+    loop = asyncio.new_event_loop()
+    try:
+        print('{:<14} {:>16} {:>16}'.format('scenario', 'ready ops/s',
+                                            'waiting ops/s'))
+        for name, fn in (('readline', readline),
+                         ('Queue.get', queue_get),
+                         ('Lock.acquire', lock_acquire)):
+            rates = []
+            for contended in (False, True):
+                gc.collect()
+                rates.append(max(fn(loop, n, contended)
+                                 for _ in range(repeat)))
+            print('{:<14} {:>16.0f} {:>16.0f}'.format(name, *rates))
+        gc.collect()
+        rate, iterations = max(queue_round_trip(loop, n)
+                               for _ in range(repeat))
+        print('Queue round trip: {:.0f} round trips/s, '
+              '{:.2f} loop iterations per round trip'.format(
+                  rate, iterations))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
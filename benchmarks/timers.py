@@ -0,0 +1,84 @@
+"""Heap vs timing wheel scheduler of event loop timers.
+
+Schedules 1M timeouts spread over a minute, cancels 95% of them (as
+idle and read timeouts usually are) and then runs loop iterations every
+10 ms until all remaining timers fire.  Reports number of timers still
+held by the scheduler after cancellation.
+
+Run from repository root:
+
+    python -m benchmarks.timers
+"""
+
+from asyncio import events
+from asyncio.timers import HeapScheduler, TimingWheelScheduler
+import collections
+import gc
+import random
+import time
+
+
+def _noop():
+    pass
+
+
+class _Loop:
+    """Stands for the loop cancelled timers report to."""
+
+    def __init__(self, scheduler):
+        self._timer_handle_cancelled = scheduler.timer_cancelled
+
+
+def run(scheduler, n, cancel_rate, span=60.0, step=0.01):
+    rnd = random.Random(0)
+    deadlines = [rnd.uniform(0, span) for _ in range(n)]
+    cancelled = [rnd.random() < cancel_rate for _ in range(n)]
+    scheduler.start(0)
+    loop = _Loop(scheduler)
+    gc.collect()
+
+    t0 = time.perf_counter()
+    timers = []
+    for when in deadlines:
+        timer = events.TimerHandle(when, _noop, (), loop)
+        scheduler.push(timer)
+        timers.append(timer)
+    t1 = time.perf_counter()
+    for timer, cancel in zip(timers, cancelled):
+        if cancel:
+            timer.cancel()
+    del timers
+    t2 = time.perf_counter()
+    held = len(scheduler)
+
+    fired = 0
+    ready = collections.deque()
+    now = 0
+    while now <= span + step:
+        scheduler.next_deadline()
+        scheduler.pop_expired(now, ready)
+        while ready:
+            if not ready.popleft()._cancelled:
+                fired += 1
+        now += step
+    t3 = time.perf_counter()
+    return t1 - t0, t2 - t1, t3 - t2, fired, held
+
+
+def main(n=1000000, cancel_rate=0.95):
+    print('{} timers, {:.0%} cancelled'.format(n, cancel_rate))
+    print('{:<14} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10}'.format(
+        'scheduler', 'insert, s', 'cancel, s', 'run, s', 'total, s',
+        'held', 'fired'))
+    for name, factory in (('heap', HeapScheduler),
+                          ('wheel 1ms', TimingWheelScheduler),
+                          ('wheel 10ms',
+                           lambda: TimingWheelScheduler(resolution=0.01))):
+        insert, cancel, expire, fired, held = run(factory(), n, cancel_rate)
+        print('{:<14} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.2f} {:>10} {:>10}'.format(
+            name, insert, cancel, expire, insert + cancel + expire,
+            held, fired))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""concurrent.futures.wait() on large numbers of multithreaded futures.
+
+Run from repository root:
+
+    python -m benchmarks.wait
+"""
+
+from concurrent.futures import wait, FIRST_COMPLETED, ALL_COMPLETED
+from concurrent.futures.multithreaded import Future
+import threading
+import time
+
+
+def _complete(futures):
+    for f in futures:
+        f.set_result(None)
+
+
+def wait_completed_by_thread(n, return_when):
+    futures = [Future() for _ in range(n)]
+    t = threading.Thread(target=_complete, args=(futures,))
+
+    t0 = time.perf_counter()
+    t.start()
+    wait(futures, return_when=return_when)
+    elapsed = time.perf_counter() - t0
+    t.join()
+    return elapsed
+
+
+def wait_timeout(n):
+    futures = [Future() for _ in range(n)]
+
+    t0 = time.perf_counter()
+    done, not_done = wait(futures, timeout=0)
+    elapsed = time.perf_counter() - t0
+    assert len(not_done) == n
+    return elapsed
+
+
+def main(n=100000):
+    print('{:<34} {:>10} {:>12}'.format('scenario', 'total, ms', 'per fut, us'))
+    for name, fn in (
+            ('ALL_COMPLETED, completing thread',
+             lambda: wait_completed_by_thread(n, ALL_COMPLETED)),
+            ('FIRST_COMPLETED, completing thread',
+             lambda: wait_completed_by_thread(n, FIRST_COMPLETED)),
+            ('timeout, callbacks detached',
+             lambda: wait_timeout(n))):
+        elapsed = fn()
+        print('{:<34} {:>10.1f} {:>12.2f}'.format(
+            name, elapsed * 1e3, elapsed * 1e6 / n))
+
+
+if __name__ == '__main__':
+    main()
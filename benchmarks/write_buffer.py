@@ -0,0 +1,75 @@
+"""Cost of buffering many small writes in a transport.
+
+Makes n small writes into a socket transport and a datagram transport
+whose peer does not read, so that after the kernel buffer fills up every
+write lands in the write buffer of the transport.  Reports the time per
+write, which should not grow with the number of writes already buffered.
+
+Run from repository root:
+
+    python -m benchmarks.write_buffer
+"""
+
+import asyncio
+import gc
+import os
+import socket
+import tempfile
+import time
+
+
+def socket_transport(loop):
+    rsock, wsock = socket.socketpair()
+    transport, _ = loop.run_until_complete(
+        loop.create_connection(asyncio.Protocol, sock=wsock))
+    return transport, transport.write, rsock
+
+
+def datagram_transport(loop):
+    path = os.path.join(tempfile.mkdtemp(), 'peer')
+    rsock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    rsock.bind(path)
+    wsock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    wsock.setblocking(False)
+    wsock.connect(path)
+    transport = loop._make_datagram_transport(
+        wsock, asyncio.DatagramProtocol(), path)
+    os.unlink(path)
+    os.rmdir(os.path.dirname(path))
+    return transport, transport.sendto, rsock
+
+
+def bench(loop, make_transport, n, size):
+    transport, write, peer = make_transport(loop)
+    transport.set_write_buffer_limits(high=2**40)
+    data = b'x' * size
+    gc.collect()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        write(data)
+    elapsed = time.perf_counter() - t0
+    assert transport.get_write_buffer_size() > 0
+    transport.abort()
+    loop.run_until_complete(asyncio.sleep(0, loop=loop))
+    peer.close()
+    return elapsed
+
+
+def main(repeat=3):
+    loop = asyncio.new_event_loop()
+    try:
+        print('{:<10} {:>8} {:>12} {:>10}'.format(
+            'transport', 'writes', 'total ms', 'us/write'))
+        for name, make_transport in (('socket', socket_transport),
+                                     ('datagram', datagram_transport)):
+            for n in (10000, 100000):
+                elapsed = min(bench(loop, make_transport, n, 100)
+                              for _ in range(repeat))
+                print('{:<10} {:>8} {:>12.1f} {:>10.2f}'.format(
+                    name, n, elapsed * 1e3, elapsed / n * 1e6))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -17,7 +17,9 @@ class Default(object):
     # This includes exceptions in on_success and on_failure callbacks
     UNHANDLED_FAILURE_CALLBACK = staticmethod(log_error_handler)
 
-    # Default executor for future callbacks
+    # Default executor for future callbacks (Synchronous if not set).
+    # Set to cooperative.synchronous_executor.Trampolining to resolve long
+    # chains of futures without recursing once per link.
     CALLBACK_EXECUTOR = None
 
     @staticmethod
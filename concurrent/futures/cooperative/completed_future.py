@@ -0,0 +1,101 @@
+from .future_base import FutureBase
+from .synchronous_executor import SynchronousExecutor
+
+
+class CompletedFutureMixin:
+    """Immutable already completed future.
+
+    Used by ``successful()``, ``failed()`` and ``completed()`` to avoid going
+    through the state machine of a regular future: callbacks are dispatched
+    right away and composition methods either return the future itself or
+    compute new completed future in place when synchronous executor is used.
+
+    Mixin is combined with concrete future class by ``FutureBaseExt``, so
+    completed futures remain instances of the class they were created with
+    (available as ``_pending_class``).
+    """
+
+    __slots__ = ()
+
+    def add_done_callback(self, fun_res, *, executor=None):
+        assert callable(fun_res) or fun_res is None, \
+            "Future.add_done_callback expects callable or None"
+
+        if fun_res is not None:
+            self._run_callback(fun_res, executor)
+
+    def remove_done_callback(self, fn):
+        return 0
+
+    def cancelled(self):
+        return False
+
+    def done(self):
+        return True
+
+    def wait(self, timeout=None):
+        return True
+
+    def result(self, *, timeout=None):
+        self._error_handled()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, *, timeout=None):
+        self._error_handled()
+        return self._exception
+
+    def cancel(self):
+        return False
+
+    def recover(self, fun_ex_or_value, *, executor=None):
+        if self._exception is None:
+            return self
+        if not self._is_synchronous(executor):
+            return super().recover(fun_ex_or_value, executor=executor)
+        self._error_handled()
+        if callable(fun_ex_or_value):
+            return self._completed_from(self, fun_ex_or_value, self._exception)
+        return self._new_completed(fun_ex_or_value, None, self)
+
+    def map(self, fun_res, *, executor=None):
+        assert callable(fun_res), "Future.map expects callable"
+        if self._exception is not None:
+            return self
+        if not self._is_synchronous(executor):
+            return super().map(fun_res, executor=executor)
+        return self._completed_from(self, fun_res, self._result)
+
+    def then(self, future_fun, *, executor=None):
+        assert callable(future_fun) or isinstance(future_fun, FutureBase), "Future.then expects callable or Future"
+        if self._exception is not None:
+            return self
+        return super().then(future_fun, executor=executor)
+
+    def fallback(self, future_fun, *, executor=None):
+        assert callable(future_fun) or isinstance(future_fun, FutureBase), "Future.fallback expects callable or Future"
+        if self._exception is None:
+            return self
+        return super().fallback(future_fun, executor=executor)
+
+    def _try_set_state(self, state, result, exception):
+        return False
+
+    # Futures derived from completed one are regular pending futures,
+    # and compatibility rules are the same as of original future class.
+
+    @classmethod
+    def _new(cls, other=None, *, clb_executor=None):
+        return cls._pending_class._new(other, clb_executor=clb_executor)
+
+    @classmethod
+    def convert(cls, future):
+        return cls._pending_class.convert(future)
+
+    @classmethod
+    def compatible(cls, futures):
+        return cls._pending_class.compatible(futures)
+
+    def _is_synchronous(self, executor):
+        return isinstance(executor or self._executor, SynchronousExecutor)
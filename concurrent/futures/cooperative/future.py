@@ -3,4 +3,5 @@ from .future_extensions import FutureBaseExt
 
 class Future(FutureBaseExt):
     """Future to be used in cooperative multitasking concurrency environment."""
-    pass
+
+    __slots__ = ()
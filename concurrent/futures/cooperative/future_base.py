@@ -13,10 +13,13 @@ _FINISHED = 'FINISHED'
 class FutureBase:
     """Encapsulates Future state and maintains callbacks."""
 
-    _state = _PENDING
-    _result = None
-    _exception = None
-    _ex_handler = None
+    # Futures are created in large numbers and most of them only ever get a
+    # single done-callback, so instead of per-instance __dict__ and callback
+    # list the first callback is stored inline and the list (of
+    # (callback, executor) tuples) is only allocated for the second one.
+    __slots__ = ('_state', '_result', '_exception', '_ex_handler',
+                 '_executor', '_callback', '_callback_executor',
+                 '_callbacks', '__weakref__')
 
     def __init__(self, *, clb_executor=None):
         """Initializes future instance.
@@ -25,9 +28,14 @@ class FutureBase:
             clb_executor: specifies default executor object for scheduling
             callbacks (by default set from ``config.Default.CALLBACK_EXECUTOR``)
         """
-        self._callbacks = []
-        self._callbacks = []
+        self._state = _PENDING
+        self._result = None
+        self._exception = None
+        self._ex_handler = None
         self._executor = clb_executor or Default.get_callback_executor()
+        self._callback = None
+        self._callback_executor = None
+        self._callbacks = None
 
     def add_done_callback(self, fun_res, *, executor=None):
         """Add a callback to be run when the future becomes done.
@@ -42,6 +50,11 @@ class FutureBase:
         if fun_res is not None:
             if self._state != _PENDING:
                 self._run_callback(fun_res, executor)
+            elif self._callback is None:
+                self._callback = fun_res
+                self._callback_executor = executor
+            elif self._callbacks is None:
+                self._callbacks = [(fun_res, executor)]
             else:
                 self._callbacks.append((fun_res, executor))
 
@@ -50,10 +63,11 @@ class FutureBase:
 
         Returns the number of callbacks removed.
         """
-        filtered_callbacks = [(f, executor) for f, executor in self._callbacks if f != fn]
-        removed_count = len(self._callbacks) - len(filtered_callbacks)
+        callbacks = self._get_callbacks()
+        filtered_callbacks = [(f, executor) for f, executor in callbacks if f != fn]
+        removed_count = len(callbacks) - len(filtered_callbacks)
         if removed_count:
-            self._callbacks[:] = filtered_callbacks
+            self._set_callbacks(filtered_callbacks)
         return removed_count
 
     def cancelled(self):
@@ -184,35 +198,76 @@ class FutureBase:
             return True
         if self._state != _PENDING:
             return False
-        self._state = state
-        self._result = result
-        self._exception = exception
+        self._set_state(state, result, exception)
         self._on_result_set()
         return True
 
+    def _set_state(self, state, result, exception):
+        # State is published last so that once future is observed done
+        # result and exception can be read without synchronization.
+        self._result = result
+        self._exception = exception
+        if exception is not None:
+            self._ex_handler = EnsureExceptionHandledGuard(
+                exception, Default.UNHANDLED_FAILURE_CALLBACK)
+        self._state = state
+
     def _error_handled(self):
-        if self._ex_handler is not None:
-            self._ex_handler.clear()
+        ex_handler = self._ex_handler
+        if ex_handler is not None:
             self._ex_handler = None
+            ex_handler.clear()
 
     def _on_result_set(self):
-        if self._exception is not None:
-            clb = Default.UNHANDLED_FAILURE_CALLBACK
-            self._ex_handler = EnsureExceptionHandledGuard(self._exception, clb)
-            self._executor(self._ex_handler.activate)
+        self._run_callbacks(*self._pop_callbacks())
 
-        callbacks = self._callbacks[:]
-        if not callbacks:
+    def _pop_callbacks(self):
+        """Detaches registered callbacks.
+
+        Returns (first callback, its executor, list of the rest or None).
+        """
+        callbacks = self._callback, self._callback_executor, self._callbacks
+        self._callback = self._callback_executor = self._callbacks = None
+        return callbacks
+
+    def _run_callbacks(self, clb, executor, callbacks):
+        ex_handler = self._ex_handler
+        if ex_handler is not None:
+            self._executor(ex_handler.activate)
+
+        if clb is None:
             return
+        self._run_callback(clb, executor)
+        if callbacks is not None:
+            for clb, executor in callbacks:
+                self._run_callback(clb, executor)
 
-        self._callbacks[:] = []
-        for clb, executor in callbacks:
-            self._run_callback(clb, executor)
+    def _ensure_exception_handled(self):
+        clb = Default.UNHANDLED_FAILURE_CALLBACK
+        self._ex_handler = EnsureExceptionHandledGuard(self._exception, clb)
+        self._executor(self._ex_handler.activate)
 
     def _run_callback(self, clb, executor):
         executor = executor or self._executor
         executor(clb, self)
 
+    def _get_callbacks(self):
+        """Returns list of (callback, executor) pairs in registration order."""
+        if self._callback is None:
+            return []
+        callbacks = [(self._callback, self._callback_executor)]
+        if self._callbacks is not None:
+            callbacks.extend(self._callbacks)
+        return callbacks
+
+    def _set_callbacks(self, callbacks):
+        """Replaces registered callbacks with list of (callback, executor) pairs."""
+        if not callbacks:
+            self._callback = self._callback_executor = self._callbacks = None
+        else:
+            self._callback, self._callback_executor = callbacks[0]
+            self._callbacks = callbacks[1:] or None
+
     def __repr__(self):
         res = self.__class__.__name__
         if self._state == _FINISHED:
@@ -220,14 +275,15 @@ class FutureBase:
                 res += '<exception={!r}>'.format(self._exception)
             else:
                 res += '<result={!r}>'.format(self._result)
-        elif self._callbacks:
-            size = len(self._callbacks)
+        elif self._callback is not None:
+            callbacks = self._get_callbacks()
+            size = len(callbacks)
             if size > 2:
                 res += '<{}, [{}, <{} more>, {}]>'.format(
-                    self._state, self._callbacks[0],
-                    size - 2, self._callbacks[-1])
+                    self._state, callbacks[0],
+                    size - 2, callbacks[-1])
             else:
-                res += '<{}, {}>'.format(self._state, self._callbacks)
+                res += '<{}, {}>'.format(self._state, callbacks)
         else:
             res += '<{}>'.format(self._state)
         return res
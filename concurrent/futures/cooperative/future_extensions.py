@@ -1,22 +1,38 @@
-from .future_base import FutureBase, CancelledError
-from threading import Lock
+from ..config import Default
+from .future_base import FutureBase, CancelledError, _FINISHED
+from .completed_future import CompletedFutureMixin
+from .pipeline import Pipeline
+from ..exceptions import TimeoutError
+from threading import Lock, Timer
+import collections
 import functools
+import time
 
 
 class FutureBaseExt(FutureBase):
     """ABC for Future combination functions."""
 
+    __slots__ = ()
+
+    # Whether completed futures holding common values (None, True, False)
+    # can be shared between callers. Subclasses binding futures to some
+    # context other than callback executor (e.g. event loop) disable this.
+    _share_completed = True
+
     @classmethod
     def successful(cls, result=None, *, clb_executor=None):
         """Returns successfully completed future.
 
+        Returned future is immutable and may be shared between callers
+        when it holds None, True or False and uses default callback
+        executor, so like any future passed twice it appears once in the
+        sets returned by wait().
+
         Args:
             result: value to complete future with.
             clb_executor: default Executor to use for running callbacks (default - Synchronous).
         """
-        f = cls._new(clb_executor=clb_executor)
-        f.set_result(result)
-        return f
+        return cls._new_completed(result, None, clb_executor=clb_executor)
 
     @classmethod
     def failed(cls, exception, *, clb_executor=None):
@@ -26,19 +42,13 @@ class FutureBaseExt(FutureBase):
             exception: Exception to set to future.
             clb_executor: default Executor to use for running callbacks (default - Synchronous).
         """
-        f = cls._new(clb_executor=clb_executor)
-        f.set_exception(exception)
-        return f
+        assert isinstance(exception, Exception), "Future.failed expects Exception instance"
+        return cls._new_completed(None, exception, clb_executor=clb_executor)
 
     @classmethod
     def completed(cls, fun, *args, clb_executor=None, **kwargs):
         """Returns successful or failed future set from provided function."""
-        f = cls._new(clb_executor=clb_executor)
-        try:
-            f.set_result(fun(*args, **kwargs))
-        except Exception as ex:
-            f.set_exception(ex)
-        return f
+        return cls._completed_from(None, fun, *args, clb_executor=clb_executor, **kwargs)
 
     def complete(self, fun, *args, **kwargs):
         try:
@@ -59,7 +69,7 @@ class FutureBaseExt(FutureBase):
             just value to use in error case.
             executor: Executor to use when performing call to function.
         """
-        f = self._new()
+        f = self._new(self)
 
         def on_done_recover(fut):
             if fut.cancelled():
@@ -91,7 +101,7 @@ class FutureBaseExt(FutureBase):
             executor: Executor to use when performing call to function (default - Synchronous).
         """
         assert callable(fun_res), "Future.map expects callable"
-        f = self._new()
+        f = self._new(self)
 
         def on_done_map(fut):
             if fut.cancelled():
@@ -121,7 +131,7 @@ class FutureBaseExt(FutureBase):
         """
         assert callable(future_fun) or isinstance(future_fun, FutureBase), "Future.then expects callable or Future"
 
-        f = self._new()
+        f = self._new(self)
 
         def on_done_start_next(fut):
             if fut.cancelled():
@@ -158,7 +168,7 @@ class FutureBaseExt(FutureBase):
         """
         assert callable(future_fun) or isinstance(future_fun, FutureBase), "Future.fallback expects callable or Future"
 
-        f = self._new()
+        f = self._new(self)
 
         def on_done_start_fallback(fut):
             if fut.cancelled():
@@ -188,6 +198,19 @@ class FutureBaseExt(FutureBase):
         f.add_done_callback(backprop_cancel_orig)
         return f
 
+    def pipe(self, *, executor=None):
+        """Returns pipeline builder for chaining composition steps.
+
+        Steps added to the pipeline (map, recover, then, fallback) are fused
+        into single callback of this future and single output future
+        returned by ``build()``, instead of creating future and callbacks per
+        step. Cancellation is propagated both ways.
+
+        Args:
+            executor: Executor to use when performing steps of the pipeline.
+        """
+        return Pipeline(self, executor)
+
     @classmethod
     def gather(cls, futures, *, return_exceptions=False, clb_executor=None):
         """Return a future aggregating results from the given futures.
@@ -316,9 +339,248 @@ class FutureBaseExt(FutureBase):
         return f
 
     @classmethod
-    def reduce(cls, futures, fun, initial, *, executor=None, clb_executor=None):
+    def as_completed(cls, futures, *, timeout=None, clb_executor=None):
+        """Returns an iterator over futures completing in the order in which
+        provided futures complete.
+
+        Every yielded future is set from the result of next provided future
+        to complete, so yielded futures are not members of provided sequence.
+        When timeout expires, yielded futures that are still pending and all
+        futures yielded after that fail with TimeoutError, unless some
+        provided future completed in the meantime. When iteration is stopped
+        early or times out, callbacks are removed from provided futures that
+        did not complete yet and yielded futures that are still pending are
+        cancelled.
+
+        Args:
+            futures: list of futures to iterate over.
+            timeout: The maximum number of seconds to wait, tracked by a
+            timer thread. If None, then there is no limit on the wait time.
+            clb_executor: default executor to use when running new futures' callbacks.
+        """
+        futures = list(map(cls.convert, futures))
+        cls.compatible(futures)
+        end_time = None if timeout is None else time.monotonic() + timeout
+
+        # Futures may complete on different threads than the one iterating
+        lock = Lock()
+        completed = collections.deque()
+        waiting = collections.deque()
+        timeout_message = None
+
+        def on_done(fut):
+            with lock:
+                if not waiting:
+                    completed.append(fut)
+                    return
+                f = waiting.popleft()
+            f.try_set_from(fut)
+
+        def remove_callbacks():
+            for fi in futures:
+                if not fi.done():
+                    fi.remove_done_callback(on_done)
+
+        def on_timeout():
+            nonlocal timeout_message
+            remove_callbacks()
+            with lock:
+                timeout_message = '%d (of %d) futures unfinished' % (
+                    sum(1 for fi in futures if not fi.done()), len(futures))
+                expired = list(waiting)
+                waiting.clear()
+            for f in expired:
+                f.try_set_exception(TimeoutError(timeout_message))
+
+        def iterate():
+            for fi in futures:
+                fi.add_done_callback(on_done)
+            timer = None
+            if end_time is not None:
+                timer = Timer(max(end_time - time.monotonic(), 0), on_timeout)
+                timer.daemon = True
+                timer.start()
+            try:
+                for _ in range(len(futures)):
+                    f = cls._new(clb_executor=clb_executor)
+                    with lock:
+                        fut = completed.popleft() if completed else None
+                        message = timeout_message
+                        if fut is None and message is None:
+                            waiting.append(f)
+                    if fut is not None:
+                        f.set_from(fut)
+                    elif message is not None:
+                        f.set_exception(TimeoutError(message))
+                    yield f
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                remove_callbacks()
+                with lock:
+                    pending = list(waiting)
+                    waiting.clear()
+                for f in pending:
+                    f.cancel()
+
+        return iterate()
+
+    @classmethod
+    def traverse(cls, iterable, fun, *, max_in_flight, ordered=True,
+                 on_result=None, clb_executor=None):
+        """Returns future which will be set with results of applying provided
+        function to every item of iterable, keeping at most ``max_in_flight``
+        futures returned by the function pending at a time.
+
+        Items are pulled from the iterable lazily, so it can be very large or
+        even infinite. Results are either gathered into a list or, when
+        ``on_result`` function is provided, passed to it one by one without
+        being retained, in which case returned future is set with None once
+        iterable is exhausted.
+
+        In case of any failure future will be failed with first exception to
+        occur, pending futures are cancelled and no more items are pulled.
+        Cancelling returned future has the same effect.
+
+        Args:
+            iterable: items to apply function to.
+            fun: function that accepts item and returns future.
+            max_in_flight: maximum number of pending futures. In ordered mode
+            this includes completed futures waiting for their predecessors.
+            ordered: deliver results in the order of items rather than in
+            the order of completion.
+            on_result: function receiving results instead of gathering them.
+            clb_executor: default executor to use when running new future's callbacks.
+        """
+        if on_result is None:
+            results = []
+            return cls._traverse(iterable, fun, max_in_flight, ordered,
+                                 results.append, lambda: results,
+                                 clb_executor=clb_executor)
+        return cls._traverse(iterable, fun, max_in_flight, ordered,
+                             on_result, lambda: None,
+                             clb_executor=clb_executor)
+
+    @classmethod
+    def _traverse(cls, iterable, fun, max_in_flight, ordered, on_result,
+                  get_result, *, cancel_pending=True, executor=None,
+                  clb_executor=None):
+        """Implements traverse(), passing every result to ``on_result`` and
+        setting the future from ``get_result()`` once iterable is exhausted.
+
+        Pending futures are cancelled when returned future is cancelled, and
+        also when it fails unless ``cancel_pending`` is False."""
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight should be positive')
+
+        f = cls._new(clb_executor=clb_executor)
+        items = iter(iterable)
+
+        # Completion events are processed by one thread at a time,
+        # the rest of the state is only accessed by that thread.
+        lock = Lock()
+        events = collections.deque()
+        draining = False
+
+        pending = {}
+        buffered = {}
+        next_index = 0
+        next_emit = 0
+        exhausted = False
+
+        def process(i, fut):
+            nonlocal next_emit
+            del pending[i]
+            if f.done():
+                # Mark exception retrieved
+                fut.cancelled() or fut.exception()
+                return
+            if fut.cancelled():
+                raise CancelledError()
+            result = fut.result()
+            if not ordered:
+                on_result(result)
+            else:
+                buffered[i] = result
+                while next_emit in buffered:
+                    on_result(buffered.pop(next_emit))
+                    next_emit += 1
+
+        def launch():
+            nonlocal next_index, exhausted
+            # Stops early when some future completes synchronously,
+            # so failures are noticed before more items are pulled
+            while len(pending) + len(buffered) < max_in_flight and not events:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    return
+                i = next_index
+                next_index += 1
+                fi = cls.convert(fun(item))
+                cls.compatible([f, fi])
+                pending[i] = fi
+                fi.add_done_callback(functools.partial(on_done, i),
+                                     executor=executor)
+
+        def step():
+            while events:
+                event = events.popleft()
+                if event is not None:
+                    process(*event)
+            if f.done():
+                if cancel_pending or f.cancelled():
+                    for fi in list(pending.values()):
+                        fi.cancel()
+                buffered.clear()
+                return
+            if not exhausted:
+                launch()
+            if exhausted and not pending and not buffered:
+                f.try_set_result(get_result())
+
+        def drain():
+            nonlocal draining
+            while True:
+                with lock:
+                    if draining or not events:
+                        return
+                    draining = True
+                try:
+                    step()
+                except Exception as ex:
+                    f.try_set_exception(ex)
+                    events.append(None)
+                finally:
+                    with lock:
+                        draining = False
+
+        def on_done(i, fut):
+            events.append((i, fut))
+            drain()
+
+        def backprop_cancel(fut):
+            if fut.cancelled():
+                events.append(None)
+                drain()
+
+        f.add_done_callback(backprop_cancel)
+        events.append(None)
+        drain()
+        return f
+
+    @classmethod
+    def reduce(cls, futures, fun, initial, *, ordered=True, executor=None,
+               clb_executor=None):
         """Returns future which will be set with reduced result of all provided futures.
-        In case of any failure future will be failed with first exception to occur.
+        In case of any failure future will be failed with first exception to occur,
+        other futures are left running.
+
+        Results are folded as soon as futures complete instead of all at once
+        in the end. In ordered mode only results completed ahead of their
+        predecessors are buffered, in unordered mode (for commutative
+        functions) no results are retained at all.
 
         Cancellation: if the outer Future is cancelled, all children that have not
         completed yet are also cancelled. If any child is cancelled, this is treated
@@ -329,18 +591,79 @@ class FutureBaseExt(FutureBase):
         Args:
             futures: list of futures to combine.
             fun: reduce-compatible function.
+            initial: initial value of accumulator.
+            ordered: fold results in the order of futures rather than in
+            the order of completion.
             executor: Executor to use when performing call to function.
             clb_executor: default executor to use when running new future's callbacks.
         """
-        return cls \
-            .gather(futures, clb_executor=clb_executor) \
-            .map(lambda results: functools.reduce(fun, results, initial), executor=executor)
+        futures = list(futures)
+        accumulator = initial
+
+        def fold(result):
+            nonlocal accumulator
+            accumulator = fun(accumulator, result)
+
+        return cls._traverse(futures, _identity, max(len(futures), 1), ordered,
+                             fold, lambda: accumulator, cancel_pending=False,
+                             executor=executor, clb_executor=clb_executor)
 
     @classmethod
     def _new(cls, other=None, *, clb_executor=None):
         executor = clb_executor or (other._executor if other else None)
         return cls(clb_executor=executor)
 
+    @classmethod
+    def _new_completed(cls, result, exception, other=None, *, clb_executor=None):
+        completed_cls = cls._completed_class()
+
+        # Only futures with default callback executor are shared, so that
+        # the cache does not keep other executors alive.
+        executor = Default.get_callback_executor()
+        shared = (exception is None and clb_executor is None and
+                  cls._share_completed and
+                  (other is None or other._executor is executor) and
+                  (result is None or result is True or result is False))
+        if shared:
+            key = (completed_cls, result)
+            f = _shared_completed.get(key)
+            if f is not None and f._executor is executor:
+                return f
+
+        f = super(CompletedFutureMixin, completed_cls)._new(other, clb_executor=clb_executor)
+        f._state = _FINISHED
+        f._result = result
+        f._exception = exception
+        if exception is not None:
+            f._ensure_exception_handled()
+        if shared:
+            _shared_completed[key] = f
+        return f
+
+    @classmethod
+    def _completed_from(cls, other, fun, *args, clb_executor=None, **kwargs):
+        try:
+            result = fun(*args, **kwargs)
+        except Exception as ex:
+            return cls._new_completed(None, ex, other, clb_executor=clb_executor)
+        return cls._new_completed(result, None, other, clb_executor=clb_executor)
+
+    @classmethod
+    def _completed_class(cls):
+        """Returns immutable completed future class derived from this one."""
+        if issubclass(cls, CompletedFutureMixin):
+            return cls
+        completed_cls = _completed_classes.get(cls)
+        if completed_cls is None:
+            completed_cls = type('Completed' + cls.__name__,
+                                 (CompletedFutureMixin, cls),
+                                 {'__slots__': (),
+                                  '_pending_class': cls,
+                                  '__module__': cls.__module__,
+                                  '__doc__': CompletedFutureMixin.__doc__})
+            _completed_classes[cls] = completed_cls
+        return completed_cls
+
     @classmethod
     def convert(cls, future):
         """Performs future type conversion.
@@ -362,5 +685,17 @@ class FutureBaseExt(FutureBase):
         pass
 
 
+# Completed future classes keyed by future class they were derived from
+_completed_classes = {}
+
+# Shared completed futures keyed by (class, result), holding only those
+# created for the current default callback executor
+_shared_completed = {}
+
+
 def _typename(cls):
     return cls.__module__ + '.' + cls.__name__
+
+
+def _identity(x):
+    return x
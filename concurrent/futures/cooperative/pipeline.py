@@ -0,0 +1,131 @@
+from .future_base import FutureBase
+import functools
+
+# Pipeline stage kinds
+_MAP = 'MAP'
+_RECOVER = 'RECOVER'
+_THEN = 'THEN'
+_FALLBACK = 'FALLBACK'
+
+
+class Pipeline:
+    """Builder of fused composition chains.
+
+    Chaining composition methods of a future creates intermediate future
+    and a couple of callbacks per every step. Pipeline instead collects
+    steps and runs them all in single callback of original future, setting
+    the result to single output future. Only ``then`` and ``fallback``
+    steps that actually start another future suspend the pipeline until
+    that future completes.
+
+    Cancellation is propagated both ways - cancelling output future cancels
+    original future (and the future pipeline currently waits for).
+
+    Usage:
+
+        f = fut.pipe().map(parse).recover(default).then(store).build()
+    """
+
+    __slots__ = ('_future', '_executor', '_stages')
+
+    def __init__(self, future, executor=None):
+        """Initializes pipeline.
+
+        Args:
+            future: future to take result from.
+            executor: Executor to use when running pipeline steps.
+        """
+        self._future = future
+        self._executor = executor
+        self._stages = []
+
+    def map(self, fun_res):
+        """Adds step applying function to the result, see FutureBaseExt.map()."""
+        assert callable(fun_res), "Pipeline.map expects callable"
+        self._stages.append((_MAP, fun_res))
+        return self
+
+    def recover(self, fun_ex_or_value):
+        """Adds step handling the failure, see FutureBaseExt.recover()."""
+        self._stages.append((_RECOVER, fun_ex_or_value))
+        return self
+
+    def then(self, future_fun):
+        """Adds step chaining another future, see FutureBaseExt.then()."""
+        assert callable(future_fun) or isinstance(future_fun, FutureBase), "Pipeline.then expects callable or Future"
+        self._stages.append((_THEN, future_fun))
+        return self
+
+    def fallback(self, future_fun):
+        """Adds step falling back to another future, see FutureBaseExt.fallback()."""
+        assert callable(future_fun) or isinstance(future_fun, FutureBase), "Pipeline.fallback expects callable or Future"
+        self._stages.append((_FALLBACK, future_fun))
+        return self
+
+    def build(self):
+        """Returns future that will be set from result of all pipeline steps.
+
+        New future inherits default callback executor from original future.
+        """
+        source = self._future
+        executor = self._executor
+        stages = tuple(self._stages)
+        f = source._new(source)
+        waiting = None
+
+        def run(start, fut):
+            nonlocal waiting
+            waiting = None
+            if f.done():
+                return
+            if fut.cancelled():
+                f.cancel()
+                return
+
+            exception = fut.exception()
+            result = fut.result() if exception is None else None
+
+            for i in range(start, len(stages)):
+                kind, fun = stages[i]
+                if kind is _MAP:
+                    if exception is None:
+                        try:
+                            result = fun(result)
+                        except Exception as ex:
+                            exception = ex
+                elif kind is _RECOVER:
+                    if exception is not None:
+                        if callable(fun):
+                            try:
+                                result, exception = fun(exception), None
+                            except Exception as ex:
+                                exception = ex
+                        else:
+                            result, exception = fun, None
+                elif (exception is None) == (kind is _THEN):
+                    try:
+                        f2_raw = fun if isinstance(fun, FutureBase) else fun()
+                        f2 = source.convert(f2_raw)
+                        source.compatible([source, f2])
+                    except Exception as ex:
+                        exception = ex
+                    else:
+                        waiting = f2
+                        f2.add_done_callback(functools.partial(run, i + 1),
+                                             executor=executor)
+                        return
+
+            if exception is not None:
+                f.set_exception(exception)
+            else:
+                f.set_result(result)
+
+        def backprop_cancel(fut):
+            if fut.cancelled():
+                source.cancel()
+                if waiting is not None:
+                    waiting.cancel()
+
+        source.add_done_callback(functools.partial(run, 0), executor=executor)
+        f.add_done_callback(backprop_cancel)
+        return f
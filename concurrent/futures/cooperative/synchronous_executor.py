@@ -1,4 +1,5 @@
 from ..config import Default
+import threading
 
 
 class SynchronousExecutor(object):
@@ -11,3 +12,47 @@ class SynchronousExecutor(object):
 
 # alias
 Synchronous = SynchronousExecutor()
+
+
+class TrampoliningExecutor(SynchronousExecutor):
+    """Synchronous executor that does not grow the stack on nested calls.
+
+    Callbacks scheduled while another callback is running in the same thread
+    are queued and run after it returns, so completing long chains of
+    futures does not recurse once per link. Callbacks still run in the same
+    order as with SynchronousExecutor: the ones scheduled by a callback run
+    right after it, before the rest of the callbacks scheduled earlier.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def __call__(self, fn, *args, **kwargs):
+        local = self._local
+        batch = getattr(local, 'batch', None)
+        if batch is not None:
+            batch.append((fn, args, kwargs))
+            return
+
+        local.batch = batch = []
+        try:
+            super().__call__(fn, *args, **kwargs)
+            stack = []
+            while True:
+                if batch:
+                    stack.append(iter(batch))
+                    local.batch = batch = []
+                if not stack:
+                    break
+                item = next(stack[-1], None)
+                if item is None:
+                    stack.pop()
+                else:
+                    fn, args, kwargs = item
+                    super().__call__(fn, *args, **kwargs)
+        finally:
+            local.batch = None
+
+
+# alias
+Trampolining = TrampoliningExecutor()
@@ -1,11 +1,21 @@
 from concurrent.futures.cooperative.future_base import _PENDING, _CANCELLED
 from concurrent.futures.cooperative.future_extensions import FutureBaseExt
 from concurrent.futures.cooperative.future import Future as FutureCoop
+from concurrent.futures.cooperative.synchronous_executor import Synchronous
 from ..exceptions import InvalidStateError, TimeoutError
-from threading import Condition
+from threading import Lock
+import contextlib
 
 
 class Future(FutureBaseExt):
+    # State changes and callback registration are guarded by a lightweight
+    # per-future lock, while done(), cancelled(), and result() or
+    # exception() of completed future read the state without locking.
+    # Threads blocking on the future get their own wait lock, released
+    # by the thread which completes the future, so waiting primitives are
+    # only allocated for futures somebody actually waits for.
+    __slots__ = ('_mutex', '_waiters')
+
     def __init__(self, *, clb_executor=None):
         """Initialize the future.
 
@@ -14,7 +24,8 @@ class Future(FutureBaseExt):
         If it's not provided, the future uses the default executor.
         """
         super().__init__(clb_executor=clb_executor)
-        self._mutex = Condition()
+        self._mutex = Lock()
+        self._waiters = None
 
     def add_done_callback(self, fun_res, *, executor=None):
         """Add a callback to be run when the future becomes done.
@@ -23,8 +34,13 @@ class Future(FutureBaseExt):
         the future is already done when this is called, the callback is
         scheduled with call_soon.
         """
-        with self._mutex:
-            super().add_done_callback(fun_res, executor=executor)
+        if self._state == _PENDING:
+            with self._mutex:
+                if self._state == _PENDING:
+                    super().add_done_callback(fun_res, executor=executor)
+                    return
+        # Already done - callback is run outside of the mutex
+        super().add_done_callback(fun_res, executor=executor)
 
     def remove_done_callback(self, fn):
         """Remove all instances of a callback from the "call when done" list.
@@ -34,16 +50,6 @@ class Future(FutureBaseExt):
         with self._mutex:
             return super().remove_done_callback(fn)
 
-    def done(self):
-        """Returns True if future is completed or cancelled."""
-        with self._mutex:
-            return super().done()
-
-    def cancelled(self):
-        """Returns True if the future cancellation was requested."""
-        with self._mutex:
-            return super().cancelled()
-
     def wait(self, timeout=None):
         """Blocking wait for future to complete.
         If the future has not yet been completed this method blocks for
@@ -52,10 +58,29 @@ class Future(FutureBaseExt):
 
         Returns True if future is completed.
         """
+        if self._state != _PENDING:
+            return True
+
         with self._mutex:
-            if self._state == _PENDING:
-                self._mutex.wait(timeout)
-            return self._state != _PENDING
+            if self._state != _PENDING:
+                return True
+            waiter = Lock()
+            waiter.acquire()
+            if self._waiters is None:
+                self._waiters = [waiter]
+            else:
+                self._waiters.append(waiter)
+
+        if timeout is None:
+            signaled = waiter.acquire()
+        else:
+            signaled = waiter.acquire(True, max(timeout, 0))
+
+        if not signaled:
+            with self._mutex:
+                if self._waiters is not None and waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        return self._state != _PENDING
 
     def result(self, *, timeout=None):
         """Return the result this future represents.
@@ -68,15 +93,8 @@ class Future(FutureBaseExt):
         If the future does not complete in specified time frame, raises TimeoutError.
         If the future is done and has an exception set, this exception is raised.
         """
-        with self._mutex:
-            if self._state == _PENDING:
-                if timeout is None:
-                    raise InvalidStateError('Result is not ready.')
-                else:
-                    self._mutex.wait(timeout)
-            if self._state == _PENDING:
-                raise TimeoutError("Future waiting timeout reached")
-            return super().result()
+        self._wait_done(timeout)
+        return super().result()
 
     def exception(self, *, timeout=None):
         """Return the exception that was set to this future.
@@ -89,15 +107,8 @@ class Future(FutureBaseExt):
         If the future does not complete in specified time frame,
         raises TimeoutError.
         """
-        with self._mutex:
-            if self._state == _PENDING:
-                if timeout is None:
-                    raise InvalidStateError('Result is not ready.')
-                else:
-                    self._mutex.wait(timeout)
-            if self._state == _PENDING:
-                raise TimeoutError("Future waiting timeout reached")
-            return super().exception()
+        self._wait_done(timeout)
+        return super().exception()
 
     def cancel(self):
         """Requests cancellation of future.
@@ -105,18 +116,70 @@ class Future(FutureBaseExt):
         Returns:
             True if future was not yet completed or cancelled.
         """
+        if self._state != _PENDING:
+            return False
+        return self._complete(_CANCELLED, None, None)
+
+    def _try_set_state(self, state, result, exception):
+        if self._state == _CANCELLED:
+            return True
+        return self._complete(state, result, exception) or self._state == _CANCELLED
+
+    def _complete(self, state, result, exception):
+        """Transitions pending future into final state.
+
+        Only state change and detaching of callbacks and waiters happen under
+        the mutex, so slow callbacks do not block other threads accessing the
+        future and callbacks touching other futures can't deadlock on it.
+
+        Returns False if future is already done.
+        """
         with self._mutex:
             if self._state != _PENDING:
                 return False
-            return super()._try_set_state(_CANCELLED, None, None)
+            self._set_state(state, result, exception)
+            callbacks = self._pop_callbacks()
+            waiters = self._waiters
+            self._waiters = None
+
+        self._run_callbacks(*callbacks)
+        if waiters is not None:
+            for waiter in waiters:
+                waiter.release()
+        return True
+
+    def _wait_done(self, timeout):
+        if self._state != _PENDING:
+            return
+        if timeout is None:
+            raise InvalidStateError('Result is not ready.')
+        if not self.wait(timeout):
+            raise TimeoutError("Future waiting timeout reached")
 
-    def _try_set_state(self, state, result, exception):
-        with self._mutex:
-            return super()._try_set_state(state, result, exception)
+    @classmethod
+    def as_completed(cls, futures, *, timeout=None, clb_executor=None):
+        """An iterator over the given futures that yields each as it completes.
+
+        Behaves as ``FutureBaseExt.as_completed()``, yielding futures set
+        from the result of next provided future to complete, but blocks
+        until the yielded future is done.
+
+        Args:
+            futures: list of futures to iterate over.
+            timeout: The maximum number of seconds to wait. If None, then there
+            is no limit on the wait time.
+            clb_executor: default executor to use when running new futures' callbacks.
+        """
+        completed = super().as_completed(futures, timeout=timeout,
+                                         clb_executor=clb_executor)
+
+        def iterate():
+            with contextlib.closing(completed):
+                for f in completed:
+                    f.wait()
+                    yield f
 
-    def _on_result_set(self):
-        super()._on_result_set()
-        self._mutex.notify_all()
+        return iterate()
 
     @classmethod
     def convert(cls, future):
@@ -1,3 +1,5 @@
+import collections
+import itertools
 import time
 
 
@@ -15,7 +17,7 @@ class Executor(object):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None):
+    def map(self, fn, *iterables, timeout=None, max_in_flight=None):
         """Returns a iterator equivalent to map(fn, iter).
 
         Args:
@@ -23,6 +25,9 @@ class Executor(object):
                 passed iterables.
             timeout: The maximum number of seconds to wait. If None, then there
                 is no limit on the wait time.
+            max_in_flight: The maximum number of calls submitted ahead of the
+                results consumed from the iterator. If None, then all calls
+                are submitted at once, so iterables should be finite.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -36,17 +41,28 @@ class Executor(object):
         if timeout is not None:
             end_time = timeout + time.time()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError('max_in_flight should be positive')
+
+        args_iter = zip(*iterables)
+        fs = collections.deque(
+            self.submit(fn, *args)
+            for args in itertools.islice(args_iter, max_in_flight))
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
         def result_iterator():
             try:
-                for future in fs:
+                while fs:
+                    future = fs.popleft()
                     if timeout is None:
-                        yield future.result()
+                        future.wait()
+                        result = future.result()
                     else:
-                        yield future.result(end_time - time.time())
+                        result = future.result(timeout=end_time - time.time())
+                    for args in itertools.islice(args_iter, 1):
+                        fs.append(self.submit(fn, *args))
+                    yield result
             finally:
                 for future in fs:
                     future.cancel()
@@ -1,131 +1,48 @@
 from concurrent.futures.multithreaded import Future
+from concurrent.futures.cooperative.synchronous_executor import Synchronous
+from concurrent.futures.exceptions import TimeoutError
+import collections
+import threading
+import time
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
 ALL_COMPLETED = 'ALL_COMPLETED'
-_AS_COMPLETED = '_AS_COMPLETED'
 
-'''
-class _Waiter(object):
-    """Provides the event that wait() and as_completed() block on."""
-    def __init__(self):
-        self.event = threading.Event()
-        self.finished_futures = []
-
-    def add_result(self, future):
-        self.finished_futures.append(future)
-
-    def add_exception(self, future):
-        self.finished_futures.append(future)
-
-    def add_cancelled(self, future):
-        self.finished_futures.append(future)
-
-class _AsCompletedWaiter(_Waiter):
-    """Used by as_completed()."""
-
-    def __init__(self):
-        super(_AsCompletedWaiter, self).__init__()
-        self.lock = threading.Lock()
-
-    def add_result(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_result(future)
-            self.event.set()
-
-    def add_exception(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_exception(future)
-            self.event.set()
-
-    def add_cancelled(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_cancelled(future)
-            self.event.set()
-
-
-class _FirstCompletedWaiter(_Waiter):
-    """Used by wait(return_when=FIRST_COMPLETED)."""
+DoneAndNotDoneFutures = collections.namedtuple(
+    'DoneAndNotDoneFutures', 'done not_done')
 
-    def add_result(self, future):
-        super().add_result(future)
-        self.event.set()
 
-    def add_exception(self, future):
-        super().add_exception(future)
-        self.event.set()
+def _failed(future):
+    # Unlike exception() this does not mark the failure as handled, so an
+    # exception nobody retrieves after wait() still gets logged.
+    return future._exception is not None
 
-    def add_cancelled(self, future):
-        super().add_cancelled(future)
-        self.event.set()
 
+class _CountdownLatch(object):
+    """Done-callback that wait() blocks on.
 
-class _AllCompletedWaiter(_Waiter):
-    """Used by wait(return_when=FIRST_EXCEPTION and ALL_COMPLETED)."""
+    Single latch is subscribed to all waited futures, so waiting costs one
+    callback per future and never holds locks of multiple futures at once.
+    """
 
-    def __init__(self, num_pending_calls, stop_on_exception):
-        self.num_pending_calls = num_pending_calls
-        self.stop_on_exception = stop_on_exception
+    def __init__(self, count, return_when):
+        self.event = threading.Event()
         self.lock = threading.Lock()
-        super().__init__()
-
-    def _decrement_pending_calls(self):
-        with self.lock:
-            self.num_pending_calls -= 1
-            if not self.num_pending_calls:
-                self.event.set()
+        self.count = count
+        self.return_when = return_when
 
-    def add_result(self, future):
-        super().add_result(future)
-        self._decrement_pending_calls()
-
-    def add_exception(self, future):
-        super().add_exception(future)
-        if self.stop_on_exception:
+    def __call__(self, future):
+        if self.return_when == FIRST_COMPLETED:
+            self.event.set()
+        elif self.return_when == FIRST_EXCEPTION and _failed(future):
             self.event.set()
         else:
-            self._decrement_pending_calls()
-
-    def add_cancelled(self, future):
-        super().add_cancelled(future)
-        self._decrement_pending_calls()
-
-
-class _AcquireFutures(object):
-    """A context manager that does an ordered acquire of Future conditions."""
-
-    def __init__(self, futures):
-        self.futures = sorted(futures, key=id)
-
-    def __enter__(self):
-        for future in self.futures:
-            future._condition.acquire()
-
-    def __exit__(self, *args):
-        for future in self.futures:
-            future._condition.release()
-
-
-def _create_and_install_waiters(fs, return_when):
-    if return_when == _AS_COMPLETED:
-        waiter = _AsCompletedWaiter()
-    elif return_when == FIRST_COMPLETED:
-        waiter = _FirstCompletedWaiter()
-    else:
-        pending_count = sum(
-            f._state not in [CANCELLED_AND_NOTIFIED, FINISHED] for f in fs)
-
-        if return_when == FIRST_EXCEPTION:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=True)
-        elif return_when == ALL_COMPLETED:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=False)
-        else:
-            raise ValueError("Invalid return condition: %r" % return_when)
-
-    for f in fs:
-        f._waiters.append(waiter)
+            with self.lock:
+                self.count -= 1
+                if not self.count:
+                    self.event.set()
 
-    return waiter
 
 def as_completed(fs, timeout=None):
     """An iterator over the given futures that yields each as it completes.
@@ -144,46 +61,45 @@ def as_completed(fs, timeout=None):
         TimeoutError: If the entire result iterator could not be generated
             before the given timeout.
     """
-    if timeout is not None:
-        end_time = timeout + time.time()
+    fs = list(map(Future.convert, fs))
+    end_time = None if timeout is None else time.monotonic() + timeout
 
-    with _AcquireFutures(fs):
-        finished = set(
-            f for f in fs
-            if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        pending = set(fs) - finished
-        waiter = _create_and_install_waiters(fs, _AS_COMPLETED)
+    # Futures are delivered through single completion queue fed by their
+    # callbacks, and callbacks are removed from futures that did not
+    # complete when iteration is stopped early.
+    completed = collections.deque()
+    condition = threading.Condition(threading.Lock())
 
-    try:
-        yield from finished
+    def on_done(future):
+        with condition:
+            completed.append(future)
+            condition.notify()
 
-        while pending:
-            if timeout is None:
-                wait_timeout = None
-            else:
-                wait_timeout = end_time - time.time()
-                if wait_timeout < 0:
-                    raise TimeoutError(
-                        '%d (of %d) futures unfinished' % (
-                            len(pending), len(fs)))
-
-            waiter.event.wait(wait_timeout)
-
-            with waiter.lock:
-                finished = waiter.finished_futures
-                waiter.finished_futures = []
-                waiter.event.clear()
-
-            for future in finished:
-                yield future
-                pending.remove(future)
-
-    finally:
+    def iterate():
         for f in fs:
-            f._waiters.remove(waiter)
+            f.add_done_callback(on_done, executor=Synchronous)
+        try:
+            for yielded in range(len(fs)):
+                with condition:
+                    while not completed:
+                        wait_timeout = None
+                        if end_time is not None:
+                            wait_timeout = end_time - time.monotonic()
+                            if wait_timeout <= 0:
+                                raise TimeoutError(
+                                    '%d (of %d) futures unfinished' % (
+                                        len(fs) - yielded, len(fs)))
+                        condition.wait(wait_timeout)
+                    f = completed.popleft()
+                yield f
+        finally:
+            for f in fs:
+                if not f.done():
+                    f.remove_done_callback(on_done)
+
+    return iterate()
+
 
-DoneAndNotDoneFutures = collections.namedtuple(
-    'DoneAndNotDoneFutures', 'done not_done')
 def wait(fs, timeout=None, return_when=ALL_COMPLETED):
     """Wait for the futures in the given sequence to complete.
 
@@ -208,74 +124,31 @@ def wait(fs, timeout=None, return_when=ALL_COMPLETED):
         completed. The second set, named 'not_done', contains uncompleted
         futures.
     """
-    with _AcquireFutures(fs):
-        done = set(f for f in fs
-                   if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        not_done = set(fs) - done
+    if return_when not in (FIRST_COMPLETED, FIRST_EXCEPTION, ALL_COMPLETED):
+        raise ValueError("Invalid return condition: %r" % return_when)
 
-        if (return_when == FIRST_COMPLETED) and done:
-            return DoneAndNotDoneFutures(done, not_done)
-        elif (return_when == FIRST_EXCEPTION) and done:
-            if any(f for f in done
-                   if not f.cancelled() and f.exception() is not None):
-                return DoneAndNotDoneFutures(done, not_done)
+    fs = set(fs)
+    done = set(f for f in fs if f.done())
+    not_done = fs - done
 
-        if len(done) == len(fs):
+    if (return_when == FIRST_COMPLETED) and done:
+        return DoneAndNotDoneFutures(done, not_done)
+    elif (return_when == FIRST_EXCEPTION) and done:
+        if any(_failed(f) for f in done):
             return DoneAndNotDoneFutures(done, not_done)
 
-        waiter = _create_and_install_waiters(fs, return_when)
-
-    waiter.event.wait(timeout)
-    for f in fs:
-        f._waiters.remove(waiter)
-
-    done.update(waiter.finished_futures)
-    return DoneAndNotDoneFutures(done, set(fs) - done)
-'''
+    if not not_done:
+        return DoneAndNotDoneFutures(done, not_done)
 
+    latch = _CountdownLatch(len(not_done), return_when)
+    for f in not_done:
+        f.add_done_callback(latch, executor=Synchronous)
 
-def as_completed(fs, timeout=None):
-    """An iterator over the given futures that yields each as it completes.
-
-    Args:
-        fs: The sequence of Futures (possibly created by different Executors) to
-            iterate over.
-        timeout: The maximum number of seconds to wait. If None, then there
-            is no limit on the wait time.
-
-    Returns:
-        An iterator that yields the given Futures as they complete (finished or
-        cancelled).
-
-    Raises:
-        TimeoutError: If the entire result iterator could not be generated
-            before the given timeout.
-    """
-    raise NotImplemented
+    latch.event.wait(timeout)
 
-
-def wait(fs, timeout=None, return_when=ALL_COMPLETED):
-    """Wait for the futures in the given sequence to complete.
-
-    Args:
-        fs: The sequence of Futures (possibly created by different Executors) to
-            wait upon.
-        timeout: The maximum number of seconds to wait. If None, then there
-            is no limit on the wait time.
-        return_when: Indicates when this function should return. The options
-            are:
-
-            FIRST_COMPLETED - Return when any future finishes or is
-                              cancelled.
-            FIRST_EXCEPTION - Return when any future finishes by raising an
-                              exception. If no future raises an exception
-                              then it is equivalent to ALL_COMPLETED.
-            ALL_COMPLETED -   Return when all futures finish or are cancelled.
-
-    Returns:
-        A named 2-tuple of sets. The first set, named 'done', contains the
-        futures that completed (is finished or cancelled) before the wait
-        completed. The second set, named 'not_done', contains uncompleted
-        futures.
-    """
-    raise NotImplemented
\ No newline at end of file
+    for f in not_done:
+        if f.done():
+            done.add(f)
+        else:
+            f.remove_done_callback(latch)
+    return DoneAndNotDoneFutures(done, fs - done)
\ No newline at end of file
@@ -0,0 +1,98 @@
+import asyncio
+import unittest
+from .test_base import LoopTestBase
+
+
+class AsCompletedTest(LoopTestBase):
+    def collect(self, fs, **kwargs):
+        @asyncio.coroutine
+        def consume():
+            results = []
+            for f in asyncio.as_completed(fs, loop=self.loop, **kwargs):
+                try:
+                    results.append((yield from f))
+                except Exception as ex:
+                    results.append(type(ex))
+            return results
+
+        return self.loop.run_until_complete(consume())
+
+    def test_completion_order(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(4)]
+        for delay, i in enumerate((2, 0, 3, 1)):
+            self.loop.call_later(0.001 * delay, fs[i].set_result, i)
+        self.assertListEqual([2, 0, 3, 1], self.collect(fs))
+
+    def test_done_futures_in_given_order(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(20)]
+        for i, f in enumerate(fs):
+            f.set_result(i)
+        self.assertListEqual(list(range(20)), self.collect(fs))
+
+    def test_exception(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(2)]
+        fs[0].set_exception(ValueError())
+        self.loop.call_later(0.001, fs[1].set_result, 1)
+        self.assertListEqual([ValueError, 1], self.collect(fs))
+
+    def test_duplicates_and_coroutines(self):
+        f = asyncio.Future(loop=self.loop)
+        f.set_result(1)
+
+        @asyncio.coroutine
+        def coro():
+            return 2
+
+        self.assertListEqual([1, 2], sorted(self.collect([f, f, coro()])))
+
+    def test_empty(self):
+        self.assertListEqual([], self.collect([]))
+
+    def test_timeout(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(3)]
+        fs[0].set_result(0)
+        self.assertListEqual([0, asyncio.TimeoutError, asyncio.TimeoutError],
+                             self.collect(fs, timeout=0.01))
+        for f in fs[1:]:
+            self.assertFalse(f._callback or f._callbacks)
+
+    def test_timeout_cancelled_when_all_done(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(2)]
+        for i, f in enumerate(fs):
+            self.loop.call_soon(f.set_result, i)
+        self.assertListEqual([0, 1], self.collect(fs, timeout=10))
+        self.assertEqual(0, self.loop.get_timer_stats()['live_timers'])
+
+    def test_one_callback_per_future(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(3)]
+        it = asyncio.as_completed(fs, loop=self.loop)
+        first = next(it)
+        for f in fs:
+            self.assertIsNotNone(f._callback)
+            self.assertIsNone(f._callbacks)
+        for i, f in enumerate(fs):
+            f.set_result(i)
+        waiters = [first] + list(it)
+        self.assertListEqual([0, 1, 2], self.loop.run_until_complete(
+            asyncio.gather(*waiters, loop=self.loop)))
+
+    def test_concurrent_waiters(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(3)]
+        waiters = list(asyncio.as_completed(fs, loop=self.loop))
+        g = asyncio.gather(*waiters, loop=self.loop)
+        for i, f in enumerate(fs):
+            self.loop.call_later(0.001 * (i + 1), f.set_result, i)
+        self.assertListEqual([0, 1, 2], self.loop.run_until_complete(g))
+
+    def test_cancelled_waiter(self):
+        fs = [asyncio.Future(loop=self.loop) for _ in range(2)]
+        first, second = [asyncio.async(w, loop=self.loop) for w in
+                         asyncio.as_completed(fs, loop=self.loop)]
+        self.loop.call_soon(first.cancel)
+        self.loop.call_later(0.001, fs[0].set_result, 0)
+        self.assertEqual(0, self.loop.run_until_complete(second))
+        self.assertTrue(first.cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()
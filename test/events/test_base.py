@@ -0,0 +1,17 @@
+from asyncio import test_utils
+import asyncio
+import unittest
+
+
+class LoopTestBase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_once(self):
+        test_utils.run_once(self.loop)
+
+    def run_coro(self, coro):
+        return self.loop.run_until_complete(coro)
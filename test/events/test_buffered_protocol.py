@@ -0,0 +1,76 @@
+import asyncio
+import socket
+import unittest
+from .test_base import LoopTestBase
+
+
+class RecordingProtocol(asyncio.BufferedProtocol):
+    def __init__(self, loop):
+        self.buffer = bytearray(5)
+        self.received = bytearray()
+        self.sizehints = []
+        self.done = asyncio.Future(loop=loop)
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        self.sizehints.append(sizehint)
+        return self.buffer
+
+    def buffer_updated(self, nbytes):
+        self.received += self.buffer[:nbytes]
+
+    def eof_received(self):
+        self.done.set_result(bytes(self.received))
+
+
+class BufferedProtocolTest(LoopTestBase):
+    def test_socket_transport_receives_into_buffer(self):
+        rsock, wsock = socket.socketpair()
+        protocol = RecordingProtocol(self.loop)
+        transport, _ = self.loop.run_until_complete(
+            self.loop.create_connection(lambda: protocol, sock=rsock))
+        wsock.sendall(b'0123456789abc')
+        wsock.close()
+        self.assertEqual(b'0123456789abc',
+                         self.loop.run_until_complete(protocol.done))
+        self.assertGreaterEqual(len(protocol.sizehints), 3)
+        self.assertEqual(transport.max_size, protocol.sizehints[0])
+        transport.close()
+        self.loop.run_until_complete(asyncio.sleep(0, loop=self.loop))
+
+    def test_stream_reader_protocol(self):
+        rsock, wsock = socket.socketpair()
+        reader, writer = self.loop.run_until_complete(
+            asyncio.open_connection(sock=rsock, loop=self.loop))
+        self.assertIsInstance(reader._transport._protocol,
+                              asyncio.BufferedProtocol)
+        wsock.sendall(b'line1\nline2\n')
+        wsock.close()
+        self.assertEqual(b'line1\n',
+                         self.loop.run_until_complete(reader.readline()))
+        self.assertEqual(b'line2\n',
+                         self.loop.run_until_complete(reader.read()))
+        writer.close()
+        self.loop.run_until_complete(asyncio.sleep(0, loop=self.loop))
+
+    def test_stream_reader_buffer(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'abc')
+        view = stream._get_buffer(100)
+        self.assertGreaterEqual(len(view), 100)
+        view[:3] = b'def'
+        # Room may be requested again without any data received
+        del view
+        view = stream._get_buffer(100)
+        view[:3] = b'ghi'
+        del view
+        stream._buffer_updated(3)
+        self.assertEqual(6, stream._buffered())
+        self.assertEqual(b'abcghi',
+                         self.loop.run_until_complete(stream.read(10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import asyncio
+from asyncio import tasks
+import gc
+import unittest
+from unittest import mock
+from .test_base import LoopTestBase
+
+
+@asyncio.coroutine
+def gen_coro():
+    """Generator coroutine."""
+    yield from ()
+    return 1
+
+
+@asyncio.coroutine
+def plain_coro():
+    """Plain function coroutine."""
+    return 2
+
+
+class CoroutineDebugTest(LoopTestBase):
+    def tearDown(self):
+        asyncio.set_coroutine_debug(0)
+        super().tearDown()
+
+    def test_disabled_by_default(self):
+        self.assertEqual(0, asyncio.get_coroutine_debug())
+        self.assertNotIsInstance(gen_coro(), tasks.CoroWrapper)
+        self.assertNotIsInstance(plain_coro(), tasks.CoroWrapper)
+
+    def test_decorator_keeps_function_attributes(self):
+        for func, name, doc in (
+                (gen_coro, 'gen_coro', 'Generator coroutine.'),
+                (plain_coro, 'plain_coro', 'Plain function coroutine.')):
+            self.assertTrue(tasks.iscoroutinefunction(func))
+            self.assertEqual(name, func.__name__)
+            self.assertEqual(name, func.__qualname__)
+            self.assertEqual(__name__, func.__module__)
+            self.assertEqual(doc, func.__doc__)
+
+    def test_sample_rate(self):
+        asyncio.set_coroutine_debug(0.25)
+        self.assertEqual(0.25, asyncio.get_coroutine_debug())
+        coros = [gen_coro() for _ in range(8)]
+        wrapped = [c for c in coros if isinstance(c, tasks.CoroWrapper)]
+        self.assertEqual(2, len(wrapped))
+        for c in coros:
+            self.assertTrue(tasks.iscoroutine(c))
+            self.assertEqual(1, self.loop.run_until_complete(c))
+
+        asyncio.set_coroutine_debug(0)
+        self.assertNotIsInstance(gen_coro(), tasks.CoroWrapper)
+
+        self.assertRaises(ValueError, asyncio.set_coroutine_debug, -1)
+
+    def test_coroutine_names(self):
+        for sample_rate in (0, 0.5):
+            asyncio.set_coroutine_debug(sample_rate)
+            for _ in range(2):
+                coro = plain_coro()
+                self.assertEqual('plain_coro', coro.__name__)
+                self.assertEqual('plain_coro', tasks._coroutine_name(coro))
+                self.assertEqual(2, self.loop.run_until_complete(coro))
+
+    def test_wrapper(self):
+        asyncio.set_coroutine_debug(1)
+        coro = plain_coro()
+        self.assertIsInstance(coro, tasks.CoroWrapper)
+        self.assertFalse(hasattr(coro, '__dict__'))
+        self.assertEqual('plain_coro', coro.__name__)
+        t = asyncio.Task(coro, loop=self.loop)
+        self.assertEqual(2, self.loop.run_until_complete(t))
+
+    def test_never_yielded_from_logs_creation_stack(self):
+        asyncio.set_coroutine_debug(1)
+        with mock.patch('asyncio.tasks.logger') as logger:
+            coro = gen_coro()
+            del coro
+            gc.collect()
+        self.assertTrue(logger.error.called)
+        message = logger.error.call_args[0][0] % logger.error.call_args[0][1:]
+        self.assertIn("'gen_coro'", message)
+        self.assertIn('test_never_yielded_from_logs_creation_stack', message)
+
+    def test_yielded_from_does_not_log(self):
+        asyncio.set_coroutine_debug(1)
+        with mock.patch('asyncio.tasks.logger') as logger:
+            self.loop.run_until_complete(gen_coro())
+            gc.collect()
+        self.assertFalse(logger.error.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import asyncio
+import unittest
+from .test_base import LoopTestBase
+
+
+class EagerTaskTest(LoopTestBase):
+    def test_completes_without_loop(self):
+        @asyncio.coroutine
+        def coro():
+            return 42
+
+        t = asyncio.Task(coro(), loop=self.loop, eager=True)
+        self.assertTrue(t.done())
+        self.assertEqual(42, t.result())
+
+    def test_runs_until_first_suspension(self):
+        calls = []
+
+        @asyncio.coroutine
+        def coro():
+            calls.append(1)
+            yield from asyncio.sleep(0, loop=self.loop)
+            calls.append(2)
+            return 'x'
+
+        t = asyncio.async(coro(), loop=self.loop, eager=True)
+        self.assertListEqual([1], calls)
+        self.assertFalse(t.done())
+        self.assertEqual('x', self.loop.run_until_complete(t))
+        self.assertListEqual([1, 2], calls)
+
+    def test_lazy_by_default(self):
+        calls = []
+
+        @asyncio.coroutine
+        def coro():
+            calls.append(1)
+
+        t = asyncio.async(coro(), loop=self.loop)
+        self.assertListEqual([], calls)
+        self.loop.run_until_complete(t)
+        self.assertListEqual([1], calls)
+
+    def test_exception(self):
+        @asyncio.coroutine
+        def coro():
+            raise ValueError()
+
+        t = asyncio.Task(coro(), loop=self.loop, eager=True)
+        self.assertIsInstance(t.exception(), ValueError)
+
+    def test_waits_on_pending_future(self):
+        f = asyncio.Future(loop=self.loop)
+
+        @asyncio.coroutine
+        def coro():
+            return (yield from f)
+
+        t = asyncio.Task(coro(), loop=self.loop, eager=True)
+        self.assertFalse(t.done())
+        f.set_result(5)
+        self.assertEqual(5, self.loop.run_until_complete(t))
+
+    def test_cancel_suspended(self):
+        f = asyncio.Future(loop=self.loop)
+
+        @asyncio.coroutine
+        def coro():
+            yield from f
+
+        t = asyncio.Task(coro(), loop=self.loop, eager=True)
+        self.assertTrue(t.cancel())
+        self.assertRaises(asyncio.CancelledError,
+                          self.loop.run_until_complete, t)
+        self.assertTrue(f.cancelled())
+
+    def test_gather_done_synchronously(self):
+        @asyncio.coroutine
+        def coro(x):
+            return x
+
+        g = asyncio.gather(*[coro(i) for i in range(5)],
+                           loop=self.loop, eager=True)
+        self.assertTrue(g.done())
+        self.assertListEqual(list(range(5)), g.result())
+
+    def test_gather_mixed(self):
+        @asyncio.coroutine
+        def coro(x):
+            if x % 2:
+                yield from asyncio.sleep(0, loop=self.loop)
+            return x
+
+        g = asyncio.gather(*[coro(i) for i in range(5)],
+                           loop=self.loop, eager=True)
+        self.assertFalse(g.done())
+        self.assertListEqual(list(range(5)),
+                             self.loop.run_until_complete(g))
+
+    def test_gather_exception(self):
+        @asyncio.coroutine
+        def coro(x):
+            if x == 1:
+                raise ValueError()
+            return x
+
+        g = asyncio.gather(*[coro(i) for i in range(3)],
+                           loop=self.loop, eager=True)
+        self.assertIsInstance(g.exception(), ValueError)
+
+        g = asyncio.gather(*[coro(i) for i in range(3)],
+                           loop=self.loop, eager=True,
+                           return_exceptions=True)
+        self.assertEqual(0, g.result()[0])
+        self.assertIsInstance(g.result()[1], ValueError)
+
+    def test_gather_lazy(self):
+        @asyncio.coroutine
+        def coro(x):
+            return x
+
+        g = asyncio.gather(coro(1), coro(2), loop=self.loop)
+        self.assertFalse(g.done())
+        self.assertListEqual([1, 2], self.loop.run_until_complete(g))
+
+
+if __name__ == '__main__':
+    unittest.main()
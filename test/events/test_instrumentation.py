@@ -0,0 +1,61 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+from .test_base import LoopTestBase
+
+
+class LoopInstrumentationTest(LoopTestBase):
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.loop.get_instrumentation())
+        self.loop.call_soon(lambda: None)
+        self.assertDictEqual({'ready': 1, 'live_timers': 0, 'cancelled_timers': 0},
+                             self.loop.get_stats())
+
+    def test_stats(self):
+        self.loop.set_instrumentation(asyncio.LoopInstrumentation())
+        for _ in range(3):
+            self.loop.call_soon(lambda: None)
+        self.loop.call_soon(lambda: None).cancel()
+        self.loop.call_later(10, lambda: None)
+        self.run_once()
+
+        stats = self.loop.get_stats()
+        # Callback stopping the loop raises and is not counted
+        self.assertEqual(1, stats['iterations'])
+        self.assertEqual(1, sum(stats['poll_histogram'].values()))
+        self.assertEqual(3, stats['callbacks'])
+        self.assertEqual(5, stats['max_ready_depth'])
+        self.assertEqual(1, stats['timers'])
+        self.assertEqual(1, stats['live_timers'])
+        self.assertListEqual([], stats['slow_callbacks'])
+
+    def test_slow_callback(self):
+        self.loop.set_instrumentation(
+            asyncio.LoopInstrumentation(slow_callback_duration=0.01))
+
+        def slow():
+            time.sleep(0.02)
+
+        self.loop.call_soon(slow)
+        f = asyncio.Future(loop=self.loop)
+        f.add_done_callback(lambda _: time.sleep(0.02))
+        f.set_result(None)
+        with mock.patch('asyncio.instrumentation.logger') as logger:
+            self.run_once()
+        self.assertEqual(2, logger.warning.call_count)
+
+        slow_callbacks = self.loop.get_stats()['slow_callbacks']
+        self.assertEqual(2, len(slow_callbacks))
+        self.assertIn('slow', slow_callbacks[0][0])
+        self.assertGreaterEqual(slow_callbacks[0][1], 0.01)
+
+    def test_detach(self):
+        self.loop.set_instrumentation(asyncio.LoopInstrumentation())
+        self.loop.set_instrumentation(None)
+        self.run_once()
+        self.assertNotIn('iterations', self.loop.get_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
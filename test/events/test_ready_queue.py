@@ -0,0 +1,43 @@
+import asyncio
+from asyncio import events
+import unittest
+from unittest import mock
+from .test_base import LoopTestBase
+
+
+class ReadyQueueTest(LoopTestBase):
+    def test_handles_are_slotted(self):
+        for h in (events.Handle(print, ()),
+                  events.TimerHandle(1, print, ())):
+            self.assertFalse(hasattr(h, '__dict__'), type(h))
+
+    def test_nohandle_callbacks_keep_fifo_order(self):
+        calls = []
+        self.loop.call_soon(calls.append, 1)
+        self.loop._call_soon_nohandle(calls.append, 2)
+        self.loop.call_soon(calls.append, 3).cancel()
+        self.loop._call_soon_nohandle(calls.append, 4)
+        self.run_once()
+        self.assertListEqual([1, 2, 4], calls)
+
+    def test_nohandle_callback_exception_is_logged(self):
+        calls = []
+        with mock.patch('asyncio.base_events.logger') as logger:
+            self.loop._call_soon_nohandle(int, 'x')
+            self.loop._call_soon_nohandle(calls.append, 1)
+            self.run_once()
+        self.assertTrue(logger.exception.called)
+        self.assertListEqual([1], calls)
+
+    def test_future_callbacks_use_nohandle_queue(self):
+        f = asyncio.Future(loop=self.loop)
+        calls = []
+        f.add_done_callback(calls.append)
+        f.set_result(1)
+        self.assertTrue(all(type(h) is tuple for h in self.loop._ready))
+        self.run_once()
+        self.assertListEqual([f], calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
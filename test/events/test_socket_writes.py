@@ -0,0 +1,151 @@
+import asyncio
+import os
+import socket
+import unittest
+
+from asyncio import selector_events
+from asyncio import unix_events
+from .test_base import LoopTestBase
+
+
+class ThrottledSocket:
+    """Wraps a socket, accepting at most ``limit`` bytes per send call and
+    recording buffers passed to sendmsg()."""
+
+    def __init__(self, sock, limit):
+        self._sock = sock
+        self.limit = limit
+        self.sent = bytearray()
+        self.calls = []
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+    def _accept(self, data):
+        if not self.limit:
+            raise BlockingIOError
+        data = bytes(data[:self.limit])
+        self.sent += data
+        return len(data)
+
+    def send(self, data):
+        self.calls.append(1)
+        return self._accept(data)
+
+    def sendmsg(self, buffers):
+        buffers = list(buffers)
+        self.calls.append(len(buffers))
+        return self._accept(b''.join(buffers))
+
+
+class SocketWritesTest(LoopTestBase):
+    def setUp(self):
+        super().setUp()
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(rsock.close)
+        self.sock = ThrottledSocket(wsock, 0)
+        self.transport = selector_events._SelectorSocketTransport(
+            self.loop, self.sock, asyncio.Protocol())
+        self.transport.set_write_buffer_limits(high=2**30)
+
+    def tearDown(self):
+        self.transport.close()
+        self.run_coro(asyncio.sleep(0, loop=self.loop))
+        super().tearDown()
+
+    def flush(self, limit):
+        self.sock.limit = limit
+        while self.transport.get_write_buffer_size():
+            self.transport._write_ready()
+
+    def test_partial_sends(self):
+        chunks = [bytes([i]) * (i + 1) for i in range(50)]
+        for chunk in chunks:
+            self.transport.write(chunk)
+        self.flush(7)
+        self.assertEqual(b''.join(chunks), self.sock.sent)
+
+    def test_write_buffer_size(self):
+        self.transport.write(b'abc')
+        self.transport.writelines([b'defg', b'hi'])
+        self.assertEqual(9, self.transport.get_write_buffer_size())
+        self.sock.limit = 5
+        self.transport._write_ready()
+        self.assertEqual(4, self.transport.get_write_buffer_size())
+        self.assertEqual(sum(map(len, self.transport._buffer)),
+                         self.transport.get_write_buffer_size())
+        self.transport.abort()
+        self.assertEqual(0, self.transport.get_write_buffer_size())
+
+    def test_buffer_holds_views_of_written_data(self):
+        self.sock.limit = 3
+        data = b'0123456789'
+        self.transport.write(data)
+        self.assertEqual(b'012', self.sock.sent)
+        view, = self.transport._buffer
+        self.assertIsInstance(view, memoryview)
+        self.assertIs(data, view.obj)
+        self.assertEqual(b'3456789', view)
+
+    def test_writelines_does_not_concatenate(self):
+        chunks = [b'abc', b'', b'def', b'ghi']
+        self.transport.writelines(chunks)
+        self.assertEqual([b'abc', b'def', b'ghi'],
+                         [view.obj for view in self.transport._buffer])
+        self.flush(4)
+        self.assertEqual(b'abcdefghi', self.sock.sent)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'requires sendmsg()')
+    def test_sendmsg_is_capped_at_iov_max(self):
+        count = selector_events._IOV_MAX * 2 + 1
+        self.transport.writelines([b'x'] * count)
+        self.flush(count)
+        self.assertEqual(count, len(self.sock.sent))
+        self.assertEqual(
+            [selector_events._IOV_MAX, selector_events._IOV_MAX, 1],
+            self.sock.calls[-3:])
+
+
+class WriteBufferSizeTest(LoopTestBase):
+    def tearDown(self):
+        self.run_coro(asyncio.sleep(0, loop=self.loop))
+        super().tearDown()
+
+    def test_datagram_transport(self):
+        rsock, wsock = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.addCleanup(rsock.close)
+        wsock.setblocking(False)
+        transport = selector_events._SelectorDatagramTransport(
+            self.loop, wsock, asyncio.DatagramProtocol(), address='peer')
+        transport._buffer.append((b'abc', None))
+        transport._buffer_size = 3
+        transport.sendto(b'defg')
+        self.assertEqual(7, transport.get_write_buffer_size())
+        transport._sendto_ready()
+        self.assertEqual(0, transport.get_write_buffer_size())
+        self.assertEqual(b'abc', rsock.recv(10))
+        self.assertEqual(b'defg', rsock.recv(10))
+        transport.close()
+
+    def test_pipe_transport(self):
+        rfd, wfd = os.pipe()
+        self.addCleanup(os.close, rfd)
+        transport = unix_events._UnixWritePipeTransport(
+            self.loop, os.fdopen(wfd, 'wb'), asyncio.Protocol())
+        data = b'x' * 2**20
+        transport.write(data)
+        transport.write(data)
+        size = transport.get_write_buffer_size()
+        self.assertGreater(size, 2**20)
+        self.assertEqual(sum(map(len, transport._buffer)), size)
+        os.read(rfd, 2**16)
+        transport._write_ready()
+        self.assertEqual(sum(map(len, transport._buffer)),
+                         transport.get_write_buffer_size())
+        self.assertLess(transport.get_write_buffer_size(), size)
+        transport.abort()
+        self.assertEqual(0, transport.get_write_buffer_size())
+
+
+if __name__ == '__main__':
+    unittest.main()
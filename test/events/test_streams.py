@@ -0,0 +1,205 @@
+import asyncio
+from asyncio import streams
+import unittest
+from unittest import mock
+from .test_base import LoopTestBase
+
+
+class StreamReaderTest(LoopTestBase):
+    def test_readline(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\nline2\nli')
+        stream.feed_data(b'ne3\n')
+        self.assertEqual(b'line1\n', self.run_coro(stream.readline()))
+        self.assertEqual(b'line2\n', self.run_coro(stream.readline()))
+        self.assertEqual(b'line3\n', self.run_coro(stream.readline()))
+        self.assertEqual(0, stream._buffered())
+
+    def test_readline_waits_for_data(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'chunk1 ')
+        for chunk in (b'chunk2 ', b'chunk3\nrest'):
+            self.loop.call_soon(stream.feed_data, chunk)
+        self.assertEqual(b'chunk1 chunk2 chunk3\n',
+                         self.run_coro(stream.readline()))
+        self.assertEqual(b'rest', self.run_coro(stream.read(10)))
+
+    def test_readline_resumes_search(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'abc')
+        task = asyncio.async(stream.readline(), loop=self.loop)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.assertFalse(task.done())
+        stream.feed_data(b'def\n')
+        self.assertEqual(b'abcdef\n', self.run_coro(task))
+
+    def test_readline_after_cancelled_readuntil(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\nline2')
+        task = asyncio.async(stream.readuntil(b'XY'), loop=self.loop)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        task.cancel()
+        self.assertRaises(asyncio.CancelledError, self.run_coro, task)
+        self.assertEqual(b'line1\n', self.run_coro(
+            asyncio.wait_for(stream.readline(), 1, loop=self.loop)))
+
+    def test_readline_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'some data')
+        stream.feed_eof()
+        self.assertEqual(b'some data', self.run_coro(stream.readline()))
+        self.assertEqual(b'', self.run_coro(stream.readline()))
+
+    def test_readline_limit(self):
+        stream = asyncio.StreamReader(limit=7, loop=self.loop)
+        stream.feed_data(b'12345678\n1\n')
+        self.assertRaises(ValueError, self.run_coro, stream.readline())
+        self.assertEqual(b'1\n', self.run_coro(stream.readline()))
+
+        stream.feed_data(b'12345678')
+        self.assertRaises(ValueError, self.run_coro, stream.readline())
+        self.assertEqual(0, stream._buffered())
+
+    def test_read(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\nline2')
+        self.assertEqual(b'line', self.run_coro(stream.read(4)))
+        self.assertEqual(b'1\nline2', self.run_coro(stream.read(100)))
+        self.assertEqual(b'', self.run_coro(stream.read(0)))
+
+        self.loop.call_soon(stream.feed_data, b'data')
+        self.assertEqual(b'data', self.run_coro(stream.read(10)))
+
+    def test_read_until_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'chunk1\n')
+        self.loop.call_soon(stream.feed_data, b'chunk2')
+        self.loop.call_soon(stream.feed_eof)
+        self.assertEqual(b'chunk1\nchunk2', self.run_coro(stream.read()))
+        self.assertEqual(b'', self.run_coro(stream.read()))
+
+    def test_read_large(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        data = bytes(range(256)) * 100
+        stream.feed_data(b'x' + data)
+        self.assertEqual(b'x', self.run_coro(stream.read(1)))
+        self.assertEqual(data[:-1],
+                         self.run_coro(stream.readexactly(len(data) - 1)))
+
+    def test_buffer_shrinks_after_burst(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        size = 16 * streams._MAX_IDLE_BUFFER
+        stream.feed_data(b'x' * size)
+        self.assertGreaterEqual(len(stream._buffer), size)
+        self.run_coro(stream.readexactly(size - 10))
+        self.assertEqual(streams._MAX_IDLE_BUFFER, len(stream._buffer))
+        self.assertEqual(b'x' * 10, self.run_coro(stream.read(100)))
+
+    def test_readexactly(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'12')
+        self.loop.call_soon(stream.feed_data, b'34')
+        self.loop.call_soon(stream.feed_data, b'56')
+        self.assertEqual(b'12345', self.run_coro(stream.readexactly(5)))
+        stream.feed_eof()
+        self.assertEqual(b'6', self.run_coro(stream.readexactly(5)))
+
+    def test_space_is_reused(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'a\n' * 10)
+        size = len(stream._buffer)
+        for _ in range(6):
+            self.run_coro(stream.readline())
+        self.assertEqual(12, stream._offset)
+
+        # Unread data is moved to the front to make room
+        stream.feed_data(b'b')
+        self.assertEqual(0, stream._offset)
+        self.assertEqual(size, len(stream._buffer))
+        self.assertEqual(b'a\n' * 4 + b'b', self.run_coro(stream.read(100)))
+
+        self.assertEqual(0, stream._end)
+        stream.feed_data(b'c' * size)
+        self.assertEqual(size, len(stream._buffer))
+        self.assertEqual(b'c' * size, self.run_coro(stream.read(size)))
+
+    def test_readuntil(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'first\r\nsecond\r')
+        self.loop.call_soon(stream.feed_data, b'\nthird')
+        self.assertEqual(b'first\r\n',
+                         self.run_coro(stream.readuntil(b'\r\n')))
+        self.assertEqual(b'second\r\n',
+                         self.run_coro(stream.readuntil(b'\r\n')))
+        stream.feed_eof()
+        self.assertEqual(b'third', self.run_coro(stream.readuntil(b'\r\n')))
+        self.assertRaises(ValueError, self.run_coro, stream.readuntil(b''))
+
+    def test_readuntil_separator_split_between_chunks(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'data==')
+        task = asyncio.async(stream.readuntil(b'===='), loop=self.loop)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.assertFalse(task.done())
+        stream.feed_data(b'==rest')
+        self.assertEqual(b'data====', self.run_coro(task))
+        self.assertEqual(b'rest', self.run_coro(stream.read(4)))
+
+    def test_readuntil_limit(self):
+        stream = asyncio.StreamReader(limit=4, loop=self.loop)
+        stream.feed_data(b'12345||6||')
+        self.assertRaises(ValueError, self.run_coro, stream.readuntil(b'||'))
+        self.assertEqual(b'6||', self.run_coro(stream.readuntil(b'||')))
+
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buffer = bytearray(4)
+        stream.feed_data(b'123456')
+        self.assertEqual(4, self.run_coro(stream.readinto(buffer)))
+        self.assertEqual(b'1234', buffer)
+        self.assertEqual(2, self.run_coro(
+            stream.readinto(memoryview(buffer)[1:])))
+        self.assertEqual(b'1564', buffer)
+
+        self.loop.call_soon(stream.feed_data, b'7')
+        self.assertEqual(1, self.run_coro(stream.readinto(buffer)))
+        self.assertEqual(b'7564', buffer)
+
+        self.assertEqual(0, self.run_coro(stream.readinto(bytearray())))
+        stream.feed_eof()
+        self.assertEqual(0, self.run_coro(stream.readinto(buffer)))
+
+    def test_readexactly_many(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'\x00\x03')
+        self.loop.call_soon(stream.feed_data, b'abcde')
+        self.assertListEqual([b'\x00\x03', b'abc', b''],
+                             self.run_coro(stream.readexactly_many([2, 3, 0])))
+        stream.feed_eof()
+        self.assertListEqual([b'd', b'e', b''],
+                             self.run_coro(stream.readexactly_many([1, 3, 1])))
+
+    def test_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        task = asyncio.async(stream.readline(), loop=self.loop)
+        self.loop.call_soon(stream.set_exception, ValueError())
+        self.assertRaises(ValueError, self.run_coro, task)
+        self.assertRaises(ValueError, self.run_coro, stream.read(1))
+
+    def test_pause_and_resume_transport(self):
+        stream = asyncio.StreamReader(limit=4, loop=self.loop)
+        transport = mock.Mock()
+        stream.set_transport(transport)
+        stream.feed_data(b'123456789')
+        self.assertTrue(transport.pause_reading.called)
+        self.run_coro(stream.read(4))
+        self.assertFalse(transport.resume_reading.called)
+        self.run_coro(stream.read(1))
+        self.assertTrue(transport.resume_reading.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
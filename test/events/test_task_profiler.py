@@ -0,0 +1,89 @@
+import asyncio
+import time
+import unittest
+from .test_base import LoopTestBase
+
+
+@asyncio.coroutine
+def busy(duration):
+    time.sleep(duration)
+
+
+@asyncio.coroutine
+def waiting(fut):
+    yield
+    yield from fut
+    time.sleep(0.005)
+
+
+class TaskProfilerTest(LoopTestBase):
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.loop.get_task_profiler())
+        t = asyncio.Task(busy(0), loop=self.loop)
+        self.assertIsNone(t._profile)
+        self.assertRaises(RuntimeError, self.loop.task_report)
+        self.loop.run_until_complete(t)
+
+    def test_report(self):
+        profiler = asyncio.TaskProfiler()
+        self.loop.set_task_profiler(profiler)
+        self.assertIs(profiler, self.loop.get_task_profiler())
+
+        fut = asyncio.Future(loop=self.loop)
+        tasks = [asyncio.Task(busy(0.01), loop=self.loop),
+                 asyncio.Task(busy(0.01), loop=self.loop),
+                 asyncio.Task(waiting(fut), loop=self.loop)]
+        self.loop.call_later(0.02, fut.set_result, None)
+        self.loop.run_until_complete(asyncio.wait(tasks, loop=self.loop))
+
+        # Tasks of wait() itself are profiled too
+        report = self.loop.task_report()
+        rows = {row['coroutine']: row for row in report}
+        busy_row, waiting_row = rows['busy'], rows['waiting']
+        self.assertIs(busy_row, report[0])
+        self.assertEqual(2, busy_row['tasks'])
+        self.assertEqual(2, busy_row['steps'])
+        self.assertGreaterEqual(busy_row['run_time'], 0.02)
+        self.assertGreater(busy_row['ready_time'], 0)
+        self.assertEqual(0, busy_row['wait_time'])
+
+        self.assertEqual(1, waiting_row['tasks'])
+        self.assertEqual(3, waiting_row['steps'])
+        self.assertGreaterEqual(waiting_row['run_time'], 0.005)
+        self.assertGreater(waiting_row['wait_time'], 0)
+
+        self.assertEqual(1, len(self.loop.task_report(top=1)))
+
+    def test_report_includes_pending_tasks(self):
+        self.loop.set_task_profiler(asyncio.TaskProfiler())
+        fut = asyncio.Future(loop=self.loop)
+        t = asyncio.Task(waiting(fut), loop=self.loop, eager=True)
+        row, = self.loop.task_report()
+        self.assertEqual(1, row['tasks'])
+        self.assertEqual(1, row['steps'])
+        t.cancel()
+        self.assertRaises(asyncio.CancelledError,
+                          self.loop.run_until_complete, t)
+
+    def test_sample_rate(self):
+        self.loop.set_task_profiler(asyncio.TaskProfiler(sample_rate=0.25))
+        tasks = [asyncio.Task(busy(0), loop=self.loop) for _ in range(8)]
+        self.assertEqual(2, sum(t._profile is not None for t in tasks))
+        self.loop.run_until_complete(asyncio.wait(tasks, loop=self.loop))
+        rows = {row['coroutine']: row for row in self.loop.task_report()}
+        self.assertEqual(2, rows['busy']['tasks'])
+
+        self.assertRaises(ValueError, asyncio.TaskProfiler, sample_rate=2)
+
+    def test_clear(self):
+        profiler = asyncio.TaskProfiler()
+        self.loop.set_task_profiler(profiler)
+        self.loop.run_until_complete(asyncio.Task(busy(0), loop=self.loop))
+        self.assertEqual(1, len(profiler.report()))
+        self.assertEqual('busy', profiler.report()[0]['coroutine'])
+        profiler.clear()
+        self.assertListEqual([], profiler.report())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import asyncio
+from asyncio import queues
+import sys
+import unittest
+from unittest import mock
+from .test_base import LoopTestBase
+
+
+class TaskWakeupTest(LoopTestBase):
+    def test_wakeup_with_result(self):
+        f = asyncio.Future(loop=self.loop)
+
+        @asyncio.coroutine
+        def coro():
+            a = yield from f
+            b = yield from f
+            return a + b
+
+        t = asyncio.Task(coro(), loop=self.loop, eager=True)
+        self.assertIs(f, t._fut_waiter)
+        self.loop.call_soon(f.set_result, 2)
+        self.assertEqual(4, self.loop.run_until_complete(t))
+
+    def test_wakeup_with_exception(self):
+        f = asyncio.Future(loop=self.loop)
+
+        @asyncio.coroutine
+        def coro():
+            try:
+                yield from f
+            except ValueError:
+                return 'caught'
+
+        t = asyncio.Task(coro(), loop=self.loop)
+        self.loop.call_soon(f.set_exception, ValueError())
+        self.assertEqual('caught', self.loop.run_until_complete(t))
+
+    def test_steps_use_nohandle_queue(self):
+        f = asyncio.Future(loop=self.loop)
+
+        @asyncio.coroutine
+        def coro():
+            yield
+            return (yield from f)
+
+        t = asyncio.Task(coro(), loop=self.loop)
+        self.assertTrue(all(type(h) is tuple for h in self.loop._ready))
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        f.set_result(1)
+        self.assertTrue(all(type(h) is tuple for h in self.loop._ready))
+        self.assertEqual(1, self.loop.run_until_complete(t))
+
+    def resume_order(self):
+        f = asyncio.Future(loop=self.loop)
+        order = []
+
+        @asyncio.coroutine
+        def coro():
+            order.append((yield from f))
+
+        def complete():
+            f.set_result('resumed')
+            order.append('set_result returned')
+
+        t = asyncio.Task(coro(), loop=self.loop, eager=True)
+        self.loop.call_soon(complete)
+        self.loop.run_until_complete(t)
+        return order
+
+    def test_resumed_from_done_callback(self):
+        self.assertListEqual(['resumed', 'set_result returned'],
+                             self.resume_order())
+
+    def test_resumed_through_loop_beyond_max_depth(self):
+        with mock.patch.object(asyncio.Task, 'max_inline_wakeups', 0):
+            self.assertListEqual(['set_result returned', 'resumed'],
+                                 self.resume_order())
+
+    def test_cancellation_goes_through_loop(self):
+        f = asyncio.Future(loop=self.loop)
+
+        @asyncio.coroutine
+        def coro():
+            yield from f
+
+        t = asyncio.Task(coro(), loop=self.loop, eager=True)
+
+        def cancel():
+            t.cancel()
+            self.assertFalse(t.done())
+
+        self.loop.call_soon(cancel)
+        self.assertRaises(asyncio.CancelledError,
+                          self.loop.run_until_complete, t)
+
+    def test_long_chain_does_not_recurse(self):
+        f = asyncio.Future(loop=self.loop)
+
+        @asyncio.coroutine
+        def coro(awaited):
+            return (yield from awaited) + 1
+
+        t = f
+        for _ in range(sys.getrecursionlimit()):
+            t = asyncio.Task(coro(t), loop=self.loop, eager=True)
+        self.loop.call_soon(f.set_result, 0)
+        self.assertEqual(sys.getrecursionlimit(),
+                         self.loop.run_until_complete(t))
+
+    def test_tasks_waking_each_other_let_loop_run(self):
+        pings = queues.Queue(loop=self.loop)
+        pongs = queues.Queue(loop=self.loop)
+        ticks = []
+
+        @asyncio.coroutine
+        def ping():
+            for i in range(100):
+                pings.put_nowait(i)
+                yield from pongs.get()
+
+        @asyncio.coroutine
+        def pong():
+            for _ in range(100):
+                pongs.put_nowait((yield from pings.get()))
+
+        def tick():
+            ticks.append(None)
+            self.loop.call_soon(tick)
+
+        asyncio.Task(pong(), loop=self.loop, eager=True)
+        self.loop.call_soon(tick)
+        with mock.patch.object(asyncio.Task, 'max_inline_wakeups', 10):
+            self.loop.run_until_complete(
+                asyncio.Task(ping(), loop=self.loop))
+        # Loop iterates at least once per 10 wakeups out of 200
+        self.assertGreaterEqual(len(ticks), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
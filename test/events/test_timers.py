@@ -0,0 +1,203 @@
+from asyncio import events
+from asyncio.timers import HeapScheduler, TimingWheelScheduler
+import collections
+import random
+import time
+import unittest
+from .test_base import LoopTestBase
+
+
+def _noop():
+    pass
+
+
+class TimingWheelSchedulerTest(unittest.TestCase):
+    def _scheduler(self, **kwargs):
+        s = TimingWheelScheduler(**kwargs)
+        s.start(0)
+        return s
+
+    def test_fires_in_tick_after_deadline(self):
+        s = self._scheduler(resolution=0.01)
+        t = events.TimerHandle(0.025, _noop, ())
+        s.push(t)
+        ready = collections.deque()
+
+        s.pop_expired(0.025, ready)
+        self.assertFalse(ready)
+        s.pop_expired(0.03, ready)
+        self.assertListEqual([t], list(ready))
+        self.assertEqual(0, len(s))
+
+    def test_cancelled_are_skipped(self):
+        s = self._scheduler(resolution=0.01, wheel_size=4, levels=2)
+        timers = [events.TimerHandle(0.01 * i, _noop, ()) for i in range(1, 40)]
+        for t in timers:
+            s.push(t)
+        for t in timers[::2]:
+            t.cancel()
+        ready = collections.deque()
+        s.pop_expired(1, ready)
+        self.assertListEqual(timers[1::2], list(ready))
+        self.assertEqual(0, len(s))
+
+    def test_next_deadline(self):
+        s = self._scheduler(resolution=0.01, wheel_size=4, levels=2)
+        self.assertIsNone(s.next_deadline())
+        s.push(events.TimerHandle(0.5, _noop, ()))
+        self.assertLessEqual(s.next_deadline(), 0.5)
+        s.push(events.TimerHandle(0.02, _noop, ()))
+        self.assertAlmostEqual(0.02, s.next_deadline())
+        s.push(events.TimerHandle(-1, _noop, ()))
+        self.assertAlmostEqual(0, s.next_deadline())
+
+    def test_matches_heap(self):
+        rnd = random.Random(1)
+        resolution = 0.01
+        wheel = self._scheduler(resolution=resolution, wheel_size=4, levels=3)
+        heap = HeapScheduler()
+        fired = {}
+        expected = collections.deque()
+
+        now = 0
+        for _ in range(200):
+            for _ in range(rnd.randrange(5)):
+                t = events.TimerHandle(now + rnd.expovariate(2), _noop, ())
+                if rnd.random() < 0.3:
+                    t.cancel()
+                wheel.push(t)
+                heap.push(t)
+            deadline = wheel.next_deadline()
+            earliest = heap.next_deadline()
+            if earliest is not None and earliest > now:
+                self.assertLessEqual(deadline, earliest + resolution)
+            now += rnd.expovariate(20)
+            ready = collections.deque()
+            wheel.pop_expired(now, ready)
+            heap.pop_expired(now - resolution, expected)
+            for t in ready:
+                self.assertNotIn(t, fired)
+                self.assertLessEqual(t._when, now)
+                fired[t] = now
+
+        # Everything heap fired a tick ago was fired by wheel too
+        self.assertLessEqual({t for t in expected if not t._cancelled}, set(fired))
+        self.assertGreater(len(fired), 100)
+
+    def test_matches_heap_on_whole_ticks(self):
+        # With whole-tick deadlines the wheel fires exactly what heap does
+        for seed in range(5):
+            rnd = random.Random(seed)
+            wheel = self._scheduler(resolution=1, wheel_size=4, levels=2)
+            heap = HeapScheduler()
+            pending = []
+            now = 0
+            for i in range(300):
+                for j in range(rnd.randrange(4)):
+                    delay = rnd.choice((1, 4, 16, 64, 1000))
+                    when = now + delay + rnd.randrange(delay)
+                    timers = (events.TimerHandle(when, _noop, (i, j)),
+                              events.TimerHandle(when, _noop, (i, j)))
+                    wheel.push(timers[0])
+                    heap.push(timers[1])
+                    pending.append(timers)
+                for timers in rnd.sample(pending, len(pending) // 10):
+                    for t in timers:
+                        t.cancel()
+                now += rnd.choice((0, 1, 3, 17, 250))
+                from_wheel = collections.deque()
+                from_heap = collections.deque()
+                wheel.pop_expired(now, from_wheel)
+                heap.pop_expired(now, from_heap)
+                self.assertListEqual(sorted(t._args for t in from_heap),
+                                     sorted(t._args for t in from_wheel))
+                pending = [timers for timers in pending
+                           if timers[1]._scheduled]
+
+    def test_far_future_timer(self):
+        s = self._scheduler()
+        day = 24 * 3600
+        t = events.TimerHandle(60 * day, _noop, ())
+        s.push(t)
+        ready = collections.deque()
+        t0 = time.perf_counter()
+        s.pop_expired(30 * day, ready)
+        self.assertFalse(ready)
+        s.pop_expired(60 * day, ready)
+        self.assertLess(time.perf_counter() - t0, 0.1)
+        self.assertListEqual([t], list(ready))
+
+    def test_overflow(self):
+        s = self._scheduler(resolution=1, wheel_size=2, levels=2)
+        t = events.TimerHandle(100, _noop, ())
+        s.push(t)
+        self.assertEqual(1, len(s))
+        ready = collections.deque()
+        s.pop_expired(99, ready)
+        self.assertFalse(ready)
+        s.pop_expired(100, ready)
+        self.assertListEqual([t], list(ready))
+
+
+class CancelledTimersPurgeTest(LoopTestBase):
+    def check_purge(self):
+        timers = [self.loop.call_later(3600 + i, _noop) for i in range(1000)]
+        self.assertDictEqual({'live_timers': 1000, 'cancelled_timers': 0},
+                             self.loop.get_timer_stats())
+
+        for t in timers[:400]:
+            t.cancel()
+            t.cancel()
+        self.assertDictEqual({'live_timers': 600, 'cancelled_timers': 400},
+                             self.loop.get_timer_stats())
+
+        for t in timers[400:600]:
+            t.cancel()
+        # Cancelled timers made up more than half of all and were purged
+        stats = self.loop.get_timer_stats()
+        self.assertEqual(400, stats['live_timers'])
+        self.assertLess(stats['cancelled_timers'], 100)
+        self.assertEqual(stats['live_timers'] + stats['cancelled_timers'],
+                         len(self.loop.get_timer_scheduler()))
+
+    def test_heap(self):
+        self.check_purge()
+
+    def test_timing_wheel(self):
+        self.loop.set_timer_scheduler(TimingWheelScheduler())
+        self.check_purge()
+
+    def test_cancel_after_fired_is_not_counted(self):
+        handle = self.loop.call_later(0, _noop)
+        self.loop.call_later(0.001, self.loop.stop)
+        self.loop.run_forever()
+        handle.cancel()
+        self.assertDictEqual({'live_timers': 0, 'cancelled_timers': 0},
+                             self.loop.get_timer_stats())
+
+    def test_cancelled_head_is_not_counted(self):
+        handle = self.loop.call_later(0, _noop)
+        handle.cancel()
+        self.loop.call_later(0.001, self.loop.stop)
+        self.loop.run_forever()
+        self.assertDictEqual({'live_timers': 0, 'cancelled_timers': 0},
+                             self.loop.get_timer_stats())
+
+
+class LoopTimerSchedulerTest(LoopTestBase):
+    def test_default_is_heap(self):
+        self.assertIsInstance(self.loop.get_timer_scheduler(), HeapScheduler)
+
+    def test_timing_wheel(self):
+        fired = []
+        self.loop.call_later(0.02, fired.append, 2)
+        self.loop.set_timer_scheduler(TimingWheelScheduler(resolution=0.005))
+        self.loop.call_later(0.01, fired.append, 1)
+        self.loop.call_later(0.01, fired.append, 'cancelled').cancel()
+        self.loop.call_later(0.03, self.loop.stop)
+        self.loop.run_forever()
+        self.assertListEqual([1, 2], fired)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import unittest
+from .test_base import LoopTestBase
+
+
+class ThreadsafeWakeupTest(LoopTestBase):
+    def pending_wakeup_bytes(self):
+        try:
+            return len(self.loop._ssock.recv(4096))
+        except BlockingIOError:
+            return 0
+
+    def test_wakeups_are_coalesced(self):
+        calls = []
+
+        def schedule():
+            for i in range(1000):
+                self.loop.call_soon_threadsafe(calls.append, i)
+
+        t = threading.Thread(target=schedule)
+        t.start()
+        t.join()
+        self.assertEqual(1, self.pending_wakeup_bytes())
+        self.run_once()
+        self.assertListEqual(list(range(1000)), calls)
+
+    def test_self_pipe_is_drained_in_one_read(self):
+        for _ in range(100):
+            self.loop._csock.send(b'\0')
+        self.loop._read_from_self()
+        self.assertEqual(0, self.pending_wakeup_bytes())
+        self.assertFalse(self.loop._wakeup_pending)
+
+    def test_wakeup_written_while_draining(self):
+        calls = []
+        ssock = self.loop._ssock
+
+        class InterleavingSocket:
+            # Another thread schedules a callback right before the drain
+            # reads the self-socket.
+            def recv(this, size):
+                if not calls:
+                    calls.append('scheduled')
+                    self.loop.call_soon_threadsafe(calls.append, 'called')
+                return ssock.recv(size)
+
+            def __getattr__(this, name):
+                return getattr(ssock, name)
+
+        self.loop._ssock = InterleavingSocket()
+        try:
+            self.loop._read_from_self()
+        finally:
+            self.loop._ssock = ssock
+        # A pending wakeup flag must always be backed by a pending byte,
+        # otherwise later wakeups are never written.
+        self.assertFalse(self.loop._wakeup_pending and
+                         not self.pending_wakeup_bytes())
+        self.run_once()
+        self.assertEqual(['scheduled', 'called'], calls)
+
+        def schedule():
+            self.loop.call_soon_threadsafe(calls.append, 'from thread')
+
+        t = threading.Thread(target=schedule)
+        t.start()
+        t.join()
+        self.assertEqual(1, self.pending_wakeup_bytes())
+
+    def test_wakeup_from_threads(self):
+        done = asyncio.Future(loop=self.loop)
+        count = 0
+
+        def on_call():
+            nonlocal count
+            count += 1
+            if count == 4 * 1000:
+                done.set_result(count)
+
+        def schedule():
+            for _ in range(1000):
+                self.loop.call_soon_threadsafe(on_call)
+
+        threads = [threading.Thread(target=schedule) for _ in range(4)]
+        for t in threads:
+            t.start()
+        self.assertEqual(4000, self.loop.run_until_complete(
+            asyncio.wait_for(done, 10, loop=self.loop)))
+        for t in threads:
+            t.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,18 @@ class ThreadPoolExecutorTest(unittest.TestCase):
             f.cancel()
             self.assertRaises(CancelledError, f.result)
 
+    def test_map(self):
+        with ThreadPoolExecutor(2) as tpx:
+            self.assertListEqual([0, 1, 4, 9], list(tpx.map(lambda x: x * x, range(4))))
+
+    def test_map_max_in_flight(self):
+        import itertools
+
+        with ThreadPoolExecutor(2) as tpx:
+            it = tpx.map(lambda x: x * x, itertools.count(), max_in_flight=3)
+            self.assertListEqual([0, 1, 4, 9], list(itertools.islice(it, 4)))
+            it.close()
+
     def test_raises_with_notimeout(self):
         f = Future()
         self.assertRaises(InvalidStateError, f.result)
@@ -0,0 +1,119 @@
+from .test_base import FutureTestBase
+import concurrent.futures
+import concurrent.futures.cooperative as coop
+import concurrent.futures.multithreaded as mt
+import time
+
+
+class CooperativeAsCompletedTest(FutureTestBase):
+    def wait_done(self, f, timeout=10):
+        end_time = time.monotonic() + timeout
+        while not f.done() and time.monotonic() < end_time:
+            time.sleep(0.001)
+        return f.done()
+
+    def test_completion_order(self):
+        futures = [coop.Future() for _ in range(3)]
+        it = coop.Future.as_completed(futures)
+        results = [next(it) for _ in range(3)]
+        self.assertFalse(any(f.done() for f in results))
+
+        futures[2].set_result(2)
+        futures[0].set_exception(TypeError())
+        futures[1].set_result(1)
+
+        self.assertEqual(2, results[0].result())
+        self.assertRaises(TypeError, results[1].result)
+        self.assertEqual(1, results[2].result())
+        self.assertRaises(StopIteration, next, it)
+
+    def test_already_completed(self):
+        futures = [coop.Future.successful(i) for i in range(3)]
+        results = [f.result() for f in coop.Future.as_completed(futures)]
+        self.assertListEqual([0, 1, 2], results)
+
+    def test_shared_completed(self):
+        futures = [coop.Future.successful(None), coop.Future.successful(None),
+                   coop.Future.successful(True)]
+        results = [f.result() for f in coop.Future.as_completed(futures)]
+        self.assertListEqual([None, None, True], results)
+
+    def test_timeout(self):
+        futures = [coop.Future() for _ in range(3)]
+        it = coop.Future.as_completed(futures, timeout=0.05)
+        first, second = next(it), next(it)
+        futures[1].set_result(1)
+        self.assertEqual(1, first.result())
+
+        self.assertTrue(self.wait_done(second))
+        self.assertRaises(concurrent.futures.TimeoutError, second.result)
+        self.assertRaises(concurrent.futures.TimeoutError, next(it).result)
+        self.assertRaises(StopIteration, next, it)
+        for fi in futures:
+            self.assertIsNone(fi._callback)
+
+    def test_completed_before_timeout(self):
+        futures = [coop.Future() for _ in range(2)]
+        it = coop.Future.as_completed(futures, timeout=10)
+        f = next(it)
+        futures[0].set_result(1)
+        futures[1].set_result(2)
+        self.assertEqual(1, f.result())
+        self.assertEqual(2, next(it).result())
+        self.assertRaises(StopIteration, next, it)
+
+    def test_stop_iteration_removes_callbacks(self):
+        futures = [coop.Future() for _ in range(3)]
+        it = coop.Future.as_completed(futures)
+        f = next(it)
+        it.close()
+
+        self.assertTrue(f.cancelled())
+        for fi in futures:
+            self.assertIsNone(fi._callback)
+
+
+class MultithreadedAsCompletedTest(FutureTestBase):
+    def test_completion_order(self):
+        futures = [self.success_after(0.03, 1),
+                   self.success_after(0.01, 2),
+                   mt.Future.successful(3)]
+        results = [f.result() for f in mt.Future.as_completed(futures, timeout=10)]
+        self.assertListEqual([3, 2, 1], results)
+
+    def test_module_function(self):
+        futures = [self.success_after(0.01, i) for i in range(5)]
+        done = list(concurrent.futures.as_completed(futures, timeout=10))
+        self.assertSetEqual(set(futures), set(done))
+
+    def test_duplicates(self):
+        f = mt.Future.successful(1)
+        self.assertListEqual(
+            [1, 1], [fi.result() for fi in mt.Future.as_completed([f, f])])
+
+    def test_shared_completed(self):
+        futures = [mt.Future.successful(None), mt.Future.successful(None),
+                   mt.Future.successful(True)]
+        results = [f.result() for f in mt.Future.as_completed(futures)]
+        self.assertListEqual([None, None, True], results)
+
+    def test_timeout(self):
+        futures = [mt.Future.successful(1), mt.Future()]
+        it = mt.Future.as_completed(futures, timeout=0.01)
+        self.assertEqual(1, next(it).result())
+        f = next(it)
+        self.assertRaises(concurrent.futures.TimeoutError, f.result)
+        self.assertIsNone(futures[1]._callback)
+
+    def test_module_function_timeout(self):
+        futures = [mt.Future.successful(1), mt.Future()]
+        it = concurrent.futures.as_completed(futures, timeout=0.01)
+        self.assertIs(futures[0], next(it))
+        self.assertRaises(concurrent.futures.TimeoutError, next, it)
+        self.assertIsNone(futures[1]._callback)
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()
@@ -56,6 +56,37 @@ class FutureCallbacksTest(FutureTestBase):
         f.cancel()
         self.assertTrue(self.clb_called)
 
+    def test_callbacks_called_in_registration_order(self):
+        f = Future()
+        calls = []
+
+        for i in range(5):
+            f.add_done_callback(lambda _, i=i: calls.append(i))
+
+        f.set_result(None)
+        self.assertListEqual(list(range(5)), calls)
+
+    def test_remove_done_callback(self):
+        f = Future()
+        calls = []
+
+        def first(_):
+            calls.append(1)
+
+        def second(_):
+            calls.append(2)
+
+        f.add_done_callback(first)
+        f.add_done_callback(second)
+        f.add_done_callback(first)
+
+        self.assertEqual(2, f.remove_done_callback(first))
+        self.assertEqual(0, f.remove_done_callback(first))
+
+        f.add_done_callback(first)
+        f.set_result(None)
+        self.assertListEqual([2, 1], calls)
+
     def test_unhandled_error_future(self):
         self.clb_called = False
 
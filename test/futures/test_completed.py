@@ -0,0 +1,102 @@
+from .test_base import FutureTestBase
+from concurrent.futures.multithreaded import *
+from concurrent.futures.cooperative import future_extensions
+from concurrent.futures.cooperative.synchronous_executor import Synchronous
+
+
+class CompletedFutureTest(FutureTestBase):
+    def test_successful_is_immutable(self):
+        f = Future.successful(123)
+        self.assertIsInstance(f, Future)
+        self.assertTrue(f.done())
+        self.assertFalse(f.cancel())
+        self.assertFalse(f.cancelled())
+        self.assertFalse(f.try_set_result(321))
+        self.assertRaises(InvalidStateError, f.set_exception, TypeError())
+        self.assertEqual(123, f.result())
+        self.assertIsNone(f.exception())
+
+    def test_failed_is_immutable(self):
+        f = Future.failed(TypeError())
+        self.assertTrue(f.done())
+        self.assertFalse(f.try_set_result(321))
+        self.assertRaises(TypeError, f.result)
+        self.assertIsInstance(f.exception(), TypeError)
+
+    def test_shared_singletons(self):
+        for value in (None, True, False):
+            self.assertIs(Future.successful(value), Future.successful(value))
+            self.assertIs(Future.successful(value),
+                          Future.completed(lambda: value))
+        self.assertIsNot(Future.successful([]), Future.successful([]))
+        self.assertIsNot(Future.successful(),
+                         Future.successful(clb_executor=self.executor))
+
+    def test_shared_only_with_default_executor(self):
+        f = Future.successful(1, clb_executor=self.executor)
+        self.assertIsNot(f.map(lambda _: None, executor=Synchronous),
+                         f.map(lambda _: None, executor=Synchronous))
+        self.assertFalse(any(g._executor is self.executor
+                             for g in future_extensions._shared_completed.values()))
+
+    def test_callback_dispatched_immediately(self):
+        f = Future.successful(123)
+        self.clb_called = False
+
+        def on_done(fut):
+            self.clb_called = fut.result()
+
+        f.add_done_callback(on_done)
+        self.assertEqual(123, self.clb_called)
+        self.assertEqual(0, f.remove_done_callback(on_done))
+
+    def test_map(self):
+        f = Future.successful(5).map(lambda x: x * x)
+        self.assertTrue(f.done())
+        self.assertEqual(25, f.result())
+
+        f = Future.successful(5).map(self._raise)
+        self.assertRaises(TypeError, f.result)
+
+    def test_map_failure(self):
+        f = Future.failed(TypeError())
+        self.assertIs(f, f.map(lambda x: x * x))
+
+    def test_map_with_executor(self):
+        f = Future.successful(5).map(lambda x: x * x, executor=self.executor)
+        self.assertEqual(25, f.result(timeout=10))
+
+    def test_recover(self):
+        f = Future.successful(5)
+        self.assertIs(f, f.recover(None))
+
+        f = Future.failed(TypeError()).recover(lambda _: 5)
+        self.assertEqual(5, f.result())
+
+        f = Future.failed(TypeError()).recover(5)
+        self.assertEqual(5, f.result())
+
+    def test_then(self):
+        f = Future.successful(True).then(lambda: self.success_after(0.01, 25))
+        self.assertEqual(25, f.result(timeout=10))
+
+        f = Future.failed(IOError())
+        self.assertIs(f, f.then(lambda: self.success_after(0.01, 25)))
+
+    def test_then_result_is_not_completed(self):
+        f = Future.successful(True).then(Future())
+        self.assertFalse(f.done())
+        self.assertTrue(f.cancel())
+
+    def test_fallback(self):
+        f = Future.failed(IOError()).fallback(lambda: Future.successful(1))
+        self.assertEqual(1, f.result())
+
+        f = Future.successful(5)
+        self.assertIs(f, f.fallback(lambda: Future.successful(1)))
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()
@@ -331,6 +331,61 @@ class FutureCompositionTest(FutureTestBase):
         fsum = Future.reduce(futures, lambda x, y: x + y, 0)
         self.assertEqual(sum(range(5)), fsum.result(timeout=10))
 
+    def test_reduce_empty(self):
+        fsum = Future.reduce([], lambda x, y: x + y, 0)
+        self.assertEqual(0, fsum.result(timeout=10))
+
+    def test_reduce_ordered(self):
+        futures = [self.success_after(0.001 * (5 - i), str(i)) for i in range(5)]
+        fcat = Future.reduce(futures, lambda x, y: x + y, '')
+        self.assertEqual('01234', fcat.result(timeout=10))
+
+    def test_reduce_unordered_is_incremental(self):
+        futures = [Future() for _ in range(3)]
+        seen = []
+
+        def fold(acc, r):
+            seen.append(r)
+            return acc + r
+
+        fsum = Future.reduce(futures, fold, 0, ordered=False)
+        futures[2].set_result(3)
+        self.assertListEqual([3], seen)
+        futures[0].set_result(1)
+        futures[1].set_result(2)
+        self.assertListEqual([3, 1, 2], seen)
+        self.assertEqual(6, fsum.result(timeout=10))
+
+    def test_reduce_ordered_buffers_out_of_order(self):
+        futures = [Future() for _ in range(3)]
+        seen = []
+        fcat = Future.reduce(futures, lambda acc, r: seen.append(r) or acc + r, '')
+        futures[1].set_result('b')
+        self.assertListEqual([], seen)
+        futures[0].set_result('a')
+        self.assertListEqual(['a', 'b'], seen)
+        futures[2].set_result('c')
+        self.assertEqual('abc', fcat.result(timeout=10))
+
+    def test_reduce_failure(self):
+        futures = [Future(), Future.failed(TypeError())]
+        fsum = Future.reduce(futures, lambda x, y: x + y, 0)
+        self.assertRaises(TypeError, fsum.result, timeout=10)
+        self.assertFalse(futures[0].cancelled())
+        futures[0].set_result(1)
+        self.assertRaises(TypeError, fsum.result, timeout=10)
+
+    def test_reduce_cancel(self):
+        futures = [Future(), Future()]
+        fsum = Future.reduce(futures, lambda x, y: x + y, 0)
+        self.assertTrue(fsum.cancel())
+        self.assertTrue(all(f.cancelled() for f in futures))
+
+    def test_reduce_function_failure(self):
+        futures = [Future.successful(1), Future.successful(2)]
+        fsum = Future.reduce(futures, lambda acc, r: self._raise(TypeError()), 0)
+        self.assertRaises(TypeError, fsum.result, timeout=10)
+
 
 if __name__ == '__main__':
     import unittest
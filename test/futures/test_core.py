@@ -22,6 +22,17 @@ class FutureCoreTest(FutureTestBase):
         self.assertIsInstance(fcoop, FutureBase)
         self.assertIsInstance(fmt, FutureBase)
 
+    def test_slots(self):
+        import concurrent.futures.multithreaded as mt
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        try:
+            for f in (Future(), mt.Future(), asyncio.Future(loop=loop)):
+                self.assertFalse(hasattr(f, '__dict__'), type(f))
+        finally:
+            loop.close()
+
     def test_get_result_when_succeeded(self):
         f = Future()
         self.assertFalse(f.done())
@@ -0,0 +1,71 @@
+from .test_base import FutureTestBase
+from concurrent.futures.cooperative import *
+from concurrent.futures.cooperative.synchronous_executor import Synchronous, Trampolining
+from concurrent.futures.config import Default
+import functools
+
+
+class TrampoliningExecutorTest(FutureTestBase):
+    def test_long_chain(self):
+        f = Future(clb_executor=Trampolining)
+        last = f
+        for _ in range(10000):
+            last = last.map(lambda x: x + 1)
+
+        f.set_result(0)
+        self.assertEqual(10000, last.result())
+
+    def test_long_chain_cancellation_back(self):
+        f = Future(clb_executor=Trampolining)
+        last = f
+        for _ in range(10000):
+            last = last.map(lambda x: x + 1)
+
+        last.cancel()
+        self.assertTrue(f.cancelled())
+
+    def test_same_order_as_synchronous(self):
+        def run(executor):
+            calls = []
+            root = Future(clb_executor=executor)
+
+            def on_done(name, children, _):
+                calls.append(name)
+                for child in children:
+                    child.set_result(None)
+
+            def add(f, name, children=()):
+                f.add_done_callback(functools.partial(on_done, name, children))
+
+            a, b, c = (Future(clb_executor=executor) for _ in range(3))
+            add(root, 'r1', [a])
+            add(root, 'r2', [c])
+            add(a, 'a1', [b])
+            add(a, 'a2')
+            add(b, 'b1')
+            add(c, 'c1')
+            root.set_result(None)
+            return calls
+
+        self.assertListEqual(run(Synchronous), run(Trampolining))
+
+    def test_errors_reported(self):
+        errors = []
+        Default.UNHANDLED_FAILURE_CALLBACK = staticmethod(
+            lambda cls, tb: errors.append(cls))
+
+        def fail(_):
+            raise TypeError()
+
+        f = Future(clb_executor=Trampolining)
+        f.add_done_callback(lambda _: f2.set_result(None))
+        f2 = Future(clb_executor=Trampolining)
+        f2.add_done_callback(fail)
+        f.set_result(None)
+        self.assertListEqual([TypeError], errors)
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()
@@ -0,0 +1,145 @@
+from .test_base import FutureTestBase
+from concurrent.futures.multithreaded import *
+from concurrent.futures.cooperative.synchronous_executor import Synchronous, Trampolining
+import threading
+
+
+class MultithreadedFutureTest(FutureTestBase):
+    def test_no_wait_primitive_when_not_blocking(self):
+        f = Future()
+        f.set_result(1)
+        self.assertTrue(f.wait(0))
+        self.assertEqual(1, f.result(timeout=0))
+        self.assertIsNone(f._waiters)
+
+    def test_wait_timeout_removes_waiter(self):
+        f = Future()
+        self.assertFalse(f.wait(0.001))
+        self.assertRaises(TimeoutError, f.result, timeout=0.001)
+        self.assertListEqual([], f._waiters)
+
+    def test_multiple_waiters(self):
+        f = Future()
+        results = []
+        barrier = threading.Barrier(5)
+
+        def waiter():
+            barrier.wait()
+            results.append(f.result(timeout=10))
+
+        threads = [threading.Thread(target=waiter) for _ in range(4)]
+        for t in threads:
+            t.start()
+        barrier.wait()
+        f.set_result(5)
+        for t in threads:
+            t.join()
+        self.assertListEqual([5] * 4, results)
+        self.assertIsNone(f._waiters)
+
+    def test_cancel_wakes_waiter(self):
+        f = Future()
+        threading.Timer(0.01, f.cancel).start()
+        self.assertTrue(f.wait(10))
+        self.assertRaises(CancelledError, f.result, timeout=10)
+
+    def test_concurrent_completion(self):
+        for _ in range(100):
+            f = Future()
+            wins = []
+
+            def complete(i):
+                if f.try_set_result(i):
+                    wins.append(i)
+
+            threads = [threading.Thread(target=complete, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            self.assertIn(f.result(timeout=10), range(4))
+            for t in threads:
+                t.join()
+            self.assertListEqual([f.result()], wins)
+
+    def test_callback_runs_outside_mutex(self):
+        f = Future(clb_executor=Synchronous)
+        in_callback = threading.Event()
+        release = threading.Event()
+        observed = []
+
+        def slow(fut):
+            in_callback.set()
+            release.wait(10)
+
+        def observe():
+            in_callback.wait(10)
+            observed.append(f.done())
+            f.add_done_callback(lambda fut: observed.append(fut.result()))
+            release.set()
+
+        t = threading.Thread(target=observe)
+        t.start()
+        f.add_done_callback(slow)
+        f.set_result(7)
+        t.join()
+        self.assertTrue(release.is_set())
+        self.assertListEqual([True, 7], observed)
+
+    def test_stress_chaining(self):
+        # Futures are linked in a ring where callbacks of every future
+        # complete the next one and touch the previous one, so callbacks
+        # running under the mutex would acquire locks in opposite orders.
+        threads = 16
+        links = 200
+
+        for _ in range(5):
+            futures = [Future(clb_executor=Trampolining) for _ in range(threads * links)]
+            n = len(futures)
+            for i, fi in enumerate(futures):
+                nxt, prev = futures[(i + 1) % n], futures[i - 1]
+
+                def on_done(fut, nxt=nxt, prev=prev):
+                    prev.done()
+                    prev.add_done_callback(lambda _: None)
+                    nxt.try_set_result(fut.result() + 1)
+
+                fi.add_done_callback(on_done)
+
+            starters = [threading.Thread(target=futures[i * links].try_set_result, args=(0,))
+                        for i in range(threads)]
+            for t in starters:
+                t.start()
+            for t in starters:
+                t.join(10)
+                self.assertFalse(t.is_alive())
+            self.assertTrue(all(f.done() for f in futures))
+            self.assertTrue(any(f.result() == 0 for f in futures))
+
+    def test_stress_map_chains(self):
+        def chain(start):
+            f = Future()
+            fi = f
+            for _ in range(30):
+                fi = fi.map(lambda x: x + 1, executor=Synchronous)
+            self.executor.submit(f.set_result, start)
+            return fi
+
+        results = []
+        lock = threading.Lock()
+
+        def run(i):
+            r = chain(i).result(timeout=10)
+            with lock:
+                results.append(r)
+
+        workers = [threading.Thread(target=run, args=(i,)) for i in range(16)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        self.assertListEqual([i + 30 for i in range(16)], sorted(results))
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()
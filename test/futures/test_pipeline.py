@@ -0,0 +1,110 @@
+from .test_base import FutureTestBase
+from concurrent.futures.multithreaded import *
+
+
+class FuturePipelineTest(FutureTestBase):
+    def test_map(self):
+        f1 = Future()
+        f2 = f1.pipe().map(lambda x: x * x).map(lambda x: x * 2).build()
+
+        f1.set_result(5)
+        self.assertEqual(50, f2.result())
+
+    def test_map_propagates_failure(self):
+        f1 = Future()
+        calls = []
+        f2 = f1.pipe().map(calls.append).build()
+
+        f1.set_exception(TypeError())
+        self.assertRaises(TypeError, f2.result)
+        self.assertListEqual([], calls)
+
+    def test_recover(self):
+        f1 = Future()
+        f2 = f1.pipe() \
+            .map(lambda x: self._raise(TypeError())) \
+            .recover(lambda ex: type(ex)) \
+            .map(lambda x: x.__name__) \
+            .build()
+
+        f1.set_result(5)
+        self.assertEqual('TypeError', f2.result())
+
+    def test_recover_value(self):
+        f1 = Future()
+        f2 = f1.pipe().recover(None).build()
+
+        f1.set_exception(TypeError())
+        self.assertIsNone(f2.result())
+
+    def test_then(self):
+        f1 = Future()
+        f2 = f1.pipe() \
+            .map(lambda x: x * x) \
+            .then(lambda: self.success_after(0.01, 10)) \
+            .map(lambda x: x * 2) \
+            .build()
+
+        f1.set_result(5)
+        self.assertEqual(20, f2.result(timeout=10))
+
+    def test_then_failure(self):
+        f1 = Future()
+        f2 = f1.pipe().then(lambda: Future.failed(IOError())).build()
+
+        f1.set_result(5)
+        self.assertRaises(IOError, f2.result)
+
+    def test_fallback(self):
+        f1 = Future()
+        f2 = f1.pipe() \
+            .fallback(lambda: self.success_after(0.01, 10)) \
+            .fallback(lambda: self._raise(TypeError())) \
+            .build()
+
+        f1.set_exception(IOError())
+        self.assertEqual(10, f2.result(timeout=10))
+
+    def test_cancellation_back(self):
+        f1 = Future()
+        f2 = f1.pipe().map(lambda x: x * x).recover(None).build()
+
+        f2.cancel()
+        self.assertTrue(f1.cancelled())
+
+    def test_cancellation_back_waiting(self):
+        f1 = Future()
+        fmid = Future()
+        f2 = f1.pipe().then(fmid).map(lambda x: x * x).build()
+
+        f1.set_result(5)
+        f2.cancel()
+        self.assertTrue(fmid.cancelled())
+
+    def test_cancellation_forth(self):
+        f1 = Future()
+        f2 = f1.pipe().map(lambda x: x * x).recover(None).build()
+
+        f1.cancel()
+        self.assertTrue(f2.cancelled())
+
+    def test_completed(self):
+        f = Future.successful(5).pipe().map(lambda x: x * x).build()
+        self.assertEqual(25, f.result())
+
+    def test_executor(self):
+        import threading
+
+        f1 = Future()
+        f2 = f1.pipe(executor=self.executor) \
+            .map(lambda _: threading.current_thread()) \
+            .build()
+
+        f1.set_result(None)
+        self.assertIsNot(threading.current_thread(), f2.result(timeout=10))
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()
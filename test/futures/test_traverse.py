@@ -0,0 +1,101 @@
+from .test_base import FutureTestBase
+from concurrent.futures.multithreaded import *
+import itertools
+import threading
+
+
+class FutureTraverseTest(FutureTestBase):
+    def test_ordered(self):
+        f = Future.traverse(range(10), lambda i: self.success_after(0.001 * (10 - i), i),
+                            max_in_flight=3)
+        self.assertListEqual(list(range(10)), f.result(timeout=10))
+
+    def test_unordered(self):
+        f = Future.traverse(range(10), lambda i: self.success_after(0.001, i),
+                            max_in_flight=3, ordered=False)
+        self.assertListEqual(list(range(10)), sorted(f.result(timeout=10)))
+
+    def test_empty(self):
+        f = Future.traverse([], Future.successful, max_in_flight=3)
+        self.assertListEqual([], f.result())
+
+    def test_synchronous_completion(self):
+        f = Future.traverse(range(10000), Future.successful, max_in_flight=2)
+        self.assertListEqual(list(range(10000)), f.result())
+
+    def test_max_in_flight(self):
+        lock = threading.Lock()
+        in_flight = 0
+        observed = 0
+
+        def call(i):
+            nonlocal in_flight, observed
+            with lock:
+                in_flight += 1
+                observed = max(observed, in_flight)
+
+            def done(_):
+                nonlocal in_flight
+                with lock:
+                    in_flight -= 1
+
+            f = self.success_after(0.001, i)
+            f.add_done_callback(done)
+            return f
+
+        f = Future.traverse(range(20), call, max_in_flight=2)
+        self.assertEqual(20, len(f.result(timeout=10)))
+        self.assertLessEqual(observed, 2)
+
+    def test_infinite_stream(self):
+        results = []
+        f = None
+
+        def on_result(r):
+            results.append(r)
+            if len(results) == 100:
+                f.cancel()
+
+        f = Future.traverse(itertools.count(), lambda i: self.success_after(0, i),
+                            max_in_flight=4, on_result=on_result)
+        self.assertRaises(CancelledError, f.result, timeout=10)
+        self.assertListEqual(list(range(100)), results[:100])
+
+    def test_failure(self):
+        pulled = []
+
+        def items():
+            for i in itertools.count():
+                pulled.append(i)
+                yield i
+
+        def call(i):
+            if i == 5:
+                return Future.failed(TypeError())
+            return Future()
+
+        f = Future.traverse(items(), call, max_in_flight=10)
+        self.assertRaises(TypeError, f.result)
+        self.assertEqual(6, len(pulled))
+
+    def test_cancellation_back(self):
+        futures = []
+
+        def call(i):
+            futures.append(Future())
+            return futures[-1]
+
+        f = Future.traverse(itertools.count(), call, max_in_flight=3)
+        f.cancel()
+        self.assertEqual(3, len(futures))
+        self.assertTrue(all(fi.cancelled() for fi in futures))
+
+    def test_function_failure(self):
+        f = Future.traverse(range(10), lambda i: self._raise(TypeError()), max_in_flight=3)
+        self.assertRaises(TypeError, f.result)
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()
@@ -0,0 +1,65 @@
+from .test_base import FutureTestBase
+from concurrent.futures import wait, FIRST_COMPLETED, FIRST_EXCEPTION, ALL_COMPLETED
+from concurrent.futures.multithreaded import *
+
+
+class WaitTest(FutureTestBase):
+    def test_all_completed(self):
+        futures = [self.success_after(0.01, i) for i in range(5)]
+        futures.append(Future.successful(5))
+
+        done, not_done = wait(futures, timeout=10)
+        self.assertSetEqual(set(futures), done)
+        self.assertSetEqual(set(), not_done)
+
+    def test_first_completed(self):
+        f1 = self.success_after(0.01, 1)
+        f2 = Future()
+
+        done, not_done = wait([f1, f2], timeout=10, return_when=FIRST_COMPLETED)
+        self.assertSetEqual({f1}, done)
+        self.assertSetEqual({f2}, not_done)
+
+    def test_first_exception(self):
+        f1 = self.raise_after(0.01, TypeError())
+        f2 = Future()
+
+        done, not_done = wait([f1, f2], timeout=10, return_when=FIRST_EXCEPTION)
+        self.assertSetEqual({f1}, done)
+        self.assertSetEqual({f2}, not_done)
+
+    def test_first_exception_leaves_failure_unhandled(self):
+        f1 = Future()
+        f1.set_exception(TypeError())
+        f2 = self.raise_after(0.01, TypeError())
+
+        wait([f1], timeout=10, return_when=FIRST_EXCEPTION)
+        wait([f2, Future()], timeout=10, return_when=FIRST_EXCEPTION)
+        self.assertIsNotNone(f1._ex_handler)
+        self.assertIsNotNone(f2._ex_handler)
+        self.assertIsInstance(f1.exception(), TypeError)
+        self.assertIsInstance(f2.exception(), TypeError)
+
+    def test_first_exception_all_succeeded(self):
+        futures = [self.success_after(0.01, i) for i in range(5)]
+
+        done, not_done = wait(futures, timeout=10, return_when=FIRST_EXCEPTION)
+        self.assertSetEqual(set(futures), done)
+
+    def test_timeout_detaches_callbacks(self):
+        f1 = Future.successful(1)
+        f2 = Future()
+
+        done, not_done = wait([f1, f2], timeout=0.01)
+        self.assertSetEqual({f1}, done)
+        self.assertSetEqual({f2}, not_done)
+        self.assertIsNone(f2._callback)
+
+    def test_invalid_return_when(self):
+        self.assertRaises(ValueError, wait, [Future()], return_when='NEVER')
+
+
+if __name__ == '__main__':
+    import unittest
+
+    unittest.main()